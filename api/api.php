@@ -9,6 +9,10 @@
  * POST   /api.php?resource=products              - Yeni ürün oluştur
  * PUT    /api.php?resource=products&id=1         - Ürün güncelle
  * DELETE /api.php?resource=products&id=1         - Ürün sil
+ * GET    /api.php?resource=products&ids=1,2,3    - Birden fazla ürünü tek sorguda getir (en fazla 100)
+ * GET    /api.php?resource=products&after_id=500 - Cursor sayfalama: ID'si 500'den küçük sonraki sayfa (after_id=0 ilk sayfa)
+ * GET    /api.php?resource=products&since=2024-01-01 10:00:00 - Bu tarihten sonra değişenler (date_upd)
+ * PUT    /api.php?resource=products              - Toplu güncelle, gövde: {"items": [{"id_product": 1, "price": 9.9, "quantity": 5}]}
  * 
  * Aynı işlemler orders için de geçerli
  */
@@ -21,6 +21,10 @@ class ApiHandler
 
         $this->method = $_SERVER['REQUEST_METHOD'];
         $this->parseRequest();
+        Response::configure(
+            !empty($_GET['compact']),
+            isset($_GET['fields']) ? $_GET['fields'] : null
+        );
         $this->authenticate();
     }
 
@@ -143,6 +147,10 @@ class ApiHandler
 
             case 'PUT':
             case 'PATCH':
+                // ID'siz ve "items" listesi içeren istek toplu güncellemedir
+                if (!$this->id && isset($this->body['items']) && method_exists($manager, 'bulkUpdate')) {
+                    $manager->bulkUpdate($this->body['items']);
+                }
                 if (!$this->id) {
                     Response::error('Güncelleme için ID gerekli', 400);
                 }
@@ -16,6 +16,9 @@ class OrderManager
         $limit = min($limit, 100);
         $offset = ($page - 1) * $limit;
 
+        // Cursor modu: after_id verildiyse OFFSET ve COUNT kullanılmaz
+        $cursor = isset($params['after_id']);
+
         // Filtreleme
         $where = 'WHERE 1=1';
 
@@ -23,6 +26,10 @@ class OrderManager
             $where .= ' AND o.id_customer = ' . (int)$params['customer'];
         }
 
+        if (isset($params['ids'])) {
+            $where .= ' AND o.id_order IN (' . $this->idList($params['ids']) . ')';
+        }
+
         if (isset($params['status'])) {
             $where .= ' AND o.current_state = ' . (int)$params['status'];
         }
@@ -37,12 +44,24 @@ class OrderManager
             $where .= " AND o.date_add <= '" . $dateTo . "'";
         }
 
-        // Toplam sayı
-        $sql = "SELECT COUNT(*) as total
-                FROM " . _DB_PREFIX_ . "orders o
-                $where";
+        // Artımlı senkronizasyon: bu tarihten sonra değişen siparişler
+        if (isset($params['since'])) {
+            $where .= " AND o.date_upd >= '" . pSQL($params['since']) . "'";
+        }
+
+        if ($cursor && (int)$params['after_id'] > 0) {
+            $where .= ' AND o.id_order < ' . (int)$params['after_id'];
+        }
 
-        $total = (int)Db::getInstance()->getValue($sql);
+        // Toplam sayı (cursor modunda atlanır)
+        $total = null;
+        if (!$cursor) {
+            $sql = "SELECT COUNT(*) as total
+                    FROM " . _DB_PREFIX_ . "orders o
+                    $where";
+
+            $total = (int)Db::getInstance()->getValue($sql);
+        }
 
         // Siparişleri getir
         $sql = "SELECT 
@@ -69,16 +88,39 @@ class OrderManager
                 LEFT JOIN " . _DB_PREFIX_ . "order_state os ON o.current_state = os.id_order_state
                 $where
                 ORDER BY o.id_order DESC
-                LIMIT $offset, $limit";
+                " . ($cursor ? "LIMIT " . ($limit + 1) : "LIMIT $offset, $limit");
 
         $orders = Db::getInstance()->executeS($sql);
 
-        // Her sipariş için ürün sayısını ekle
+        // Cursor modunda bir fazla kayıt istenir, sonraki sayfa olup olmadığı buradan anlaşılır
+        $hasMore = $cursor && count($orders) > $limit;
+        if ($hasMore) {
+            array_pop($orders);
+        }
+
+        // Ürün sayılarını sayfa için tek sorguda al (sadece istendiyse)
+        $productCounts = [];
+        if (Response::wantsField('product_count')) {
+            $productCounts = $this->getOrderProductCounts(array_column($orders, 'id_order'));
+        }
+
         foreach ($orders as &$order) {
-            $order['product_count'] = $this->getOrderProductCount($order['id_order']);
+            if ($productCounts) {
+                $order['product_count'] = $productCounts[$order['id_order']];
+            }
             // Basit fiyat formatı (Tools::displayPrice yerine)
             $order['total_paid_formatted'] = number_format((float)$order['total_paid'], 2, ',', '.') . ' ₺';
         }
+        unset($order);
+
+        // Koşullu GET: ETag gönderilecek kayıtlardan (fields= uygulanmış) hesaplanır;
+        // müşteri adı gibi date_upd'yi değiştirmeyen değişiklikler de yeni ETag
+        // üretir. Sayfa değişmediyse gövde gönderilmeden 304 döner
+        Response::conditional([$params, $total, array_map([Response::class, 'onlyFields'], $orders)]);
+
+        if ($cursor) {
+            Response::cursor($orders, $limit, 'id_order', $hasMore, 'Siparişler başarıyla getirildi');
+        }
 
         Response::paginated($orders, $total, $page, $limit, 'Siparişler başarıyla getirildi');
     }
@@ -175,10 +217,15 @@ class OrderManager
             'currency' => [
                 'id_currency' => $order['id_currency'],
             ],
-            'products' => $this->getOrderProducts($id),
+            'products' => Response::wantsField('products') ? $this->getOrderProducts($id) : [],
             'date_add' => $order['date_add'],
             'date_upd' => $order['date_upd'],
         ];
+        $orderData = Response::onlyFields($orderData);
+
+        // Koşullu GET: ETag gönderilecek alanlardan hesaplanır (müşteri, adres
+        // ve ürün satırı değişiklikleri date_upd'yi güncellemeyebilir)
+        Response::conditional($orderData, $order['date_upd']);
 
         Response::success($orderData, 'Sipariş başarıyla getirildi');
     }
@@ -202,8 +249,9 @@ class OrderManager
             Response::error('Sipariş bulunamadı', 404);
         }
 
-        // Sipariş durumunu güncelle
-        if (isset($data['current_state'])) {
+        // Sipariş durumunu güncelle (aynı duruma tekrar geçiş geçmiş kaydı ve
+        // e-postayı çoğaltmasın diye atlanır)
+        if (isset($data['current_state']) && (int)$order->current_state !== (int)$data['current_state']) {
             $newState = (int)$data['current_state'];
             
             // Durum değişikliği için OrderHistory kullan
@@ -228,6 +276,69 @@ class OrderManager
         ], 'Sipariş güncellendi');
     }
 
+    /**
+     * Toplu sipariş durumu güncelle
+     *
+     * Her kayıt OrderHistory ile ayrı ayrı işlenir (e-posta ve hook'lar
+     * tetiklendiği için transaction kullanılmaz); hatalı kayıt raporlanır,
+     * diğerleri işlenmeye devam eder. Zaten hedef durumdaki siparişler
+     * atlanır ('unchanged'), böylece uç nokta idempotenttir.
+     */
+    public function bulkUpdate($items)
+    {
+        if (!is_array($items) || empty($items)) {
+            Response::error('Güncellenecek sipariş listesi boş', 400);
+        }
+
+        if (count($items) > 100) {
+            Response::error('Tek istekte en fazla 100 sipariş güncellenebilir', 400);
+        }
+
+        $results = [];
+        $updated = 0;
+
+        foreach ($items as $item) {
+            $id = isset($item['id_order']) ? (int)$item['id_order'] : 0;
+
+            try {
+                if (!isset($item['current_state'])) {
+                    throw new Exception('current_state gerekli');
+                }
+
+                $order = new Order($id);
+                if (!$id || !Validate::isLoadedObject($order)) {
+                    throw new Exception('Sipariş bulunamadı');
+                }
+
+                // Zaten hedef durumdaysa geçmiş kaydı ve e-posta tekrar
+                // oluşturulmaz; tekrar gönderilen parça zararsız olur
+                if ((int)$order->current_state === (int)$item['current_state']) {
+                    $results[] = ['id_order' => $id, 'success' => true, 'unchanged' => true];
+                    continue;
+                }
+
+                $history = new OrderHistory();
+                $history->id_order = $order->id;
+                $history->changeIdOrderState((int)$item['current_state'], $order, true);
+
+                if (!$history->addWithemail(true)) {
+                    throw new Exception('Sipariş durumu güncellenemedi');
+                }
+
+                $results[] = ['id_order' => $id, 'success' => true];
+                $updated++;
+            } catch (Exception $e) {
+                $results[] = ['id_order' => $id, 'success' => false, 'message' => $e->getMessage()];
+            }
+        }
+
+        Response::success([
+            'updated' => $updated,
+            'failed' => count($results) - $updated,
+            'results' => $results
+        ], 'Toplu güncelleme tamamlandı');
+    }
+
     /**
      * Siparişi sil (dikkatli kullanılmalı!)
      */
@@ -293,15 +404,38 @@ class OrderManager
     }
 
     /**
-     * Siparişteki ürün sayısını getir
+     * Virgülle ayrılmış ID listesini güvenli SQL listesine çevir
      */
-    private function getOrderProductCount($idOrder)
+    private function idList($ids)
     {
-        $sql = "SELECT COUNT(*) 
-                FROM " . _DB_PREFIX_ . "order_detail 
-                WHERE id_order = " . (int)$idOrder;
-        
-        return (int)Db::getInstance()->getValue($sql);
+        $ids = array_unique(array_filter(array_map('intval', explode(',', $ids))));
+
+        return $ids ? implode(',', $ids) : '0';
+    }
+
+    /**
+     * Birden fazla siparişin ürün sayılarını tek sorguda getir
+     *
+     * Dönüş: [id_order => ürün sayısı], satırı olmayan siparişler 0
+     */
+    private function getOrderProductCounts($orderIds)
+    {
+        if (empty($orderIds)) {
+            return [];
+        }
+
+        $counts = array_fill_keys($orderIds, 0);
+
+        $sql = "SELECT id_order, COUNT(*) as product_count
+                FROM " . _DB_PREFIX_ . "order_detail
+                WHERE id_order IN (" . implode(',', array_map('intval', $orderIds)) . ")
+                GROUP BY id_order";
+
+        foreach (Db::getInstance()->executeS($sql) as $row) {
+            $counts[$row['id_order']] = (int)$row['product_count'];
+        }
+
+        return $counts;
     }
 }
 
@@ -16,6 +16,9 @@ class ProductManager
         $limit = min($limit, 100); // Maksimum 100
         $offset = ($page - 1) * $limit;
 
+        // Cursor modu: after_id verildiyse OFFSET ve COUNT kullanılmaz
+        $cursor = isset($params['after_id']);
+
         $idLang = Context::getContext()->language->id;
         $idShop = Context::getContext()->shop->id;
 
@@ -30,19 +33,49 @@ class ProductManager
             $where .= ' AND cp.id_category = ' . (int)$params['category'];
         }
 
+        if (isset($params['ids'])) {
+            $where .= ' AND p.id_product IN (' . $this->idList($params['ids']) . ')';
+        }
+
         if (isset($params['search'])) {
             $searchTerm = pSQL($params['search']);
             $where .= " AND pl.name LIKE '%" . $searchTerm . "%'";
         }
 
-        // Toplam sayı
-        $sql = "SELECT COUNT(DISTINCT p.id_product) as total
-                FROM " . _DB_PREFIX_ . "product p
-                LEFT JOIN " . _DB_PREFIX_ . "category_product cp ON p.id_product = cp.id_product
-                LEFT JOIN " . _DB_PREFIX_ . "product_lang pl ON p.id_product = pl.id_product AND pl.id_lang = $idLang
-                $where";
+        // Artımlı senkronizasyon: bu tarihten sonra değişen ürünler. Stok
+        // değişiklikleri (siparişle düşen stok, panelden stok girişi)
+        // product.date_upd'yi güncellemez; bunlar stok hareketlerinden bulunur.
+        // Değişen ID'ler iki aralık sorgusuyla bir kez toplanır (ürün başına alt
+        // sorgu çalışmaz), ürün sorgusu bu kümeyle birleştirilir
+        $since = isset($params['since']) ? pSQL($params['since']) : null;
+        $join = '';
+        if ($since !== null) {
+            $join = "INNER JOIN (
+                        SELECT id_product FROM " . _DB_PREFIX_ . "product
+                        WHERE date_upd >= '$since'
+                        UNION
+                        SELECT sa.id_product FROM " . _DB_PREFIX_ . "stock_mvt sm
+                        INNER JOIN " . _DB_PREFIX_ . "stock_available sa ON sa.id_stock_available = sm.id_stock
+                        WHERE sm.date_add >= '$since'
+                    ) changed ON changed.id_product = p.id_product";
+        }
 
-        $total = (int)Db::getInstance()->getValue($sql);
+        if ($cursor && (int)$params['after_id'] > 0) {
+            $where .= ' AND p.id_product < ' . (int)$params['after_id'];
+        }
+
+        // Toplam sayı (cursor modunda atlanır)
+        $total = null;
+        if (!$cursor) {
+            $sql = "SELECT COUNT(DISTINCT p.id_product) as total
+                    FROM " . _DB_PREFIX_ . "product p
+                    $join
+                    LEFT JOIN " . _DB_PREFIX_ . "category_product cp ON p.id_product = cp.id_product
+                    LEFT JOIN " . _DB_PREFIX_ . "product_lang pl ON p.id_product = pl.id_product AND pl.id_lang = $idLang
+                    $where";
+
+            $total = (int)Db::getInstance()->getValue($sql);
+        }
 
         // Ürünleri getir
         $sql = "SELECT DISTINCT 
@@ -62,25 +95,58 @@ class ProductManager
                     p.date_add,
                     p.date_upd
                 FROM " . _DB_PREFIX_ . "product p
+                $join
                 LEFT JOIN " . _DB_PREFIX_ . "product_lang pl ON p.id_product = pl.id_product AND pl.id_lang = $idLang
                 LEFT JOIN " . _DB_PREFIX_ . "stock_available sa ON p.id_product = sa.id_product AND sa.id_shop = $idShop
                 LEFT JOIN " . _DB_PREFIX_ . "category_product cp ON p.id_product = cp.id_product
                 LEFT JOIN " . _DB_PREFIX_ . "category_lang cl ON p.id_category_default = cl.id_category AND cl.id_lang = $idLang
                 $where
                 ORDER BY p.id_product DESC
-                LIMIT $offset, $limit";
+                " . ($cursor ? "LIMIT " . ($limit + 1) : "LIMIT $offset, $limit");
 
         $products = Db::getInstance()->executeS($sql);
 
-        // Ürün resimlerini ekle ve HTML temizle
+        // Cursor modunda bir fazla kayıt istenir, sonraki sayfa olup olmadığı buradan anlaşılır
+        $hasMore = $cursor && count($products) > $limit;
+        if ($hasMore) {
+            array_pop($products);
+        }
+
+        // since= ile son stok hareketi zamanı (stock_upd) sadece bu sayfa için alınır
+        if ($since !== null) {
+            $stockUpd = $this->getStockUpdates(array_column($products, 'id_product'));
+            foreach ($products as &$product) {
+                $product['stock_upd'] = isset($stockUpd[$product['id_product']])
+                    ? $stockUpd[$product['id_product']] : null;
+            }
+            unset($product);
+        }
+
+        // Sayfadaki tüm ürünlerin resimlerini tek sorguda al (sadece istendiyse)
+        $withImages = Response::wantsField('images');
+        $images = $withImages ? $this->getProductImages(array_column($products, 'id_product')) : [];
+
+        // Resimleri ekle ve HTML temizle
         foreach ($products as &$product) {
-            $product['images'] = $this->getProductImages($product['id_product']);
+            if ($withImages) {
+                $product['images'] = $images[$product['id_product']];
+            }
             // HTML etiketlerini temizle
             $product['description'] = strip_tags($product['description']);
             $product['description_short'] = strip_tags($product['description_short']);
             // Basit fiyat formatı (Tools::displayPrice yerine)
             $product['price_formatted'] = number_format((float)$product['price'], 2, ',', '.') . ' ₺';
         }
+        unset($product);
+
+        // Koşullu GET: ETag gönderilecek kayıtlardan (fields= uygulanmış) hesaplanır.
+        // Stok, kategori, resim gibi date_upd'yi değiştirmeyen değişiklikler de
+        // yeni ETag üretir; sayfa değişmediyse gövde gönderilmeden 304 döner
+        Response::conditional([$params, $total, array_map([Response::class, 'onlyFields'], $products)]);
+
+        if ($cursor) {
+            Response::cursor($products, $limit, 'id_product', $hasMore, 'Ürünler başarıyla getirildi');
+        }
 
         Response::paginated($products, $total, $page, $limit, 'Ürünler başarıyla getirildi');
     }
@@ -120,7 +186,7 @@ class ProductManager
         if (!$product) {
             Response::error('Ürün bulunamadı', 404);
         }
-        
+
         // Varsayılan vergi oranı %20 (Türkiye KDV)
         $taxRate = 20;
         
@@ -150,10 +216,15 @@ class ProductManager
             'stock_quantity' => $product['stock_quantity'],
             'id_category_default' => $product['id_category_default'],
             'categories' => $categories,
-            'images' => $this->getProductImages($id),
+            'images' => Response::wantsField('images') ? $this->getProductImages([$id])[$id] : [],
             'date_add' => $product['date_add'],
             'date_upd' => $product['date_upd'],
         ];
+        $productData = Response::onlyFields($productData);
+
+        // Koşullu GET: ETag gönderilecek alanlardan hesaplanır (kategori ve
+        // resim değişiklikleri date_upd'yi güncellemez)
+        Response::conditional($productData, $product['date_upd']);
 
         Response::success($productData, 'Ürün başarıyla getirildi');
     }
@@ -248,6 +319,100 @@ class ProductManager
         ], 'Ürün güncellendi');
     }
 
+    /**
+     * Toplu ürün güncelle (fiyat, stok ve basit alanlar)
+     *
+     * Tüm parça tek transaction içinde uygulanır. Her kayıt kendi savepoint'i
+     * ile işlenir; hatalı kayıt geri alınır ve raporlanır, diğerleri işlenmeye
+     * devam eder.
+     */
+    public function bulkUpdate($items)
+    {
+        if (!is_array($items) || empty($items)) {
+            Response::error('Güncellenecek ürün listesi boş', 400);
+        }
+
+        if (count($items) > 500) {
+            Response::error('Tek istekte en fazla 500 ürün güncellenebilir', 400);
+        }
+
+        // Product nesnesi yüklemeden doğrudan güncellenebilen alanlar
+        $columns = [
+            'price' => 'float',
+            'wholesale_price' => 'float',
+            'active' => 'int',
+            'reference' => 'string',
+            'ean13' => 'string',
+        ];
+
+        $db = Db::getInstance();
+        $results = [];
+        $updated = 0;
+
+        $db->execute('START TRANSACTION');
+
+        foreach ($items as $item) {
+            $id = isset($item['id_product']) ? (int)$item['id_product'] : 0;
+            $db->execute('SAVEPOINT bulk_item');
+
+            try {
+                if (!$id || !$db->getValue('SELECT id_product FROM ' . _DB_PREFIX_ . 'product WHERE id_product = ' . $id)) {
+                    throw new Exception('Ürün bulunamadı');
+                }
+
+                $unknown = array_diff(array_keys($item), array_keys($columns), ['id_product', 'quantity']);
+                if ($unknown) {
+                    throw new Exception('Desteklenmeyen alan: ' . implode(', ', $unknown));
+                }
+
+                $set = [];
+                foreach ($columns as $column => $type) {
+                    if (!isset($item[$column])) {
+                        continue;
+                    }
+                    if ($type === 'float') {
+                        $set[] = $column . ' = ' . (float)$item[$column];
+                    } elseif ($type === 'int') {
+                        $set[] = $column . ' = ' . (int)$item[$column];
+                    } else {
+                        $set[] = $column . " = '" . pSQL($item[$column]) . "'";
+                    }
+                }
+
+                // Sadece stok değişse de date_upd güncellenir; since= ile
+                // artımlı senkronizasyon stok değişikliklerini de görür
+                if ($set || isset($item['quantity'])) {
+                    $set[] = 'date_upd = NOW()';
+                    $db->execute('UPDATE ' . _DB_PREFIX_ . 'product SET ' . implode(', ', $set) . ' WHERE id_product = ' . $id);
+
+                    // Mağaza bazlı fiyat/durum tablosu
+                    $shopSet = array_filter($set, function ($part) {
+                        return preg_match('/^(price|wholesale_price|active|date_upd) /', $part);
+                    });
+                    $db->execute('UPDATE ' . _DB_PREFIX_ . 'product_shop SET ' . implode(', ', $shopSet) . ' WHERE id_product = ' . $id);
+                }
+
+                if (isset($item['quantity'])) {
+                    StockAvailable::setQuantity($id, 0, (int)$item['quantity']);
+                }
+
+                $results[] = ['id_product' => $id, 'success' => true];
+                $updated++;
+            } catch (Exception $e) {
+                $db->execute('ROLLBACK TO SAVEPOINT bulk_item');
+                $results[] = ['id_product' => $id, 'success' => false, 'message' => $e->getMessage()];
+            }
+        }
+
+        $db->execute('COMMIT');
+
+        Response::success([
+            'updated' => $updated,
+            'failed' => count($results) - $updated,
+            'results' => $results
+        ], 'Toplu güncelleme tamamlandı');
+    }
+
     /**
      * Ürünü sil
      */
@@ -270,24 +435,66 @@ class ProductManager
     }
 
     /**
-     * Ürün resimlerini getir
+     * Virgülle ayrılmış ID listesini güvenli SQL listesine çevir
+     */
+    private function idList($ids)
+    {
+        $ids = array_unique(array_filter(array_map('intval', explode(',', $ids))));
+
+        return $ids ? implode(',', $ids) : '0';
+    }
+
+    /**
+     * Birden fazla ürünün resimlerini tek sorguda getir
+     *
+     * Dönüş: [id_product => resim listesi], resmi olmayan ürünler boş liste
      */
-    private function getProductImages($idProduct)
+    private function getProductImages($productIds)
     {
-        $images = Image::getImages(Context::getContext()->language->id, $idProduct);
-        $imageData = [];
+        if (empty($productIds)) {
+            return [];
+        }
+
+        $idShop = (int)Context::getContext()->shop->id;
+        $link = Context::getContext()->link;
+        $imageData = array_fill_keys($productIds, []);
 
-        foreach ($images as $image) {
-            $imageObj = new Image($image['id_image']);
-            $imageData[] = [
+        $sql = "SELECT i.id_image, i.id_product, i.position, ims.cover
+                FROM " . _DB_PREFIX_ . "image i
+                INNER JOIN " . _DB_PREFIX_ . "image_shop ims ON i.id_image = ims.id_image AND ims.id_shop = $idShop
+                WHERE i.id_product IN (" . implode(',', array_map('intval', $productIds)) . ")
+                ORDER BY i.id_product, i.position";
+
+        foreach (Db::getInstance()->executeS($sql) as $image) {
+            $imageData[$image['id_product']][] = [
                 'id_image' => $image['id_image'],
                 'position' => $image['position'],
                 'cover' => $image['cover'],
-                'url' => Context::getContext()->link->getImageLink($image['id_product'], $image['id_image'], 'large_default')
+                'url' => $link->getImageLink($image['id_product'], $image['id_image'], 'large_default')
             ];
         }
 
         return $imageData;
     }
+
+    /**
+     * Birden fazla ürünün son stok hareketi zamanını tek sorguda getir
+     *
+     * Dönüş: [id_product => 'Y-m-d H:i:s'], stok hareketi olmayan ürünler yer almaz
+     */
+    private function getStockUpdates($productIds)
+    {
+        if (empty($productIds)) {
+            return [];
+        }
+
+        $sql = "SELECT sa.id_product, MAX(sm.date_add) as stock_upd
+                FROM " . _DB_PREFIX_ . "stock_mvt sm
+                INNER JOIN " . _DB_PREFIX_ . "stock_available sa ON sa.id_stock_available = sm.id_stock
+                WHERE sa.id_product IN (" . implode(',', array_map('intval', $productIds)) . ")
+                GROUP BY sa.id_product";
+
+        return array_column(Db::getInstance()->executeS($sql), 'stock_upd', 'id_product');
+    }
 }
 
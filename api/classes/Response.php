@@ -6,6 +6,47 @@
 
 class Response
 {
+    /**
+     * Kompakt mod: boşluksuz JSON
+     */
+    private static $compact = false;
+
+    /**
+     * İstemcinin istediği alanlar (null = tümü)
+     */
+    private static $fields = null;
+
+    /**
+     * İstemcinin istediği yanıt biçimini ayarla
+     *
+     * $fields virgülle ayrılmış alan listesidir (ör. "id_product,name,price").
+     */
+    public static function configure($compact, $fields = null)
+    {
+        self::$compact = (bool)$compact;
+        self::$fields = $fields ? array_filter(array_map('trim', explode(',', $fields))) : null;
+    }
+
+    /**
+     * Alan istenmiş mi? (alan listesi verilmediyse her alan istenmiş sayılır)
+     */
+    public static function wantsField($field)
+    {
+        return self::$fields === null || in_array($field, self::$fields);
+    }
+
+    /**
+     * Kaydı sadece istenen alanlara indir
+     */
+    public static function onlyFields($row)
+    {
+        if (self::$fields === null) {
+            return $row;
+        }
+
+        return array_intersect_key($row, array_flip(self::$fields));
+    }
+
     /**
      * Başarılı yanıt döndür
      */
@@ -39,28 +80,94 @@ class Response
         if (API_CORS_ENABLED) {
             header('Access-Control-Allow-Origin: *');
             header('Access-Control-Allow-Methods: GET, POST, PUT, DELETE, OPTIONS');
-            header('Access-Control-Allow-Headers: Content-Type, Authorization, X-API-Key');
+            header('Access-Control-Allow-Headers: Content-Type, Authorization, X-API-Key, If-None-Match, If-Modified-Since');
+            header('Access-Control-Expose-Headers: ETag, Last-Modified');
+        }
+
+        // gzip/deflate: ob_gzhandler Accept-Encoding başlığına göre sıkıştırır
+        if (!ini_get('zlib.output_compression') && extension_loaded('zlib')) {
+            ob_start('ob_gzhandler');
         }
 
         header('Content-Type: application/json; charset=utf-8');
         http_response_code($code);
-        echo json_encode($data, JSON_UNESCAPED_UNICODE | JSON_PRETTY_PRINT);
+        $flags = JSON_UNESCAPED_UNICODE | (self::$compact ? 0 : JSON_PRETTY_PRINT);
+        echo json_encode($data, $flags);
         exit;
     }
 
+    /**
+     * Koşullu GET: doğrulayıcıları gönder, istemcideki kopya güncelse 304 döndür
+     *
+     * $parts gönderilecek veridir (fields= uygulanmış kayıtlar, gerekirse sayfa penceresi),
+     * $lastModified ise 'Y-m-d H:i:s' formatında en son güncelleme tarihidir.
+     */
+    public static function conditional($parts, $lastModified = null)
+    {
+        $etag = '"' . md5(json_encode($parts)) . '"';
+
+        header('ETag: ' . $etag);
+        header('Cache-Control: private, no-cache');
+        if ($lastModified) {
+            header('Last-Modified: ' . gmdate('D, d M Y H:i:s', strtotime($lastModified)) . ' GMT');
+        }
+
+        // If-None-Match varsa If-Modified-Since dikkate alınmaz (RFC 7232)
+        if (isset($_SERVER['HTTP_IF_NONE_MATCH'])) {
+            $tags = array_map('trim', explode(',', $_SERVER['HTTP_IF_NONE_MATCH']));
+            $notModified = in_array($etag, $tags) || in_array('*', $tags);
+        } elseif ($lastModified && isset($_SERVER['HTTP_IF_MODIFIED_SINCE'])) {
+            $notModified = strtotime($lastModified) <= strtotime($_SERVER['HTTP_IF_MODIFIED_SINCE']);
+        } else {
+            $notModified = false;
+        }
+
+        if ($notModified) {
+            if (API_CORS_ENABLED) {
+                header('Access-Control-Allow-Origin: *');
+                header('Access-Control-Expose-Headers: ETag, Last-Modified');
+            }
+            http_response_code(304);
+            exit;
+        }
+    }
+
     /**
      * Sayfalama bilgisiyle birlikte yanıt döndür
      */
     public static function paginated($data, $total, $page, $limit, $message = 'İşlem başarılı')
     {
+        // pagination items'tan önce: akış halinde okuyan istemci toplamı hemen görür
         self::success([
-            'items' => $data,
             'pagination' => [
                 'total' => (int)$total,
                 'page' => (int)$page,
                 'limit' => (int)$limit,
                 'pages' => (int)ceil($total / $limit)
-            ]
+            ],
+            'items' => array_map([self::class, 'onlyFields'], $data)
+        ], $message);
+    }
+
+    /**
+     * Cursor (keyset) sayfalama bilgisiyle birlikte yanıt döndür
+     *
+     * Toplam sayı hesaplanmaz; sonraki sayfa after_id=next_after_id ile istenir.
+     * server_time, date_upd ile aynı formatta sunucu saatidir; artımlı
+     * senkronizasyon bir sonraki since= değerini buradan alır.
+     */
+    public static function cursor($data, $limit, $idField, $hasMore, $message = 'İşlem başarılı')
+    {
+        $last = end($data);
+
+        self::success([
+            'pagination' => [
+                'limit' => (int)$limit,
+                'has_more' => (bool)$hasMore,
+                'next_after_id' => $hasMore ? (int)$last[$idField] : null,
+                'server_time' => date('Y-m-d H:i:s')
+            ],
+            'items' => array_map([self::class, 'onlyFields'], $data)
         ], $message);
     }
 }
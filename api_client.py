@@ -4,27 +4,173 @@ PHP API ile iletişim kuran Python modülü
 """
 
 import requests
-from typing import Dict, List, Optional
-import json
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import time
+
+from api_errors import (APIConnectionError, APIError, APITimeoutError,
+                        CircuitOpenError, InvalidResponseError, error_for_status)
+from json_stream import ItemStream
+from resilience import CircuitBreaker, RetryPolicy, parse_retry_after
+from response_cache import ResponseCache
+from metrics import MetricsRegistry
+from single_flight import SingleFlight
+from throttle import AdaptiveConcurrencyLimiter, TokenBucket
+
+
+def _close_stream(future):
+    """Tamamlanan ItemStream future'ının bağlantısını bırakır"""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
 
 
 class PrestaShopAPIClient:
     """PrestaShop API Client sınıfı"""
     
-    def __init__(self, api_url: str, api_key: str):
+    def __init__(self, api_url: str, api_key: str, pool_connections: int = 4,
+                 pool_maxsize: int = 10, pool_block: bool = False,
+                 keep_alive: bool = True, connect_timeout: float = 5,
+                 read_timeout: float = 10, cache_ttl: float = 0,
+                 cache_maxsize: int = 256, conditional_get: bool = True,
+                 validator_maxbytes: int = 2 * 1024 * 1024,
+                 compact: bool = True, single_flight: bool = True,
+                 max_retries: int = 3, backoff_factor: float = 0.5,
+                 max_backoff: float = 10, breaker_threshold: int = 5,
+                 breaker_timeout: float = 30, rate_limit: float = 0,
+                 rate_burst: int = 10, adaptive_concurrency: bool = True,
+                 max_concurrency: Optional[int] = None,
+                 metrics: Optional[MetricsRegistry] = None):
         """
         API Client'ı başlatır
         
         Args:
             api_url: API URL'i
             api_key: API anahtarı
+            pool_connections: Önbellekte tutulacak host havuzu sayısı
+            pool_maxsize: Host başına açık tutulacak maksimum bağlantı
+            pool_block: Havuz doluyken yeni bağlantı açmak yerine bekle
+            keep_alive: Bağlantıları istekler arasında açık tut
+            connect_timeout: Bağlantı kurma zaman aşımı (saniye)
+            read_timeout: Yanıt okuma zaman aşımı (saniye)
+            cache_ttl: GET yanıtlarının önbellekte kalma süresi
+                (saniye, 0 = önbellek kapalı)
+            cache_maxsize: Önbellekte tutulacak maksimum yanıt sayısı
+            conditional_get: ETag'leri saklayıp If-None-Match gönder,
+                304 yanıtında yerel kopyayı kullan
+            validator_maxbytes: ETag ile saklanan yanıt gövdelerinin toplam
+                boyut sınırı (bayt); dolunca en eski kullanılanlar atılır
+            compact: Sunucudan boşluksuz JSON iste (gzip/deflate
+                sıkıştırma Accept-Encoding ile her zaman istenir)
+            single_flight: Aynı anda uçuştaki özdeş GET isteklerini tek
+                HTTP isteğinde birleştir
+            max_retries: Geçici hatalarda (zaman aşımı, bağlantı, 429, 5xx)
+                idempotent isteklerin (GET, PUT) tekrar sayısı (0 = kapalı)
+            backoff_factor: İlk tekrar öncesi bekleme üst sınırı (saniye),
+                her denemede ikiye katlanır, jitter ile rastgeleleştirilir
+            max_backoff: Tekrarlar arası maksimum bekleme (saniye)
+            breaker_threshold: Devre kesiciyi açan ardışık sunucu hatası
+                sayısı (0 = kapalı)
+            breaker_timeout: Devre açıkken isteklerin hemen reddedileceği
+                süre (saniye)
+            rate_limit: Saniyede gönderilecek maksimum istek (0 = sınırsız)
+            rate_burst: Boşta birikebilecek istek hakkı
+            adaptive_concurrency: Uçuştaki istek sayısını sunucu sağlığına
+                göre AIMD ile ayarla
+            max_concurrency: Eşzamanlılık sınırının üst değeri
+                (varsayılan pool_maxsize)
+            metrics: Metriklerin yazılacağı kayıt defteri (verilmezse
+                client'a özel bir tane oluşturulur)
         """
         self.api_url = api_url
         self.api_key = api_key
         self.headers = {
             'X-API-Key': api_key,
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive' if keep_alive else 'close'
         }
+        self.compact = compact
+        self.timeout = (connect_timeout, read_timeout)
+        
+        # Kalıcı oturum: TCP/TLS bağlantıları istekler arasında yeniden kullanılır
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              pool_block=pool_block)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Opsiyonel yanıt önbelleği (sadece GET istekleri)
+        self.cache = ResponseCache(cache_ttl, cache_maxsize) if cache_ttl > 0 else None
+        
+        # Koşullu GET için son görülen (ETag, yanıt) çiftleri; süresizdir,
+        # tazeliği her istekte sunucu doğrular. Önbellek kapalıyken de tutulduğu
+        # için toplam gövde boyutuyla sınırlıdır: tüm katalog taraması gibi çok
+        # sayfalı okumalar belleği büyütmez, sadece son sayfalar saklanır
+        self.validators = (ResponseCache(float('inf'), cache_maxsize, validator_maxbytes)
+                           if conditional_get else None)
+        
+        # Uçuştaki özdeş GET'ler tek istek ve tek parse edilmiş sonucu paylaşır
+        self.inflight = SingleFlight() if single_flight else None
+        
+        # Geçici hatalarda tekrar deneme, sunucu çöktüğünde hızlı hata
+        self.retry = (RetryPolicy(max_retries, backoff_factor, max_backoff)
+                      if max_retries > 0 else None)
+        self.breaker = (CircuitBreaker(breaker_threshold, breaker_timeout)
+                        if breaker_threshold > 0 else None)
+        
+        # Client'ı kullanan tüm thread'ler (GUI, iter_all_*, toplu işler) aynı
+        # hız ve eşzamanlılık sınırını paylaşır
+        self.rate_limiter = TokenBucket(rate_limit, rate_burst) if rate_limit > 0 else None
+        self.concurrency = (AdaptiveConcurrencyLimiter(
+                                initial_limit=min(4, max_concurrency or pool_maxsize),
+                                max_limit=max_concurrency or pool_maxsize)
+                            if adaptive_concurrency else None)
+        
+        # İstek yaşam döngüsü hook'ları; her biri istek bağlamı (dict) ile çağrılır
+        self.hooks: Dict[str, List[Callable[[Dict], None]]] = {
+            'before_send': [],
+            'after_receive': [],
+            'on_error': [],
+        }
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self.metrics.attach(self)
+    
+    def add_hook(self, event: str, hook: Callable[[Dict], None]):
+        """
+        İstek yaşam döngüsüne hook ekler
+        
+        Hook'lar isteği gönderen thread'de çağrılır; hızlı olmalı ve hata
+        fırlatmamalıdır. Bağlam sözlüğü denemeler arasında güncellenir,
+        saklanacaksa kopyalanmalıdır.
+        
+        Args:
+            event: before_send (method, resource, params, attempt),
+                after_receive (+ status, elapsed, bytes_in, bytes_out, decode_time),
+                on_error (+ error)
+            hook: Bağlam sözlüğüyle çağrılacak fonksiyon
+        """
+        if event not in self.hooks:
+            raise ValueError(f"Bilinmeyen hook: {event}")
+        self.hooks[event].append(hook)
+    
+    def _emit(self, event: str, ctx: Dict):
+        for hook in self.hooks[event]:
+            hook(ctx)
+    
+    def close(self):
+        """Havuzdaki tüm bağlantıları kapatır"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def _make_request(self, method: str, resource: str, data: Optional[Dict] = None, 
                      params: Optional[Dict] = None) -> Dict:
@@ -40,61 +186,445 @@ class PrestaShopAPIClient:
         Returns:
             API yanıtı
         """
-        url = f"{self.api_url}?resource={resource}"
+        if method not in ('GET', 'POST', 'PUT', 'DELETE'):
+            raise ValueError(f"Desteklenmeyen HTTP metodu: {method}")
         
-        # Parametreleri ekle
+        # Parametreleri ekle (requests URL kodlamasını kendisi yapar)
+        query = {'resource': resource}
+        if self.compact:
+            query['compact'] = 1
         if params:
-            for key, value in params.items():
-                url += f"&{key}={value}"
+            query.update(params)
+        
+        cache_key = None
+        if method == 'GET':
+            cache_key = ResponseCache.make_key(resource, params)
+            if self.cache is not None:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    self.metrics.record_cache_hit(resource, 'memory')
+                    return cached
+            
+            if self.inflight is not None:
+                return self.inflight.do(
+                    cache_key,
+                    lambda: self._send(method, resource, query, data, params, cache_key)
+                )
+        
+        return self._send(method, resource, query, data, params, cache_key)
+    
+    def _send(self, method: str, resource: str, query: Dict, data: Optional[Dict],
+              params: Optional[Dict], cache_key: Optional[Tuple]) -> Dict:
+        """İsteği gönderir, yanıtı önbelleklere işler"""
+        # Daha önce ETag alınmışsa sunucuya "değişti mi?" diye sor
+        headers = None
+        validated = None
+        if cache_key is not None and self.validators is not None:
+            validated = self.validators.get(cache_key)
+            if validated is not None:
+                headers = {'If-None-Match': validated[0]}
+        
+        # İstek sürerken bir yazma önbelleği geçersiz kılarsa bu yanıt saklanmaz
+        generation = None
+        if cache_key is not None and self.cache is not None:
+            generation = self.cache.generation(resource)
+        
+        response, result = self._attempt(method, resource, query, data, params, headers)
+        
+        if result is None:
+            # Değişmemiş (304): gövde yok, yerel kopya kullanılır
+            if validated is None:
+                raise InvalidResponseError("Geçersiz API yanıtı", status=304)
+            result = validated[1]
+            if self.cache is not None:
+                self.cache.set(cache_key, result, generation)
+            return result
+        
+        if cache_key is not None:
+            etag = response.headers.get('ETag')
+            if etag and self.validators is not None:
+                self.validators.set(cache_key, (etag, result), size=len(response.content))
+            if self.cache is not None:
+                self.cache.set(cache_key, result, generation)
+        else:
+            # Yazma işlemi: ilgili detay ve liste yanıtlarını geçersiz kıl
+            if self.cache is not None:
+                self.cache.invalidate(resource, (params or {}).get('id'))
+            # Yazmadan önce başlamış okumalara yeni çağrılar katılmasın
+            if self.inflight is not None:
+                self.inflight.forget(lambda key: key[0] == resource)
         
+        return result
+    
+    def _attempt(self, method: str, resource: str, query: Dict, data: Optional[Dict],
+                 params: Optional[Dict], headers: Optional[Dict],
+                 stream: bool = False) -> Tuple[requests.Response, Optional[Dict]]:
+        """İsteği geçici hatalarda tekrar deneyerek gönderir (_exchange sonucunu döndürür)"""
+        ctx = {'method': method, 'resource': resource, 'params': params, 'attempt': 0}
+        attempt = 0
+        last_error = None
+        while True:
+            ctx['attempt'] = attempt
+            try:
+                return self._exchange(ctx, query, data, headers, stream)
+            except APIError as e:
+                ctx['error'] = e
+                self._emit('on_error', ctx)
+                if isinstance(e, CircuitOpenError):
+                    # Devre tekrar denemeler sırasında açıldıysa asıl hatayı göster
+                    if last_error is not None:
+                        raise last_error
+                    raise
+                delay = self.retry.delay(method, attempt, e, ctx['resource']) if self.retry is not None else None
+                if delay is None:
+                    raise
+                last_error = e
+                attempt += 1
+                time.sleep(delay)
+    
+    def _exchange(self, ctx: Dict, query: Dict, data: Optional[Dict],
+                  headers: Optional[Dict],
+                  stream: bool = False) -> Tuple[requests.Response, Optional[Dict]]:
+        """
+        Tek bir HTTP denemesi yapar
+        
+        stream=True ise başarılı yanıtın gövdesi okunmaz, JSON yerine
+        ItemStream döner (gövde üzerinde dönüldükçe okunur).
+        
+        Returns:
+            (yanıt, parse edilmiş JSON); 304 yanıtında JSON None
+        
+        Raises:
+            APIError: Hata türüne göre tipli alt sınıfı
+        """
+        method = ctx['method']
+        self._emit('before_send', ctx)
+        
+        if self.breaker is not None:
+            self.breaker.before_request()
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        if self.concurrency is not None:
+            slot = self.concurrency.acquire()
+        
+        started = time.perf_counter()
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=self.headers, timeout=10)
-            elif method == 'POST':
-                response = requests.post(url, headers=self.headers, 
-                                       json=data, timeout=10)
-            elif method == 'PUT':
-                response = requests.put(url, headers=self.headers, 
-                                      json=data, timeout=10)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=self.headers, timeout=10)
+            response = self.session.request(
+                method,
+                self.api_url,
+                params=query,
+                json=data if method in ('POST', 'PUT') else None,
+                headers=headers,
+                timeout=self.timeout,
+                stream=stream
+            )
+        except requests.exceptions.RequestException as e:
+            if self.concurrency is not None:
+                # Zaman aşımı ve bağlantı hataları aşırı yük belirtisidir
+                overloaded = isinstance(e, (requests.exceptions.Timeout,
+                                            requests.exceptions.ConnectionError))
+                self.concurrency.release(slot, overloaded=overloaded, measured=False)
+            if self.breaker is not None:
+                self.breaker.record_failure()
+            if isinstance(e, requests.exceptions.Timeout):
+                raise APITimeoutError("İstek zaman aşımına uğradı")
+            if isinstance(e, requests.exceptions.ConnectionError):
+                raise APIConnectionError("API'ye bağlanılamadı. URL'i kontrol edin.")
+            raise APIError(f"İstek hatası: {str(e)}")
+        
+        status = response.status_code
+        ctx['elapsed'] = time.perf_counter() - started
+        if self.concurrency is not None:
+            self.concurrency.release(slot, overloaded=status == 429 or status >= 500)
+        if self.breaker is not None:
+            if status >= 500:
+                self.breaker.record_failure()
             else:
-                raise ValueError(f"Desteklenmeyen HTTP metodu: {method}")
-            
-            # JSON yanıtı parse et
+                self.breaker.record_success()
+        
+        body = response.request.body or b''
+        ctx.update(status=status, decode_time=None, bytes_out=len(body))
+        
+        if stream and status < 400:
+            # Gövde henüz okunmadı; boyutu sadece başlıktan bilinebilir
+            ctx['bytes_in'] = int(response.headers.get('Content-Length') or 0)
+            self._emit('after_receive', ctx)
+            return response, ItemStream(self._iter_body(response), close=response.close)
+        
+        ctx['bytes_in'] = int(response.headers.get('Content-Length') or len(response.content))
+        if status == 304:
+            self._emit('after_receive', ctx)
+            return response, None
+        
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        
+        # JSON yanıtı parse et
+        try:
+            decode_started = time.perf_counter()
             result = response.json()
-            
-            if response.status_code >= 400:
-                raise Exception(result.get('message', 'API hatası'))
-            
-            return result
-            
+            ctx['decode_time'] = time.perf_counter() - decode_started
+        except ValueError:
+            self._emit('after_receive', ctx)
+            if status >= 400:
+                # PHP fatal error gibi JSON olmayan hata sayfaları
+                raise error_for_status(status, f"API hatası (HTTP {status})", retry_after)
+            raise InvalidResponseError("Geçersiz API yanıtı", status=status)
+        
+        self._emit('after_receive', ctx)
+        if status >= 400:
+            raise error_for_status(status, result.get('message', 'API hatası'), retry_after)
+        
+        return response, result
+    
+    @staticmethod
+    def _iter_body(response: requests.Response) -> Iterator[bytes]:
+        """Yanıt gövdesini parça parça okur, ağ hatalarını tipli hatalara çevirir"""
+        try:
+            yield from response.iter_content(chunk_size=64 * 1024)
         except requests.exceptions.Timeout:
-            raise Exception("İstek zaman aşımına uğradı")
-        except requests.exceptions.ConnectionError:
-            raise Exception("API'ye bağlanılamadı. URL'i kontrol edin.")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"İstek hatası: {str(e)}")
-        except json.JSONDecodeError:
-            raise Exception("Geçersiz API yanıtı")
+            raise APITimeoutError("Yanıt okunurken zaman aşımı")
+        except requests.exceptions.RequestException:
+            raise APIConnectionError("Yanıt okunurken bağlantı koptu")
+    
+    def _stream_request(self, resource: str, params: Optional[Dict] = None) -> ItemStream:
+        """
+        Liste isteğini gönderir, yanıtı akış halinde döndürür
+        
+        Önbellek, ETag ve istek birleştirme kullanılmaz (gövde saklanmaz).
+        Tekrar deneme sadece yanıt başlıkları gelene kadar geçerlidir.
+        """
+        query = {'resource': resource}
+        if self.compact:
+            query['compact'] = 1
+        if params:
+            query.update(params)
+        return self._attempt('GET', resource, query, None, params, None, stream=True)[1]
+    
+    def _iter_pages(self, fetch_page: Callable[..., Dict], limit: int,
+                    workers: int, prefetch: int, **filters) -> Iterator[Dict]:
+        """
+        Sayfalı bir listenin tüm kayıtlarını sırayla döndürür
+        
+        İlk sayfadan toplam sayfa sayısı okunur, kalan sayfalar bir thread
+        havuzunda en fazla `prefetch` sayfa önden olacak şekilde çekilir.
+        Bellekte aynı anda en fazla `prefetch` sayfa tutulur.
+        
+        Args:
+            fetch_page: Tek sayfa getiren metod (get_products, get_orders)
+            limit: Sayfa başına kayıt (API en fazla 100 kabul eder)
+            workers: Paralel istek sayısı
+            prefetch: Önden çekilecek maksimum sayfa sayısı
+            filters: fetch_page'e aynen iletilen filtreler
+        """
+        first = fetch_page(page=1, limit=limit, **filters)
+        pages = first['data']['pagination']['pages']
+        yield from first['data']['items']
+        
+        if pages <= 1:
+            return
+        
+        prefetch = max(prefetch, workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            next_page = 2
+            try:
+                while next_page <= pages and len(pending) < prefetch:
+                    pending.append(pool.submit(fetch_page, page=next_page,
+                                               limit=limit, **filters))
+                    next_page += 1
+                
+                while pending:
+                    result = pending.popleft().result()
+                    if next_page <= pages:
+                        pending.append(pool.submit(fetch_page, page=next_page,
+                                                   limit=limit, **filters))
+                        next_page += 1
+                    yield from result['data']['items']
+            finally:
+                # Generator erken kapatılırsa bekleyen istekleri iptal et
+                for future in pending:
+                    future.cancel()
+    
+    def _iter_cursor(self, fetch_page: Callable[..., Dict], limit: int,
+                     stream: bool = False, **filters) -> Iterator[Dict]:
+        """
+        Cursor (after_id) sayfalamasıyla tüm kayıtları sırayla döndürür
+        
+        Toplam sayı hesaplanmadığı ve OFFSET kullanılmadığı için her sayfanın
+        maliyeti derinlikten bağımsızdır. Sayfalar sıralı olmak zorundadır;
+        bir sonraki sayfa, mevcut sayfa işlenirken arka planda çekilir.
+        stream=True ise sayfalar ItemStream olarak okunur; sonraki sayfanın
+        cursor'ı yanıtın başındaki sayfalama bloğundan alınır.
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(fetch_page, limit=limit, after_id=0, stream=stream,
+                                 **filters)
+            result = None
+            try:
+                while future is not None:
+                    result = future.result()
+                    pagination = result.pagination if stream else result['data']['pagination']
+                    future = None
+                    if pagination['has_more']:
+                        future = pool.submit(fetch_page, limit=limit,
+                                             after_id=pagination['next_after_id'],
+                                             stream=stream, **filters)
+                    yield from result if stream else result['data']['items']
+            finally:
+                if stream and result is not None:
+                    result.close()
+                if future is not None:
+                    future.cancel()
+                    if stream:
+                        # Önden istenmiş sayfanın bağlantısı da bırakılsın
+                        future.add_done_callback(_close_stream)
+    
+    def _get_by_ids(self, fetch_page: Callable[..., Dict], id_field: str,
+                    ids: Iterable[int], chunk_size: int, workers: int,
+                    fields: Optional[List[str]]) -> List[Dict]:
+        """
+        ID listesini parçalara bölüp her parçayı tek istekle getirir
+        
+        Parçalar paralel çekilir; sonuç verilen ID sırasıyla döner, bulunamayan
+        ID'ler atlanır.
+        """
+        ids = list(dict.fromkeys(int(i) for i in ids))
+        if not ids:
+            return []
+        
+        chunk_size = min(chunk_size, 100)  # API sayfa sınırı
+        chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        if fields and id_field not in fields:
+            fields = [id_field] + list(fields)
+        
+        def fetch(chunk):
+            result = fetch_page(page=1, limit=len(chunk), fields=fields,
+                                ids=','.join(map(str, chunk)))
+            return result['data']['items']
+        
+        found = {}
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            for items in pool.map(fetch, chunks):
+                for item in items:
+                    found[int(item[id_field])] = item
+        
+        return [found[i] for i in ids if i in found]
+    
+    def _bulk_update(self, resource: str, id_field: str, items: Iterable[Dict],
+                     chunk_size: int, workers: int,
+                     progress: Optional[Callable[[List[Dict]], None]]) -> List[Dict]:
+        """Kayıtları parça başına bir toplu PUT isteğiyle gönderir (sonuçlar girdi sırasıyla)"""
+        iterator = iter(items)
+        workers = max(1, workers)
+        # İdempotent olmayan parçalar (sipariş durumu) zaman aşımında tekrar
+        # gönderilmez; sunucu parçayı işlemiş olabileceği için sonuç bilinmiyor
+        # olarak raporlanır. Ürün parçaları değerleri aynen yazar, normal
+        # tekrar denemeden sonra hâlâ hata varsa sıradan hata olarak döner.
+        idempotent = self.retry is None or ('PUT', resource) not in self.retry.non_idempotent
+        
+        def next_chunk():
+            return list(islice(iterator, chunk_size))
+        
+        def send(chunk):
+            try:
+                result = self._make_request('PUT', resource, data={'items': chunk})
+                return result['data']['results']
+            except (APITimeoutError, APIConnectionError) as e:
+                if idempotent:
+                    return [{id_field: item[id_field], 'success': False,
+                             'message': str(e)} for item in chunk]
+                return [{id_field: item[id_field], 'success': False, 'unknown': True,
+                         'message': f"Sonuç bilinmiyor ({e}), durumu kontrol edin"}
+                        for item in chunk]
+            except Exception as e:
+                return [{id_field: item[id_field], 'success': False,
+                         'message': str(e)} for item in chunk]
+        
+        results = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            chunk = next_chunk()
+            while chunk or pending:
+                while chunk and len(pending) < workers:
+                    pending.append(pool.submit(send, chunk))
+                    chunk = next_chunk()
+                done = pending.popleft().result()
+                results.extend(done)
+                if progress is not None:
+                    progress(done)
+        
+        return results
     
     # ============= ÜRÜN İŞLEMLERİ =============
     
     def get_products(self, page: int = 1, limit: int = 50, 
-                    search: str = None, active: int = None) -> Dict:
-        """Ürün listesini getirir"""
+                    search: str = None, active: int = None,
+                    fields: Optional[List[str]] = None, ids: str = None,
+                    after_id: int = None, since: str = None,
+                    stream: bool = False) -> Union[Dict, ItemStream]:
+        """
+        Ürün listesini getirir
+        
+        fields verilirse sadece bu alanlar istenir. after_id verilirse cursor
+        modu kullanılır: page yok sayılır, toplam sayı hesaplanmaz ve
+        pagination içinde has_more / next_after_id döner (0 = ilk sayfa).
+        since ('YYYY-MM-DD HH:MM:SS') verilirse sadece date_upd değeri bu
+        tarih veya sonrası olan kayıtlar döner. stream=True ise yanıt yerine
+        ItemStream döner: kayıtlar gövde indikçe tek tek çözülür, sayfalama
+        bilgisi `pagination` özelliğindedir.
+        """
         params = {'page': page, 'limit': limit}
         
+        if since:
+            params['since'] = since
+        if after_id is not None:
+            params['after_id'] = after_id
+        if ids:
+            params['ids'] = ids
         if search:
             params['search'] = search
         if active is not None:
             params['active'] = active
+        if fields:
+            params['fields'] = ','.join(fields)
         
+        if stream:
+            return self._stream_request('products', params)
         return self._make_request('GET', 'products', params=params)
     
-    def get_product(self, product_id: int) -> Dict:
+    def iter_all_products(self, limit: int = 100, workers: int = 4,
+                          prefetch: int = 8, search: str = None,
+                          active: int = None, fields: Optional[List[str]] = None,
+                          cursor: bool = False, since: str = None,
+                          stream: bool = False) -> Iterator[Dict]:
+        """
+        Tüm ürünleri sırayla döndürür
+        
+        Varsayılan olarak sayfalar paralel çekilir. cursor=True ile sıralı
+        cursor sayfalaması kullanılır; derin sayfalar da ilk sayfa kadar ucuzdur.
+        stream=True (sadece cursor ile) sayfaları akış halinde çözer; bellekte
+        tam sayfa yanıtı tutulmaz.
+        """
+        if cursor:
+            return self._iter_cursor(self.get_products, limit, stream, search=search,
+                                     active=active, fields=fields, since=since)
+        return self._iter_pages(self.get_products, limit, workers, prefetch,
+                                search=search, active=active, fields=fields,
+                                since=since)
+    
+    def get_product(self, product_id: int, fields: Optional[List[str]] = None) -> Dict:
         """Tek bir ürünü getirir"""
-        return self._make_request('GET', 'products', params={'id': product_id})
+        params = {'id': product_id}
+        if fields:
+            params['fields'] = ','.join(fields)
+        return self._make_request('GET', 'products', params=params)
+    
+    def get_products_by_ids(self, product_ids: Iterable[int], chunk_size: int = 100,
+                            workers: int = 4,
+                            fields: Optional[List[str]] = None) -> List[Dict]:
+        """Birden fazla ürünü parça başına tek istekle getirir"""
+        return self._get_by_ids(self.get_products, 'id_product', product_ids,
+                                chunk_size, workers, fields)
     
     def create_product(self, product_data: Dict) -> Dict:
         """Yeni ürün oluşturur"""
@@ -105,6 +635,31 @@ class PrestaShopAPIClient:
         return self._make_request('PUT', 'products', data=product_data, 
                                  params={'id': product_id})
     
+    def update_products_bulk(self, updates: Iterable[Tuple[int, Dict]],
+                             chunk_size: int = 200, workers: int = 1,
+                             progress: Optional[Callable[[List[Dict]], None]] = None
+                             ) -> List[Dict]:
+        """
+        Ürünleri parçalar halinde toplu günceller
+        
+        Girdi tembel okunur; bellekte en fazla `workers` parça tutulur. Her parça
+        sunucuda tek transaction içinde uygulanır. Hatalı kayıtlar (veya
+        gönderilemeyen parçalar) işlemi durdurmaz, sonuç listesinde raporlanır.
+        
+        Args:
+            updates: (ürün ID, alanlar) çiftleri; alanlar price,
+                wholesale_price, quantity, active, reference, ean13 olabilir
+            chunk_size: İstek başına ürün sayısı (en fazla 500)
+            workers: Aynı anda gönderilecek parça sayısı
+            progress: Her parça bittiğinde o parçanın sonuçlarıyla çağrılır
+            
+        Returns:
+            Her ürün için {'id_product', 'success', 'message'} sonuçları
+        """
+        items = (dict(fields, id_product=int(product_id)) for product_id, fields in updates)
+        return self._bulk_update('products', 'id_product', items, min(chunk_size, 500),
+                                 workers, progress)
+    
     def delete_product(self, product_id: int) -> Dict:
         """Ürünü siler"""
         return self._make_request('DELETE', 'products', params={'id': product_id})
@@ -112,20 +667,60 @@ class PrestaShopAPIClient:
     # ============= SİPARİŞ İŞLEMLERİ =============
     
     def get_orders(self, page: int = 1, limit: int = 50, 
-                  status: int = None, customer: int = None) -> Dict:
-        """Sipariş listesini getirir"""
+                  status: int = None, customer: int = None,
+                  fields: Optional[List[str]] = None, ids: str = None,
+                  after_id: int = None, since: str = None,
+                  stream: bool = False) -> Union[Dict, ItemStream]:
+        """
+        Sipariş listesini getirir
+        
+        fields, after_id, since ve stream parametreleri get_products ile aynıdır.
+        """
         params = {'page': page, 'limit': limit}
         
+        if since:
+            params['since'] = since
+        if after_id is not None:
+            params['after_id'] = after_id
+        if ids:
+            params['ids'] = ids
         if status is not None:
             params['status'] = status
         if customer is not None:
             params['customer'] = customer
+        if fields:
+            params['fields'] = ','.join(fields)
         
+        if stream:
+            return self._stream_request('orders', params)
         return self._make_request('GET', 'orders', params=params)
     
-    def get_order(self, order_id: int) -> Dict:
+    def iter_all_orders(self, limit: int = 100, workers: int = 4,
+                        prefetch: int = 8, status: int = None,
+                        customer: int = None, fields: Optional[List[str]] = None,
+                        cursor: bool = False, since: str = None,
+                        stream: bool = False) -> Iterator[Dict]:
+        """Tüm siparişleri sırayla döndürür (cursor, stream: iter_all_products ile aynı)"""
+        if cursor:
+            return self._iter_cursor(self.get_orders, limit, stream, status=status,
+                                     customer=customer, fields=fields, since=since)
+        return self._iter_pages(self.get_orders, limit, workers, prefetch,
+                                status=status, customer=customer, fields=fields,
+                                since=since)
+    
+    def get_order(self, order_id: int, fields: Optional[List[str]] = None) -> Dict:
         """Tek bir siparişi getirir"""
-        return self._make_request('GET', 'orders', params={'id': order_id})
+        params = {'id': order_id}
+        if fields:
+            params['fields'] = ','.join(fields)
+        return self._make_request('GET', 'orders', params=params)
+    
+    def get_orders_by_ids(self, order_ids: Iterable[int], chunk_size: int = 100,
+                          workers: int = 4,
+                          fields: Optional[List[str]] = None) -> List[Dict]:
+        """Birden fazla siparişi parça başına tek istekle getirir"""
+        return self._get_by_ids(self.get_orders, 'id_order', order_ids,
+                                chunk_size, workers, fields)
     
     def update_order_status(self, order_id: int, new_status: int) -> Dict:
         """Sipariş durumunu günceller"""
@@ -133,6 +728,38 @@ class PrestaShopAPIClient:
                                  data={'current_state': new_status},
                                  params={'id': order_id})
     
+    def update_orders_status_bulk(self, order_ids: Iterable[int], new_status: int,
+                                  chunk_size: int = 10, workers: int = 4,
+                                  progress: Optional[Callable[[List[Dict]], None]] = None
+                                  ) -> List[Dict]:
+        """
+        Siparişlerin durumunu parçalar halinde toplu günceller
+        
+        Sunucu her siparişi ayrı ayrı işler (durum geçmişi ve e-postalar tek
+        tek oluşur); parçalar `workers` istekle paralel gönderilir.
+        update_products_bulk ile aynı şekilde hatalar sonuçta raporlanır.
+        Zaten hedef durumdaki siparişler 'unchanged' ile döner. Zaman aşımına
+        uğrayan parça tekrar gönderilmez (sunucu işlemiş olabilir); siparişleri
+        'unknown' ile işaretlenir.
+        
+        Args:
+            order_ids: Sipariş ID'leri
+            new_status: Yeni durum ID
+            chunk_size: İstek başına sipariş sayısı (en fazla 100). Sunucu
+                sipariş başına e-posta gönderdiği için büyük parçalar okuma
+                zaman aşımını aşabilir ve sonuçları bilinmiyor olarak döner
+            workers: Aynı anda gönderilecek parça sayısı
+            progress: Her parça bittiğinde o parçanın sonuçlarıyla çağrılır
+            
+        Returns:
+            Her sipariş için {'id_order', 'success', 'message', 'unchanged',
+            'unknown'} sonuçları (son üçü sadece gerektiğinde)
+        """
+        items = ({'id_order': int(order_id), 'current_state': int(new_status)}
+                 for order_id in order_ids)
+        return self._bulk_update('orders', 'id_order', items, min(chunk_size, 100),
+                                 workers, progress)
+    
     def delete_order(self, order_id: int) -> Dict:
         """Siparişi siler"""
         return self._make_request('DELETE', 'orders', params={'id': order_id})
@@ -0,0 +1,76 @@
+"""
+API Hata Tipleri
+Çağıranların hata türünü mesaj metnine bakmadan ayırt edebilmesi için
+"""
+
+from typing import Optional
+
+
+class APIError(Exception):
+    """API isteği başarısız oldu
+
+    Tüm tipli hatalar bundan türer; `except Exception` ile yakalayan eski
+    kod aynen çalışmaya devam eder ve mesajlar değişmemiştir.
+    """
+
+    # Aynı istek tekrar denenirse başarılı olabilir mi?
+    retryable = False
+
+    def __init__(self, message: str, status: Optional[int] = None,
+                 retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+        self.retry_after = retry_after
+
+
+class APITimeoutError(APIError):
+    """İstek zaman aşımına uğradı"""
+    retryable = True
+
+
+class APIConnectionError(APIError):
+    """Sunucuya bağlanılamadı"""
+    retryable = True
+
+
+class InvalidResponseError(APIError):
+    """Yanıt geçerli JSON değil"""
+
+
+class AuthenticationError(APIError):
+    """API anahtarı geçersiz veya yetki yok (401/403)"""
+
+
+class NotFoundError(APIError):
+    """Kayıt bulunamadı (404)"""
+
+
+class RateLimitError(APIError):
+    """Çok fazla istek (429)"""
+    retryable = True
+
+
+class ServerError(APIError):
+    """Sunucu hatası (5xx)"""
+    retryable = True
+
+
+class CircuitOpenError(APIError):
+    """Devre kesici açık: sunucu son isteklerde yanıt vermedi, istek gönderilmedi"""
+
+
+def error_for_status(status: int, message: str,
+                     retry_after: Optional[float] = None) -> APIError:
+    """HTTP durum koduna uygun hata nesnesini oluşturur"""
+    if status in (401, 403):
+        cls = AuthenticationError
+    elif status == 404:
+        cls = NotFoundError
+    elif status == 429:
+        cls = RateLimitError
+    elif status >= 500:
+        cls = ServerError
+    else:
+        cls = APIError
+    return cls(message, status=status, retry_after=retry_after)
@@ -4,12 +4,17 @@ Tkinter ile geliştirilmiş modern GUI uygulaması
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, filedialog
 import os
 from dotenv import load_dotenv
 from api_client import PrestaShopAPIClient
+from exporter import export_orders, export_products
+from models import Order, OrderLine, Product, order_row_values, product_row_values
+from search_index import ProductSearchIndex
+from ui_dispatch import UIDispatcher
+from virtual_table import VirtualTable
 from datetime import datetime
-import threading
+from itertools import takewhile
 
 # .env dosyasını yükle
 load_dotenv('config.env')
@@ -27,6 +32,27 @@ COLORS = {
     'border': '#e0e0e0'
 }
 
+# Tablolarda gösterilen alanlar (API'den sadece bunlar istenir)
+PRODUCT_LIST_FIELDS = ['id_product', 'name', 'price', 'stock_quantity', 'active']
+ORDER_LIST_FIELDS = ['id_order', 'reference', 'customer_name', 'total_paid',
+                     'status_name', 'date_add']
+
+# Yerel arama indeksi için çekilen alanlar
+SEARCH_INDEX_FIELDS = PRODUCT_LIST_FIELDS + ['reference', 'ean13']
+
+# Yazarken yapılan yerel aramada gösterilen en fazla sonuç; kısa önekler
+# tüm kataloğu toplamaz, tam liste Ara/Enter ile alınır
+LIVE_SEARCH_LIMIT = 500
+
+# Sanal tabloların API'den tek seferde istediği kayıt sayısı (API sınırı 100)
+TABLE_PAGE_SIZE = 100
+
+# Toplu sipariş durumu: istek başına sipariş ve aynı anda gönderilen istek.
+# Sunucu her sipariş için e-posta gönderdiğinden parçalar küçük tutulur;
+# 10 sipariş okuma zaman aşımının (10 sn) rahatça içinde biter
+ORDER_STATUS_CHUNK = 10
+ORDER_STATUS_WORKERS = 4
+
 
 class ModernButton(tk.Button):
     """Modern stil buton"""
@@ -78,7 +104,15 @@ class PrestaShopApp:
             self.root.destroy()
             return
         
-        self.api = PrestaShopAPIClient(api_url, api_key)
+        # Tekrarlanan okuma isteklerini kısa süreliğine önbellekte tut
+        cache_ttl = float(os.getenv('API_CACHE_TTL', '30'))
+        self.api = PrestaShopAPIClient(api_url, api_key, cache_ttl=cache_ttl)
+        
+        # Yerel ürün arama indeksi (bağlantı testinden sonra arka planda doldurulur)
+        self.search_index = ProductSearchIndex()
+        
+        # Arka plan işleri sınırlı havuzda çalışır, Tk'ye sadece ana thread dokunur
+        self.dispatcher = UIDispatcher(self.root)
         
         # UI oluştur
         self.create_ui()
@@ -88,12 +122,13 @@ class PrestaShopApp:
     
     def test_api_connection(self):
         """API bağlantısını test eder"""
-        def test():
-            if self.api.test_connection():
+        def done(connected):
+            if connected:
                 self.status_label.config(
                     text="✓ API Bağlantısı Başarılı", 
                     fg=COLORS['success']
                 )
+                self.build_search_index()
             else:
                 self.status_label.config(
                     text="✗ API Bağlantısı Başarısız", 
@@ -104,7 +139,18 @@ class PrestaShopApp:
                     "API'ye bağlanılamadı!\nconfig.env dosyasını kontrol edin."
                 )
         
-        threading.Thread(target=test, daemon=True).start()
+        self.dispatcher.submit(self.api.test_connection, on_success=done)
+    
+    def build_search_index(self):
+        """Yerel arama indeksini tüm ürünlerle arka planda oluşturur"""
+        def build():
+            products = self.api.iter_all_products(cursor=True, stream=True,
+                                                   fields=SEARCH_INDEX_FIELDS)
+            # Uygulama kapanırsa taramayı yarıda bırak
+            self.search_index.build(takewhile(lambda _: not self.dispatcher.closed, products))
+        
+        # İndeks oluşturulamazsa arama sunucu üzerinden yapılmaya devam eder
+        self.dispatcher.submit(build, key='search_index')
     
     def create_ui(self):
         """Ana kullanıcı arayüzünü oluşturur"""
@@ -230,6 +276,13 @@ class PrestaShopApp:
             color='success'
         ).pack(side='left', padx=5)
         
+        ModernButton(
+            btn_frame,
+            "📤 Dışa Aktar",
+            command=lambda: self.export_data('products'),
+            color='primary'
+        ).pack(side='left', padx=5)
+        
         # Arama çubuğu
         search_frame = tk.Frame(self.main_content, bg=COLORS['white'])
         search_frame.pack(fill='x', padx=20, pady=(0, 10))
@@ -250,32 +303,37 @@ class PrestaShopApp:
         )
         search_entry.pack(side='left', padx=(0, 10))
         
+        # İndeks hazırsa yazarken yerel arama yapılır; Enter'ın bırakılması
+        # tam sonuç listesini sınırlı listeyle değiştirmesin
+        search_entry.bind('<KeyRelease>', lambda e: e.keysym == 'Return'
+                          or self.search_products(live=True))
+        search_entry.bind('<Return>', lambda e: self.search_products())
+        
         ModernButton(
             search_frame,
             "Ara",
-            command=lambda: self.load_products(search=self.product_search_var.get()),
+            command=self.search_products,
             color='primary'
         ).pack(side='left')
         
-        # Tablo çerçevesi
-        table_frame = tk.Frame(self.main_content, bg=COLORS['white'])
-        table_frame.pack(fill='both', expand=True, padx=20, pady=(0, 20))
-        
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(table_frame)
-        scrollbar.pack(side='right', fill='y')
-        
-        # Treeview
+        # Sanal tablo: sadece görünen satırlar Tk'de tutulur, sayfalar kaydırdıkça yüklenir
         columns = ('ID', 'Ürün Adı', 'Fiyat', 'Stok', 'Durum')
-        self.products_tree = ttk.Treeview(
-            table_frame,
-            columns=columns,
-            show='tree headings',
-            yscrollcommand=scrollbar.set,
-            height=20
+        self.products_table = VirtualTable(
+            self.main_content,
+            columns,
+            row_values=product_row_values,
+            page_size=TABLE_PAGE_SIZE,
+            on_load=lambda total: self.status_label.config(
+                text=f"✓ {total} ürün bulundu", fg=COLORS['success']
+            ),
+            on_error=lambda e: self.show_load_error("Ürünler", e),
+            height=20,
+            dispatcher=self.dispatcher,
+            bg=COLORS['white']
         )
-        
-        scrollbar.config(command=self.products_tree.yview)
+        self.create_pager(self.products_table)
+        self.products_table.pack(fill='both', expand=True, padx=20, pady=(0, 10))
+        self.products_tree = self.products_table.tree
         
         # Sütun ayarları
         self.products_tree.column('#0', width=0, stretch=False)
@@ -289,8 +347,6 @@ class PrestaShopApp:
         for col in columns:
             self.products_tree.heading(col, text=col, anchor='center')
         
-        self.products_tree.pack(fill='both', expand=True)
-        
         # Sağ tık menüsü
         self.create_product_context_menu()
         
@@ -315,52 +371,115 @@ class PrestaShopApp:
             self.products_tree.selection_set(item)
             self.product_menu.post(event.x_root, event.y_root)
     
+    def show_load_error(self, what, error):
+        """Tablo yükleme hatasını gösterir"""
+        messagebox.showerror("Hata", f"{what} yüklenirken hata: {str(error)}")
+        self.status_label.config(text=f"✗ Hata: {str(error)}", fg=COLORS['danger'])
+    
+    def export_data(self, resource):
+        """Ürünleri veya siparişleri (satırlarıyla) dosyaya aktarır"""
+        path = filedialog.asksaveasfilename(
+            title="Dışa Aktar",
+            initialfile=f"{resource}.csv",
+            defaultextension='.csv',
+            filetypes=[('CSV', '*.csv'), ('NDJSON', '*.ndjson'), ('Parquet', '*.parquet')]
+        )
+        if not path:
+            return
+        
+        what = "ürün" if resource == 'products' else "sipariş"
+        export = export_products if resource == 'products' else export_orders
+        
+        def progress(rows):
+            # Worker thread'den çağrılır, etiket ana thread'de güncellenir
+            self.dispatcher.call(lambda: self.status_label.config(
+                text=f"Dışa aktarılıyor... {rows} {what}", fg=COLORS['text_light']
+            ))
+        
+        def done(stats):
+            self.status_label.config(
+                text=f"✓ {stats['rows']} {what} dışa aktarıldı ({stats['seconds']:.0f} sn)",
+                fg=COLORS['success']
+            )
+            messagebox.showinfo("Dışa Aktarma", "Oluşturulan dosyalar:\n" + "\n".join(stats['files']))
+        
+        self.status_label.config(text="Dışa aktarılıyor...", fg=COLORS['text_light'])
+        self.dispatcher.submit(
+            export, self.api, path,
+            progress=progress,
+            on_success=done,
+            on_error=lambda e: messagebox.showerror("Hata", f"Dışa aktarma başarısız: {str(e)}")
+        )
+    
+    def create_pager(self, table):
+        """Tablonun altına önceki/sonraki sayfa çubuğu ekler
+
+        Komşu sayfalar tablo tarafından önden yüklendiği için geçişler
+        önbellekten yapılır. Tablodan önce çağrılmalı (alta sabitlenir).
+        """
+        pager = tk.Frame(self.main_content, bg=COLORS['white'])
+        pager.pack(side='bottom', fill='x', padx=20, pady=(0, 20))
+        
+        prev_button = ModernButton(pager, "◀ Önceki", command=table.prev_page, color='primary')
+        prev_button.pack(side='left')
+        
+        next_button = ModernButton(pager, "Sonraki ▶", command=table.next_page, color='primary')
+        next_button.pack(side='right')
+        
+        page_label = tk.Label(pager, font=('Segoe UI', 10), bg=COLORS['white'],
+                              fg=COLORS['text'])
+        page_label.pack(side='left', expand=True)
+        
+        def update(page, page_count):
+            page_label.config(text=f"Sayfa {page} / {page_count}")
+            prev_button.config(state='normal' if page > 1 else 'disabled')
+            next_button.config(state='normal' if page < page_count else 'disabled')
+        
+        table.on_page = update
+        update(table.page, table.page_count)
+    
     def load_products(self, page=1, search=None):
-        """Ürünleri yükler"""
-        def load():
-            try:
-                self.status_label.config(text="Ürünler yükleniyor...", fg=COLORS['text_light'])
-                
-                result = self.api.get_products(page=page, limit=50, search=search)
-                
-                if result.get('success'):
-                    # Tabloyu temizle
-                    for item in self.products_tree.get_children():
-                        self.products_tree.delete(item)
-                    
-                    # Ürünleri ekle
-                    products = result['data']['items']
-                    for product in products:
-                        status = "✓ Aktif" if product.get('active') == '1' else "✗ Pasif"
-                        price = f"{product.get('price', '0')} ₺"
-                        stock = product.get('stock_quantity', '0')
-                        
-                        self.products_tree.insert(
-                            '',
-                            'end',
-                            values=(
-                                product.get('id_product'),
-                                product.get('name', 'İsimsiz'),
-                                price,
-                                stock,
-                                status
-                            )
-                        )
-                    
-                    # Sayfalama bilgisi
-                    pagination = result['data']['pagination']
-                    self.status_label.config(
-                        text=f"✓ {pagination['total']} ürün bulundu (Sayfa {pagination['page']}/{pagination['pages']})",
-                        fg=COLORS['success']
-                    )
-                else:
-                    messagebox.showerror("Hata", result.get('message', 'Bilinmeyen hata'))
-                    
-            except Exception as e:
-                messagebox.showerror("Hata", f"Ürünler yüklenirken hata: {str(e)}")
-                self.status_label.config(text=f"✗ Hata: {str(e)}", fg=COLORS['danger'])
+        """Ürünleri yükler (sayfalar tablo kaydırıldıkça arka planda çekilir)"""
+        def fetch(page_no, page_size):
+            result = self.api.get_products(page=page_no, limit=page_size, search=search,
+                                           fields=PRODUCT_LIST_FIELDS)
+            if not result.get('success'):
+                raise Exception(result.get('message', 'Bilinmeyen hata'))
+            # Kayıtlar worker thread'de bir kez çözülür, tablo sadece biçimlendirir
+            products = [Product.from_api(item) for item in result['data']['items']]
+            return products, result['data']['pagination']['total']
+        
+        self.status_label.config(text="Ürünler yükleniyor...", fg=COLORS['text_light'])
+        self.products_table.set_source(fetch, start_index=(page - 1) * TABLE_PAGE_SIZE)
+    
+    def show_product_rows(self, products):
+        """Ürün tablosunu verilen ürünlerle doldurur"""
+        self.products_table.set_rows(products)
+    
+    def search_products(self, live=False):
+        """Ürün arar: indeks hazırsa yerelde, değilse sunucuda"""
+        term = self.product_search_var.get()
+        
+        if not self.search_index.ready:
+            # Yazarken sunucuya istek gönderme, sadece Ara/Enter ile
+            if not live:
+                self.load_products(search=term)
+            return
         
-        threading.Thread(target=load, daemon=True).start()
+        start = datetime.now()
+        limit = LIVE_SEARCH_LIMIT if live else None
+        products = self.search_index.search(term, limit=limit)
+        self.show_product_rows(products)
+        elapsed = (datetime.now() - start).total_seconds() * 1000
+        
+        if limit is not None and len(products) >= limit:
+            found = f"İlk {limit} ürün gösteriliyor, tümü için Enter"
+        else:
+            found = f"{len(products)} ürün bulundu"
+        self.status_label.config(
+            text=f"✓ {found} (yerel arama, {elapsed:.0f} ms)",
+            fg=COLORS['success']
+        )
     
     def view_product(self):
         """Ürün detaylarını gösterir"""
@@ -371,96 +490,100 @@ class PrestaShopApp:
         
         product_id = self.products_tree.item(selection[0])['values'][0]
         
-        def load():
-            try:
-                result = self.api.get_product(product_id)
-                if result.get('success'):
-                    product = result['data']
-                    
-                    # Detay penceresi
-                    detail_window = tk.Toplevel(self.root)
-                    detail_window.title(f"Ürün Detayı - {product.get('name', '')}")
-                    detail_window.geometry("600x500")
-                    detail_window.configure(bg=COLORS['white'])
-                    
-                    # Scroll
-                    canvas = tk.Canvas(detail_window, bg=COLORS['white'])
-                    scrollbar = ttk.Scrollbar(detail_window, orient="vertical", command=canvas.yview)
-                    scrollable_frame = tk.Frame(canvas, bg=COLORS['white'])
-                    
-                    scrollable_frame.bind(
-                        "<Configure>",
-                        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-                    )
-                    
-                    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-                    canvas.configure(yscrollcommand=scrollbar.set)
-                    
-                    # Bilgiler
-                    info = [
-                        ("ID", product.get('id_product')),
-                        ("Ürün Adı", product.get('name')),
-                        ("Referans", product.get('reference', '-')),
-                        ("Fiyat", f"{product.get('price', '0')} ₺"),
-                        ("Fiyat (KDV Dahil)", product.get('price_formatted', '-')),
-                        ("Toptan Fiyat", f"{product.get('wholesale_price', '0')} ₺"),
-                        ("EAN13", product.get('ean13', '-')),
-                        ("Stok", product.get('stock_quantity', '0')),
-                        ("Durum", "Aktif" if product.get('active') == '1' else "Pasif"),
-                        ("Kategori ID", product.get('id_category_default', '-')),
-                        ("Eklenme Tarihi", product.get('date_add', '-')),
-                        ("Güncellenme Tarihi", product.get('date_upd', '-')),
-                    ]
-                    
-                    for i, (label, value) in enumerate(info):
-                        tk.Label(
-                            scrollable_frame,
-                            text=f"{label}:",
-                            font=('Segoe UI', 10, 'bold'),
-                            bg=COLORS['white'],
-                            anchor='w'
-                        ).grid(row=i, column=0, sticky='w', padx=20, pady=5)
-                        
-                        tk.Label(
-                            scrollable_frame,
-                            text=str(value),
-                            font=('Segoe UI', 10),
-                            bg=COLORS['white'],
-                            anchor='w'
-                        ).grid(row=i, column=1, sticky='w', padx=20, pady=5)
-                    
-                    # Açıklama
-                    if product.get('description_short'):
-                        row = len(info)
-                        tk.Label(
-                            scrollable_frame,
-                            text="Kısa Açıklama:",
-                            font=('Segoe UI', 10, 'bold'),
-                            bg=COLORS['white'],
-                            anchor='w'
-                        ).grid(row=row, column=0, columnspan=2, sticky='w', padx=20, pady=(15, 5))
-                        
-                        tk.Label(
-                            scrollable_frame,
-                            text=product.get('description_short', ''),
-                            font=('Segoe UI', 9),
-                            bg=COLORS['white'],
-                            anchor='w',
-                            wraplength=500,
-                            justify='left'
-                        ).grid(row=row+1, column=0, columnspan=2, sticky='w', padx=20, pady=5)
+        def show(result):
+            if result.get('success'):
+                product = Product.from_api(result['data'])
+                
+                # Detay penceresi
+                detail_window = tk.Toplevel(self.root)
+                detail_window.title(f"Ürün Detayı - {product.name}")
+                detail_window.geometry("600x500")
+                detail_window.configure(bg=COLORS['white'])
+                
+                # Scroll
+                canvas = tk.Canvas(detail_window, bg=COLORS['white'])
+                scrollbar = ttk.Scrollbar(detail_window, orient="vertical", command=canvas.yview)
+                scrollable_frame = tk.Frame(canvas, bg=COLORS['white'])
+                
+                scrollable_frame.bind(
+                    "<Configure>",
+                    lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+                )
+                
+                canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+                canvas.configure(yscrollcommand=scrollbar.set)
+                
+                # Bilgiler
+                info = [
+                    ("ID", product.id_product),
+                    ("Ürün Adı", product.name),
+                    ("Referans", product.reference or '-'),
+                    ("Fiyat", f"{product.price:.2f} ₺"),
+                    ("Fiyat (KDV Dahil)", f"{product.price_with_tax:.2f} ₺"
+                     if product.price_with_tax is not None else '-'),
+                    ("Toptan Fiyat", f"{product.wholesale_price:.2f} ₺"),
+                    ("EAN13", product.ean13 or '-'),
+                    ("Stok", product.stock_quantity),
+                    ("Durum", "Aktif" if product.active else "Pasif"),
+                    ("Kategori ID", product.id_category_default or '-'),
+                    ("Eklenme Tarihi", product.date_add or '-'),
+                    ("Güncellenme Tarihi", product.date_upd or '-'),
+                ]
+                
+                for i, (label, value) in enumerate(info):
+                    tk.Label(
+                        scrollable_frame,
+                        text=f"{label}:",
+                        font=('Segoe UI', 10, 'bold'),
+                        bg=COLORS['white'],
+                        anchor='w'
+                    ).grid(row=i, column=0, sticky='w', padx=20, pady=5)
                     
-                    canvas.pack(side="left", fill="both", expand=True, padx=10, pady=10)
-                    scrollbar.pack(side="right", fill="y")
+                    tk.Label(
+                        scrollable_frame,
+                        text=str(value),
+                        font=('Segoe UI', 10),
+                        bg=COLORS['white'],
+                        anchor='w'
+                    ).grid(row=i, column=1, sticky='w', padx=20, pady=5)
+                
+                # Açıklama
+                if product.description_short:
+                    row = len(info)
+                    tk.Label(
+                        scrollable_frame,
+                        text="Kısa Açıklama:",
+                        font=('Segoe UI', 10, 'bold'),
+                        bg=COLORS['white'],
+                        anchor='w'
+                    ).grid(row=row, column=0, columnspan=2, sticky='w', padx=20, pady=(15, 5))
                     
-            except Exception as e:
-                messagebox.showerror("Hata", f"Ürün detayları yüklenemedi: {str(e)}")
+                    tk.Label(
+                        scrollable_frame,
+                        text=product.description_short,
+                        font=('Segoe UI', 9),
+                        bg=COLORS['white'],
+                        anchor='w',
+                        wraplength=500,
+                        justify='left'
+                    ).grid(row=row+1, column=0, columnspan=2, sticky='w', padx=20, pady=5)
+                
+                canvas.pack(side="left", fill="both", expand=True, padx=10, pady=10)
+                scrollbar.pack(side="right", fill="y")
+                
         
-        threading.Thread(target=load, daemon=True).start()
+        self.dispatcher.submit(
+            self.api.get_product, product_id,
+            on_success=show,
+            on_error=lambda e: messagebox.showerror("Hata", f"Ürün detayları yüklenemedi: {str(e)}"),
+            key='product_detail'
+        )
     
     def add_product(self):
         """Yeni ürün ekler"""
-        ProductDialog(self.root, self.api, callback=lambda: self.load_products())
+        ProductDialog(self.root, self.api, self.dispatcher,
+                      callback=lambda: self.load_products(),
+                      search_index=self.search_index)
     
     def edit_product(self):
         """Ürün düzenler"""
@@ -470,8 +593,9 @@ class PrestaShopApp:
             return
         
         product_id = self.products_tree.item(selection[0])['values'][0]
-        ProductDialog(self.root, self.api, product_id=product_id, 
-                     callback=lambda: self.load_products())
+        ProductDialog(self.root, self.api, self.dispatcher, product_id=product_id,
+                     callback=lambda: self.load_products(),
+                     search_index=self.search_index)
     
     def delete_product(self):
         """Ürün siler"""
@@ -484,18 +608,19 @@ class PrestaShopApp:
         product_name = self.products_tree.item(selection[0])['values'][1]
         
         if messagebox.askyesno("Onay", f"'{product_name}' ürününü silmek istediğinizden emin misiniz?"):
-            def delete():
-                try:
-                    result = self.api.delete_product(product_id)
-                    if result.get('success'):
-                        messagebox.showinfo("Başarılı", "Ürün başarıyla silindi")
-                        self.load_products()
-                    else:
-                        messagebox.showerror("Hata", result.get('message', 'Silinme hatası'))
-                except Exception as e:
-                    messagebox.showerror("Hata", f"Ürün silinemedi: {str(e)}")
+            def done(result):
+                if result.get('success'):
+                    self.search_index.remove(product_id)
+                    messagebox.showinfo("Başarılı", "Ürün başarıyla silindi")
+                    self.load_products()
+                else:
+                    messagebox.showerror("Hata", result.get('message', 'Silinme hatası'))
             
-            threading.Thread(target=delete, daemon=True).start()
+            self.dispatcher.submit(
+                self.api.delete_product, product_id,
+                on_success=done,
+                on_error=lambda e: messagebox.showerror("Hata", f"Ürün silinemedi: {str(e)}")
+            )
     
     def show_orders(self):
         """Sipariş yönetimi ekranını gösterir"""
@@ -520,25 +645,39 @@ class PrestaShopApp:
             color='primary'
         ).pack(side='right', padx=5)
         
-        # Tablo çerçevesi
-        table_frame = tk.Frame(self.main_content, bg=COLORS['white'])
-        table_frame.pack(fill='both', expand=True, padx=20, pady=(0, 20))
+        ModernButton(
+            top_frame,
+            "📤 Dışa Aktar",
+            command=lambda: self.export_data('orders'),
+            color='primary'
+        ).pack(side='right', padx=5)
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(table_frame)
-        scrollbar.pack(side='right', fill='y')
+        ModernButton(
+            top_frame,
+            "✏️ Durum Güncelle",
+            command=self.update_order_status,
+            color='warning'
+        ).pack(side='right', padx=5)
         
-        # Treeview
+        # Sanal tablo
         columns = ('ID', 'Referans', 'Müşteri', 'Toplam', 'Durum', 'Tarih')
-        self.orders_tree = ttk.Treeview(
-            table_frame,
-            columns=columns,
-            show='tree headings',
-            yscrollcommand=scrollbar.set,
-            height=20
+        self.orders_table = VirtualTable(
+            self.main_content,
+            columns,
+            row_values=order_row_values,
+            page_size=TABLE_PAGE_SIZE,
+            on_load=lambda total: self.status_label.config(
+                text=f"✓ {total} sipariş bulundu", fg=COLORS['success']
+            ),
+            on_error=lambda e: self.show_load_error("Siparişler", e),
+            height=20,
+            dispatcher=self.dispatcher,
+            selectmode='extended',  # Ctrl/Shift ile çoklu seçim
+            bg=COLORS['white']
         )
-        
-        scrollbar.config(command=self.orders_tree.yview)
+        self.create_pager(self.orders_table)
+        self.orders_table.pack(fill='both', expand=True, padx=20, pady=(0, 10))
+        self.orders_tree = self.orders_table.tree
         
         # Sütun ayarları
         self.orders_tree.column('#0', width=0, stretch=False)
@@ -553,8 +692,6 @@ class PrestaShopApp:
         for col in columns:
             self.orders_tree.heading(col, text=col, anchor='center')
         
-        self.orders_tree.pack(fill='both', expand=True)
-        
         # Sağ tık menüsü
         self.create_order_context_menu()
         
@@ -576,55 +713,23 @@ class PrestaShopApp:
         """Sağ tık menüsünü gösterir"""
         item = self.orders_tree.identify_row(event.y)
         if item:
-            self.orders_tree.selection_set(item)
+            # Çoklu seçimin içine sağ tıklanırsa seçim korunur
+            if item not in self.orders_tree.selection():
+                self.orders_tree.selection_set(item)
             self.order_menu.post(event.x_root, event.y_root)
     
     def load_orders(self, page=1):
-        """Siparişleri yükler"""
-        def load():
-            try:
-                self.status_label.config(text="Siparişler yükleniyor...", fg=COLORS['text_light'])
-                
-                result = self.api.get_orders(page=page, limit=50)
-                
-                if result.get('success'):
-                    # Tabloyu temizle
-                    for item in self.orders_tree.get_children():
-                        self.orders_tree.delete(item)
-                    
-                    # Siparişleri ekle
-                    orders = result['data']['items']
-                    for order in orders:
-                        total = f"{order.get('total_paid', '0')} ₺"
-                        date = order.get('date_add', '')[:10]  # Sadece tarih
-                        
-                        self.orders_tree.insert(
-                            '',
-                            'end',
-                            values=(
-                                order.get('id_order'),
-                                order.get('reference', '-'),
-                                order.get('customer_name', 'Bilinmiyor'),
-                                total,
-                                order.get('status_name', 'Bilinmiyor'),
-                                date
-                            )
-                        )
-                    
-                    # Sayfalama bilgisi
-                    pagination = result['data']['pagination']
-                    self.status_label.config(
-                        text=f"✓ {pagination['total']} sipariş bulundu (Sayfa {pagination['page']}/{pagination['pages']})",
-                        fg=COLORS['success']
-                    )
-                else:
-                    messagebox.showerror("Hata", result.get('message', 'Bilinmeyen hata'))
-                    
-            except Exception as e:
-                messagebox.showerror("Hata", f"Siparişler yüklenirken hata: {str(e)}")
-                self.status_label.config(text=f"✗ Hata: {str(e)}", fg=COLORS['danger'])
-        
-        threading.Thread(target=load, daemon=True).start()
+        """Siparişleri yükler (sayfalar tablo kaydırıldıkça arka planda çekilir)"""
+        def fetch(page_no, page_size):
+            result = self.api.get_orders(page=page_no, limit=page_size,
+                                         fields=ORDER_LIST_FIELDS)
+            if not result.get('success'):
+                raise Exception(result.get('message', 'Bilinmeyen hata'))
+            orders = [Order.from_api(item) for item in result['data']['items']]
+            return orders, result['data']['pagination']['total']
+        
+        self.status_label.config(text="Siparişler yükleniyor...", fg=COLORS['text_light'])
+        self.orders_table.set_source(fetch, start_index=(page - 1) * TABLE_PAGE_SIZE)
     
     def view_order(self):
         """Sipariş detaylarını gösterir"""
@@ -635,166 +740,177 @@ class PrestaShopApp:
         
         order_id = self.orders_tree.item(selection[0])['values'][0]
         
-        def load():
-            try:
-                result = self.api.get_order(order_id)
-                if result.get('success'):
-                    order = result['data']
-                    
-                    # Detay penceresi
-                    detail_window = tk.Toplevel(self.root)
-                    detail_window.title(f"Sipariş Detayı - {order.get('reference', '')}")
-                    detail_window.geometry("700x600")
-                    detail_window.configure(bg=COLORS['white'])
-                    
-                    # Notebook (sekmeler)
-                    notebook = ttk.Notebook(detail_window)
-                    notebook.pack(fill='both', expand=True, padx=10, pady=10)
-                    
-                    # Genel Bilgiler Sekmesi
-                    general_frame = tk.Frame(notebook, bg=COLORS['white'])
-                    notebook.add(general_frame, text='Genel Bilgiler')
-                    
-                    info = [
-                        ("Sipariş ID", order.get('id_order')),
-                        ("Referans", order.get('reference')),
-                        ("Durum", order.get('status_name')),
-                        ("Ödeme", order.get('payment')),
-                        ("Toplam Tutar", order.get('total_paid_formatted')),
-                        ("Ürün Tutarı", f"{order.get('total_products', '0')} ₺"),
-                        ("Kargo", f"{order.get('total_shipping', '0')} ₺"),
-                        ("İndirim", f"{order.get('total_discounts', '0')} ₺"),
-                        ("Tarih", order.get('date_add')),
-                    ]
-                    
-                    for i, (label, value) in enumerate(info):
-                        tk.Label(
-                            general_frame,
-                            text=f"{label}:",
-                            font=('Segoe UI', 10, 'bold'),
-                            bg=COLORS['white']
-                        ).grid(row=i, column=0, sticky='w', padx=20, pady=5)
-                        
-                        tk.Label(
-                            general_frame,
-                            text=str(value),
-                            font=('Segoe UI', 10),
-                            bg=COLORS['white']
-                        ).grid(row=i, column=1, sticky='w', padx=20, pady=5)
-                    
-                    # Müşteri Sekmesi
-                    customer_frame = tk.Frame(notebook, bg=COLORS['white'])
-                    notebook.add(customer_frame, text='Müşteri Bilgileri')
-                    
-                    customer = order.get('customer', {})
-                    customer_info = [
-                        ("Müşteri ID", customer.get('id_customer')),
-                        ("Ad", customer.get('firstname')),
-                        ("Soyad", customer.get('lastname')),
-                        ("E-posta", customer.get('email')),
-                    ]
-                    
-                    for i, (label, value) in enumerate(customer_info):
-                        tk.Label(
-                            customer_frame,
-                            text=f"{label}:",
-                            font=('Segoe UI', 10, 'bold'),
-                            bg=COLORS['white']
-                        ).grid(row=i, column=0, sticky='w', padx=20, pady=5)
-                        
-                        tk.Label(
-                            customer_frame,
-                            text=str(value),
-                            font=('Segoe UI', 10),
-                            bg=COLORS['white']
-                        ).grid(row=i, column=1, sticky='w', padx=20, pady=5)
+        def show(result):
+            if result.get('success'):
+                order = result['data']
+                
+                # Detay penceresi
+                detail_window = tk.Toplevel(self.root)
+                detail_window.title(f"Sipariş Detayı - {order.get('reference', '')}")
+                detail_window.geometry("700x600")
+                detail_window.configure(bg=COLORS['white'])
+                
+                # Notebook (sekmeler)
+                notebook = ttk.Notebook(detail_window)
+                notebook.pack(fill='both', expand=True, padx=10, pady=10)
+                
+                # Genel Bilgiler Sekmesi
+                general_frame = tk.Frame(notebook, bg=COLORS['white'])
+                notebook.add(general_frame, text='Genel Bilgiler')
+                
+                info = [
+                    ("Sipariş ID", order.get('id_order')),
+                    ("Referans", order.get('reference')),
+                    ("Durum", order.get('status_name')),
+                    ("Ödeme", order.get('payment')),
+                    ("Toplam Tutar", order.get('total_paid_formatted')),
+                    ("Ürün Tutarı", f"{order.get('total_products', '0')} ₺"),
+                    ("Kargo", f"{order.get('total_shipping', '0')} ₺"),
+                    ("İndirim", f"{order.get('total_discounts', '0')} ₺"),
+                    ("Tarih", order.get('date_add')),
+                ]
+                
+                for i, (label, value) in enumerate(info):
+                    tk.Label(
+                        general_frame,
+                        text=f"{label}:",
+                        font=('Segoe UI', 10, 'bold'),
+                        bg=COLORS['white']
+                    ).grid(row=i, column=0, sticky='w', padx=20, pady=5)
                     
-                    # Adres
-                    delivery = order.get('delivery_address', {})
+                    tk.Label(
+                        general_frame,
+                        text=str(value),
+                        font=('Segoe UI', 10),
+                        bg=COLORS['white']
+                    ).grid(row=i, column=1, sticky='w', padx=20, pady=5)
+                
+                # Müşteri Sekmesi
+                customer_frame = tk.Frame(notebook, bg=COLORS['white'])
+                notebook.add(customer_frame, text='Müşteri Bilgileri')
+                
+                customer = order.get('customer', {})
+                customer_info = [
+                    ("Müşteri ID", customer.get('id_customer')),
+                    ("Ad", customer.get('firstname')),
+                    ("Soyad", customer.get('lastname')),
+                    ("E-posta", customer.get('email')),
+                ]
+                
+                for i, (label, value) in enumerate(customer_info):
                     tk.Label(
                         customer_frame,
-                        text="\nTeslimat Adresi:",
-                        font=('Segoe UI', 11, 'bold'),
+                        text=f"{label}:",
+                        font=('Segoe UI', 10, 'bold'),
                         bg=COLORS['white']
-                    ).grid(row=len(customer_info), column=0, columnspan=2, sticky='w', padx=20, pady=(15, 5))
-                    
-                    address_text = f"{delivery.get('firstname', '')} {delivery.get('lastname', '')}\n"
-                    address_text += f"{delivery.get('address1', '')}\n"
-                    if delivery.get('address2'):
-                        address_text += f"{delivery.get('address2')}\n"
-                    address_text += f"{delivery.get('postcode', '')} {delivery.get('city', '')}\n"
-                    address_text += f"Tel: {delivery.get('phone', '')}"
+                    ).grid(row=i, column=0, sticky='w', padx=20, pady=5)
                     
                     tk.Label(
                         customer_frame,
-                        text=address_text,
-                        font=('Segoe UI', 9),
-                        bg=COLORS['white'],
-                        justify='left'
-                    ).grid(row=len(customer_info)+1, column=0, columnspan=2, sticky='w', padx=20, pady=5)
-                    
-                    # Ürünler Sekmesi
-                    products_frame = tk.Frame(notebook, bg=COLORS['white'])
-                    notebook.add(products_frame, text='Ürünler')
-                    
-                    # Ürün tablosu
-                    tree_frame = tk.Frame(products_frame, bg=COLORS['white'])
-                    tree_frame.pack(fill='both', expand=True, padx=10, pady=10)
-                    
-                    tree_scroll = ttk.Scrollbar(tree_frame)
-                    tree_scroll.pack(side='right', fill='y')
-                    
-                    product_tree = ttk.Treeview(
-                        tree_frame,
-                        columns=('Ürün', 'Adet', 'Birim Fiyat', 'Toplam'),
-                        show='headings',
-                        yscrollcommand=tree_scroll.set
+                        text=str(value),
+                        font=('Segoe UI', 10),
+                        bg=COLORS['white']
+                    ).grid(row=i, column=1, sticky='w', padx=20, pady=5)
+                
+                # Adres
+                delivery = order.get('delivery_address', {})
+                tk.Label(
+                    customer_frame,
+                    text="\nTeslimat Adresi:",
+                    font=('Segoe UI', 11, 'bold'),
+                    bg=COLORS['white']
+                ).grid(row=len(customer_info), column=0, columnspan=2, sticky='w', padx=20, pady=(15, 5))
+                
+                address_text = f"{delivery.get('firstname', '')} {delivery.get('lastname', '')}\n"
+                address_text += f"{delivery.get('address1', '')}\n"
+                if delivery.get('address2'):
+                    address_text += f"{delivery.get('address2')}\n"
+                address_text += f"{delivery.get('postcode', '')} {delivery.get('city', '')}\n"
+                address_text += f"Tel: {delivery.get('phone', '')}"
+                
+                tk.Label(
+                    customer_frame,
+                    text=address_text,
+                    font=('Segoe UI', 9),
+                    bg=COLORS['white'],
+                    justify='left'
+                ).grid(row=len(customer_info)+1, column=0, columnspan=2, sticky='w', padx=20, pady=5)
+                
+                # Ürünler Sekmesi
+                products_frame = tk.Frame(notebook, bg=COLORS['white'])
+                notebook.add(products_frame, text='Ürünler')
+                
+                # Ürün tablosu
+                tree_frame = tk.Frame(products_frame, bg=COLORS['white'])
+                tree_frame.pack(fill='both', expand=True, padx=10, pady=10)
+                
+                tree_scroll = ttk.Scrollbar(tree_frame)
+                tree_scroll.pack(side='right', fill='y')
+                
+                product_tree = ttk.Treeview(
+                    tree_frame,
+                    columns=('Ürün', 'Adet', 'Birim Fiyat', 'Toplam'),
+                    show='headings',
+                    yscrollcommand=tree_scroll.set
+                )
+                tree_scroll.config(command=product_tree.yview)
+                
+                product_tree.heading('Ürün', text='Ürün')
+                product_tree.heading('Adet', text='Adet')
+                product_tree.heading('Birim Fiyat', text='Birim Fiyat')
+                product_tree.heading('Toplam', text='Toplam')
+                
+                product_tree.column('Ürün', width=300)
+                product_tree.column('Adet', width=80, anchor='center')
+                product_tree.column('Birim Fiyat', width=100, anchor='e')
+                product_tree.column('Toplam', width=100, anchor='e')
+                
+                # Çok kalemli siparişlerde satırlar kare kare eklenir
+                self.dispatcher.insert_rows(
+                    product_tree,
+                    [OrderLine.from_api(line) for line in order.get('products') or ()],
+                    lambda line: (
+                        line.product_name,
+                        line.product_quantity,
+                        f"{line.unit_price_tax_incl:.2f} ₺",
+                        f"{line.total_price_tax_incl:.2f} ₺"
                     )
-                    tree_scroll.config(command=product_tree.yview)
-                    
-                    product_tree.heading('Ürün', text='Ürün')
-                    product_tree.heading('Adet', text='Adet')
-                    product_tree.heading('Birim Fiyat', text='Birim Fiyat')
-                    product_tree.heading('Toplam', text='Toplam')
-                    
-                    product_tree.column('Ürün', width=300)
-                    product_tree.column('Adet', width=80, anchor='center')
-                    product_tree.column('Birim Fiyat', width=100, anchor='e')
-                    product_tree.column('Toplam', width=100, anchor='e')
-                    
-                    for product in order.get('products', []):
-                        product_tree.insert('', 'end', values=(
-                            product.get('product_name'),
-                            product.get('product_quantity'),
-                            f"{product.get('unit_price_tax_incl', '0')} ₺",
-                            f"{product.get('total_price_tax_incl', '0')} ₺"
-                        ))
-                    
-                    product_tree.pack(fill='both', expand=True)
-                    
-            except Exception as e:
-                messagebox.showerror("Hata", f"Sipariş detayları yüklenemedi: {str(e)}")
+                )
+                
+                product_tree.pack(fill='both', expand=True)
+                
         
-        threading.Thread(target=load, daemon=True).start()
+        self.dispatcher.submit(
+            self.api.get_order, order_id,
+            on_success=show,
+            on_error=lambda e: messagebox.showerror("Hata", f"Sipariş detayları yüklenemedi: {str(e)}"),
+            key='order_detail'
+        )
     
     def update_order_status(self):
-        """Sipariş durumunu günceller"""
-        selection = self.orders_tree.selection()
-        if not selection:
-            messagebox.showwarning("Uyarı", "Lütfen bir sipariş seçin")
+        """Seçili siparişlerin durumunu günceller (çoklu seçimde toplu)"""
+        orders = self.orders_table.selected_rows()
+        if not orders:
+            messagebox.showwarning("Uyarı", "Lütfen en az bir sipariş seçin")
             return
         
-        order_id = self.orders_tree.item(selection[0])['values'][0]
+        waiting = self.orders_table.selection_count - len(orders)
+        if waiting:
+            messagebox.showwarning("Uyarı", f"Seçili {waiting} sipariş henüz yüklenmedi, "
+                                            "biraz sonra tekrar deneyin")
+            return
+        
+        order_ids = [order.id_order for order in orders]
         
         # Durum seçim penceresi
         status_window = tk.Toplevel(self.root)
         status_window.title("Sipariş Durumu Güncelle")
-        status_window.geometry("400x300")
+        status_window.geometry("400x420")
         status_window.configure(bg=COLORS['white'])
         
         tk.Label(
             status_window,
-            text="Yeni Durumu Seçin:",
+            text=f"{len(order_ids)} sipariş için yeni durumu seçin:",
             font=('Segoe UI', 12, 'bold'),
             bg=COLORS['white']
         ).pack(pady=20)
@@ -821,29 +937,96 @@ class PrestaShopApp:
                 bg=COLORS['white']
             ).pack(anchor='w', padx=40, pady=5)
         
+        progress_bar = ttk.Progressbar(status_window, maximum=len(order_ids), length=300)
+        progress_label = tk.Label(status_window, text="", font=('Segoe UI', 9),
+                                  bg=COLORS['white'], fg=COLORS['text_light'])
+        
         def update():
             new_status = int(status_var.get())
+            update_button.config(state='disabled')
+            progress_bar.pack(pady=(10, 0), before=update_button)
+            progress_label.pack(before=update_button)
+            counts = {'done': 0, 'failed': 0}
+            
+            def advance(results):
+                # Ana thread'de: toplu ilerleme
+                counts['done'] += len(results)
+                counts['failed'] += sum(1 for r in results if not r['success'])
+                if status_window.winfo_exists():
+                    progress_bar['value'] = counts['done']
+                    failed = f", {counts['failed']} hata" if counts['failed'] else ''
+                    progress_label.config(text=f"{counts['done']}/{len(order_ids)}{failed}")
+            
+            def done(results):
+                if status_window.winfo_exists():
+                    status_window.destroy()
+                
+                changed = [r['id_order'] for r in results
+                           if r['success'] and not r.get('unchanged')]
+                unchanged = sum(1 for r in results if r.get('unchanged'))
+                unknown = [r['id_order'] for r in results if r.get('unknown')]
+                failed = [r for r in results if not r['success'] and not r.get('unknown')]
+                # Sonucu bilinmeyenler sunucuda değişmiş olabilir, onlar da tazelenir
+                if changed or unknown:
+                    self.refresh_order_rows(changed + unknown)
+                
+                summary = f"{len(changed)} siparişin durumu güncellendi"
+                if unchanged:
+                    summary += f", {unchanged} sipariş zaten bu durumdaydı"
+                if not failed and not unknown:
+                    messagebox.showinfo("Başarılı", summary)
+                else:
+                    lines = [f"#{r['id_order']}: {r.get('message', 'Hata')}" for r in failed[:10]]
+                    if len(failed) > 10:
+                        lines.append(f"... ve {len(failed) - 10} hata daha")
+                    if unknown:
+                        # Zaman aşımı: tekrar gönderilmedi (müşteriye ikinci e-posta gitmesin)
+                        lines.append(f"{len(unknown)} siparişin sonucu bilinmiyor (zaman aşımı); "
+                                     "tablodaki durumlarını kontrol edin")
+                    messagebox.showwarning(
+                        "Kısmen Tamamlandı",
+                        f"{summary}, {len(failed)} sipariş güncellenemedi:\n\n" + "\n".join(lines)
+                    )
             
-            def do_update():
-                try:
-                    result = self.api.update_order_status(order_id, new_status)
-                    if result.get('success'):
-                        messagebox.showinfo("Başarılı", "Sipariş durumu güncellendi")
-                        status_window.destroy()
-                        self.load_orders()
-                    else:
-                        messagebox.showerror("Hata", result.get('message', 'Güncelleme hatası'))
-                except Exception as e:
-                    messagebox.showerror("Hata", f"Durum güncellenemedi: {str(e)}")
+            def failed(e):
+                update_button.config(state='normal')
+                messagebox.showerror("Hata", f"Durum güncellenemedi: {str(e)}")
             
-            threading.Thread(target=do_update, daemon=True).start()
+            # Parçalar sınırlı sayıda paralel istekle gönderilir; ilerleme
+            # worker thread'den ana thread'e dispatcher.call ile taşınır
+            self.dispatcher.submit(
+                self.api.update_orders_status_bulk, order_ids, new_status,
+                chunk_size=ORDER_STATUS_CHUNK, workers=ORDER_STATUS_WORKERS,
+                progress=lambda results: self.dispatcher.call(advance, results),
+                on_success=done,
+                on_error=failed
+            )
         
-        ModernButton(
+        update_button = ModernButton(
             status_window,
             "Güncelle",
             command=update,
             color='success'
-        ).pack(pady=20)
+        )
+        update_button.pack(pady=20)
+    
+    def refresh_order_rows(self, order_ids):
+        """Sadece verilen siparişlerin satırlarını sunucudan tazeler"""
+        table = self.orders_table
+        
+        def fetch():
+            items = self.api.get_orders_by_ids(order_ids, fields=ORDER_LIST_FIELDS)
+            return [Order.from_api(item) for item in items]
+        
+        def apply(orders):
+            if table.winfo_exists():
+                table.replace_rows(orders, key=lambda order: order.id_order)
+        
+        self.dispatcher.submit(
+            fetch,
+            on_success=apply,
+            on_error=lambda e: self.show_load_error("Siparişler", e)
+        )
     
     def delete_order(self):
         """Sipariş siler"""
@@ -856,18 +1039,18 @@ class PrestaShopApp:
         order_ref = self.orders_tree.item(selection[0])['values'][1]
         
         if messagebox.askyesno("Onay", f"'{order_ref}' siparişini silmek istediğinizden emin misiniz?"):
-            def delete():
-                try:
-                    result = self.api.delete_order(order_id)
-                    if result.get('success'):
-                        messagebox.showinfo("Başarılı", "Sipariş başarıyla silindi")
-                        self.load_orders()
-                    else:
-                        messagebox.showerror("Hata", result.get('message', 'Silme hatası'))
-                except Exception as e:
-                    messagebox.showerror("Hata", f"Sipariş silinemedi: {str(e)}")
+            def done(result):
+                if result.get('success'):
+                    messagebox.showinfo("Başarılı", "Sipariş başarıyla silindi")
+                    self.load_orders()
+                else:
+                    messagebox.showerror("Hata", result.get('message', 'Silme hatası'))
             
-            threading.Thread(target=delete, daemon=True).start()
+            self.dispatcher.submit(
+                self.api.delete_order, order_id,
+                on_success=done,
+                on_error=lambda e: messagebox.showerror("Hata", f"Sipariş silinemedi: {str(e)}")
+            )
     
     def show_settings(self):
         """Ayarlar ekranını gösterir"""
@@ -925,15 +1108,82 @@ class PrestaShopApp:
             bg=COLORS['white'],
             fg=COLORS['text_light']
         ).pack(anchor='w', pady=10)
+        
+        # API Durumu
+        tk.Label(
+            settings_frame,
+            text="API Durumu",
+            font=('Segoe UI', 14, 'bold'),
+            bg=COLORS['white']
+        ).pack(anchor='w', pady=(10, 10))
+        
+        health_label = tk.Label(
+            settings_frame,
+            font=('Segoe UI', 10),
+            bg=COLORS['white'],
+            anchor='w'
+        )
+        health_label.pack(fill='x', pady=(0, 5))
+        
+        columns = ('Resource', 'İstek', 'Hata %', 'Tekrar', 'Önbellek',
+                   'p50 (ms)', 'p95 (ms)', 'Gelen (KB)', 'Giden (KB)')
+        metrics_tree = ttk.Treeview(settings_frame, columns=columns, show='headings', height=4)
+        for col in columns:
+            metrics_tree.heading(col, text=col, anchor='center')
+            metrics_tree.column(col, width=90, anchor='e' if col != 'Resource' else 'w')
+        metrics_tree.pack(fill='x')
+        
+        def copy_prometheus():
+            self.root.clipboard_clear()
+            self.root.clipboard_append(self.api.metrics.to_prometheus())
+            self.status_label.config(text="✓ Metrikler panoya kopyalandı", fg=COLORS['success'])
+        
+        ModernButton(
+            settings_frame,
+            "📋 Prometheus Çıktısını Kopyala",
+            command=copy_prometheus,
+            color='primary'
+        ).pack(anchor='w', pady=10)
+        
+        def refresh():
+            # Ekrandan çıkıldıysa yenilemeyi durdur
+            if not metrics_tree.winfo_exists():
+                return
+            
+            breaker = self.api.breaker.state if self.api.breaker is not None else '-'
+            concurrency = self.api.concurrency
+            limit = (f"{concurrency.inflight}/{concurrency.limit}"
+                     if concurrency is not None else '-')
+            health_label.config(text=f"Devre kesici: {breaker}    Uçuştaki / sınır: {limit}")
+            
+            metrics_tree.delete(*metrics_tree.get_children())
+            for resource, row in sorted(self.api.metrics.summary().items()):
+                metrics_tree.insert('', 'end', values=(
+                    resource,
+                    row['requests'],
+                    f"{row['error_rate'] * 100:.1f}",
+                    row['retries'],
+                    row['cache_hits'],
+                    f"{row['p50'] * 1000:.0f}" if row['p50'] is not None else '-',
+                    f"{row['p95'] * 1000:.0f}" if row['p95'] is not None else '-',
+                    f"{row['bytes_in'] / 1024:.1f}",
+                    f"{row['bytes_out'] / 1024:.1f}",
+                ))
+            
+            self.root.after(1000, refresh)
+        
+        refresh()
 
 
 class ProductDialog:
     """Ürün ekleme/düzenleme diyaloğu"""
     
-    def __init__(self, parent, api, product_id=None, callback=None):
+    def __init__(self, parent, api, dispatcher, product_id=None, callback=None, search_index=None):
         self.api = api
+        self.dispatcher = dispatcher
         self.product_id = product_id
         self.callback = callback
+        self.search_index = search_index
         
         self.window = tk.Toplevel(parent)
         self.window.title("Yeni Ürün" if not product_id else "Ürün Düzenle")
@@ -1015,24 +1265,25 @@ class ProductDialog:
     
     def load_product(self):
         """Ürün bilgilerini yükler"""
-        def load():
-            try:
-                result = self.api.get_product(self.product_id)
-                if result.get('success'):
-                    product = result['data']
-                    
-                    self.fields['name'].insert(0, product.get('name', ''))
-                    self.fields['price'].insert(0, product.get('price', ''))
-                    self.fields['reference'].insert(0, product.get('reference', ''))
-                    self.fields['ean13'].insert(0, product.get('ean13', ''))
-                    self.fields['quantity'].insert(0, product.get('stock_quantity', ''))
-                    self.fields['description_short'].insert(0, product.get('description_short', ''))
-                    self.fields['active'].set(product.get('active') == '1')
-                    
-            except Exception as e:
-                messagebox.showerror("Hata", f"Ürün yüklenemedi: {str(e)}")
-        
-        threading.Thread(target=load, daemon=True).start()
+        def fill(result):
+            # Yanıt gelmeden pencere kapatılmış olabilir
+            if not result.get('success') or not self.window.winfo_exists():
+                return
+            product = Product.from_api(result['data'])
+            
+            self.fields['name'].insert(0, product.name)
+            self.fields['price'].insert(0, f"{product.price:.2f}")
+            self.fields['reference'].insert(0, product.reference)
+            self.fields['ean13'].insert(0, product.ean13)
+            self.fields['quantity'].insert(0, product.stock_quantity)
+            self.fields['description_short'].insert(0, product.description_short)
+            self.fields['active'].set(product.active)
+        
+        self.dispatcher.submit(
+            self.api.get_product, self.product_id,
+            on_success=fill,
+            on_error=lambda e: messagebox.showerror("Hata", f"Ürün yüklenemedi: {str(e)}")
+        )
     
     def save_product(self):
         """Ürünü kaydeder"""
@@ -1064,26 +1315,38 @@ class ProductDialog:
         }
         
         def save():
-            try:
-                if self.product_id:
-                    result = self.api.update_product(self.product_id, data)
-                    msg = "Ürün güncellendi"
-                else:
-                    result = self.api.create_product(data)
-                    msg = "Ürün oluşturuldu"
+            if self.product_id:
+                return self.api.update_product(self.product_id, data), "Ürün güncellendi"
+            return self.api.create_product(data), "Ürün oluşturuldu"
+        
+        def done(outcome):
+            result, msg = outcome
+            if result.get('success'):
+                # Yerel arama indeksini güncelle
+                if self.search_index is not None:
+                    product_id = self.product_id or result['data'].get('id_product')
+                    self.search_index.add({
+                        'id_product': str(product_id),
+                        'name': data['name'],
+                        'price': data['price'],
+                        'stock_quantity': data['quantity'],
+                        'active': str(data['active']),
+                        'reference': data['reference'],
+                        'ean13': data['ean13'],
+                    })
                 
-                if result.get('success'):
-                    messagebox.showinfo("Başarılı", msg)
-                    self.window.destroy()
-                    if self.callback:
-                        self.callback()
-                else:
-                    messagebox.showerror("Hata", result.get('message', 'İşlem hatası'))
-                    
-            except Exception as e:
-                messagebox.showerror("Hata", f"Kaydetme hatası: {str(e)}")
+                messagebox.showinfo("Başarılı", msg)
+                self.window.destroy()
+                if self.callback:
+                    self.callback()
+            else:
+                messagebox.showerror("Hata", result.get('message', 'İşlem hatası'))
         
-        threading.Thread(target=save, daemon=True).start()
+        self.dispatcher.submit(
+            save,
+            on_success=done,
+            on_error=lambda e: messagebox.showerror("Hata", f"Kaydetme hatası: {str(e)}")
+        )
 
 
 def main():
@@ -1091,6 +1354,10 @@ def main():
     root = tk.Tk()
     app = PrestaShopApp(root)
     root.mainloop()
+    
+    # Bekleyen arka plan işlerini iptal et
+    if hasattr(app, 'dispatcher'):
+        app.dispatcher.shutdown()
 
 
 if __name__ == "__main__":
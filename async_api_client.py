@@ -0,0 +1,327 @@
+"""
+PrestaShop Async API Client
+PHP API ile asyncio üzerinden iletişim kuran Python modülü
+"""
+
+import asyncio
+import aiohttp
+from typing import Callable, Dict, Iterable, List, Optional
+import json
+
+from api_errors import (APIConnectionError, APIError, APITimeoutError,
+                        CircuitOpenError, InvalidResponseError, error_for_status)
+from resilience import CircuitBreaker, RetryPolicy, parse_retry_after
+from response_cache import ResponseCache
+from single_flight import AsyncSingleFlight
+
+
+class AsyncPrestaShopAPIClient:
+    """PrestaShop API Client sınıfının asyncio sürümü"""
+
+    def __init__(self, api_url: str, api_key: str, max_concurrency: int = 20,
+                 pool_maxsize: int = 50, keep_alive: bool = True,
+                 connect_timeout: float = 5, read_timeout: float = 10,
+                 compact: bool = True, single_flight: bool = True,
+                 max_retries: int = 3, backoff_factor: float = 0.5,
+                 max_backoff: float = 10, breaker_threshold: int = 5,
+                 breaker_timeout: float = 30):
+        """
+        Async API Client'ı başlatır
+
+        Args:
+            api_url: API URL'i
+            api_key: API anahtarı
+            max_concurrency: Aynı anda uçuşta olabilecek maksimum istek
+            pool_maxsize: Host başına açık tutulacak maksimum bağlantı
+            keep_alive: Bağlantıları istekler arasında açık tut
+            connect_timeout: Bağlantı kurma zaman aşımı (saniye)
+            read_timeout: Yanıt okuma zaman aşımı (saniye)
+            compact: Sunucudan boşluksuz JSON iste
+            single_flight: Aynı anda uçuştaki özdeş GET isteklerini tek
+                HTTP isteğinde birleştir
+            max_retries: Geçici hatalarda idempotent isteklerin (GET, PUT)
+                tekrar sayısı (0 = kapalı)
+            backoff_factor: İlk tekrar öncesi bekleme üst sınırı (saniye)
+            max_backoff: Tekrarlar arası maksimum bekleme (saniye)
+            breaker_threshold: Devre kesiciyi açan ardışık sunucu hatası
+                sayısı (0 = kapalı)
+            breaker_timeout: Devre açıkken isteklerin hemen reddedileceği
+                süre (saniye)
+        """
+        self.api_url = api_url
+        self.api_key = api_key
+        self.headers = {
+            'X-API-Key': api_key,
+            'Content-Type': 'application/json'
+        }
+        self.compact = compact
+        self.max_concurrency = max_concurrency
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout,
+                                             sock_read=read_timeout)
+        self.inflight = AsyncSingleFlight() if single_flight else None
+        self.retry = (RetryPolicy(max_retries, backoff_factor, max_backoff)
+                      if max_retries > 0 else None)
+        self.breaker = (CircuitBreaker(breaker_threshold, breaker_timeout)
+                        if breaker_threshold > 0 else None)
+
+        # Oturum ve semafor event loop içinde ilk istekte oluşturulur
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Kalıcı oturumu döndürür, yoksa oluşturur"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_maxsize,
+                                             limit_per_host=self.pool_maxsize,
+                                             force_close=not self.keep_alive)
+            self.session = aiohttp.ClientSession(connector=connector,
+                                                 headers=self.headers,
+                                                 timeout=self.timeout)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.session
+
+    async def close(self):
+        """Oturumu ve havuzdaki bağlantıları kapatır"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _make_request(self, method: str, resource: str, data: Optional[Dict] = None,
+                            params: Optional[Dict] = None) -> Dict:
+        """
+        API'ye HTTP isteği gönderir
+
+        Args:
+            method: HTTP metodu
+            resource: Resource adı (products, orders)
+            data: Gönderilecek veri
+            params: URL parametreleri
+
+        Returns:
+            API yanıtı
+        """
+        if method not in ('GET', 'POST', 'PUT', 'DELETE'):
+            raise ValueError(f"Desteklenmeyen HTTP metodu: {method}")
+
+        query = {'resource': resource}
+        if self.compact:
+            query['compact'] = '1'
+        if params:
+            query.update({key: str(value) for key, value in params.items()})
+
+        if method == 'GET' and self.inflight is not None:
+            return await self.inflight.do(
+                ResponseCache.make_key(resource, params),
+                lambda: self._send(method, query, data)
+            )
+
+        result = await self._send(method, query, data)
+        if method != 'GET' and self.inflight is not None:
+            # Yazmadan önce başlamış okumalara yeni çağrılar katılmasın
+            self.inflight.forget(lambda key: key[0] == resource)
+        return result
+
+    async def _send(self, method: str, query: Dict, data: Optional[Dict]) -> Dict:
+        """İsteği gönderir, geçici hatalarda tekrar dener"""
+        attempt = 0
+        last_error = None
+        while True:
+            try:
+                return await self._exchange(method, query, data)
+            except CircuitOpenError:
+                # Devre tekrar denemeler sırasında açıldıysa asıl hatayı göster
+                if last_error is not None:
+                    raise last_error
+                raise
+            except APIError as e:
+                delay = (self.retry.delay(method, attempt, e, query['resource'])
+                         if self.retry is not None else None)
+                if delay is None:
+                    raise
+                last_error = e
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def _exchange(self, method: str, query: Dict, data: Optional[Dict]) -> Dict:
+        """Tek bir HTTP denemesi yapar, hataları tipli istisnalara çevirir"""
+        if self.breaker is not None:
+            self.breaker.before_request()
+
+        try:
+            session = self._get_session()
+            async with self._semaphore:
+                async with session.request(
+                    method,
+                    self.api_url,
+                    params=query,
+                    json=data if method in ('POST', 'PUT') else None
+                ) as response:
+                    status = response.status
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    body = await response.read()
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            if self.breaker is not None:
+                self.breaker.record_failure()
+            if isinstance(e, asyncio.TimeoutError):
+                raise APITimeoutError("İstek zaman aşımına uğradı")
+            if isinstance(e, aiohttp.ClientConnectionError):
+                raise APIConnectionError("API'ye bağlanılamadı. URL'i kontrol edin.")
+            raise APIError(f"İstek hatası: {str(e)}")
+        except BaseException:
+            # İptal (CancelledError) veya beklenmeyen hata: sonuç kaydedilmezse
+            # yarı açık devrenin deneme hakkı hiç boşalmaz ve devre kilitlenir
+            if self.breaker is not None:
+                self.breaker.release_probe()
+            raise
+
+        if self.breaker is not None:
+            if status >= 500:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+
+        # JSON yanıtı parse et
+        try:
+            result = json.loads(body)
+        except ValueError:
+            if status >= 400:
+                # PHP fatal error gibi JSON olmayan hata sayfaları
+                raise error_for_status(status, f"API hatası (HTTP {status})", retry_after)
+            raise InvalidResponseError("Geçersiz API yanıtı", status=status)
+
+        if status >= 400:
+            raise error_for_status(status, result.get('message', 'API hatası'), retry_after)
+
+        return result
+
+    async def _get_by_ids(self, fetch_page: Callable, id_field: str,
+                          ids: Iterable[int], chunk_size: int,
+                          fields: Optional[List[str]]) -> List[Dict]:
+        """
+        ID listesini parçalara bölüp her parçayı tek istekle getirir
+
+        Parçalar eşzamanlı çekilir (max_concurrency ile sınırlı); sonuç verilen
+        ID sırasıyla döner, bulunamayan ID'ler atlanır.
+        """
+        ids = list(dict.fromkeys(int(i) for i in ids))
+        chunk_size = min(chunk_size, 100)  # API sayfa sınırı
+        chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        if fields and id_field not in fields:
+            fields = [id_field] + list(fields)
+
+        results = await asyncio.gather(*(
+            fetch_page(page=1, limit=len(chunk), fields=fields,
+                       ids=','.join(map(str, chunk)))
+            for chunk in chunks
+        ))
+
+        found = {}
+        for result in results:
+            for item in result['data']['items']:
+                found[int(item[id_field])] = item
+
+        return [found[i] for i in ids if i in found]
+
+    # ============= ÜRÜN İŞLEMLERİ =============
+
+    async def get_products(self, page: int = 1, limit: int = 50,
+                           search: str = None, active: int = None,
+                           fields: Optional[List[str]] = None, ids: str = None) -> Dict:
+        """Ürün listesini getirir (fields: sadece bu alanları iste)"""
+        params = {'page': page, 'limit': limit}
+
+        if ids:
+            params['ids'] = ids
+        if search:
+            params['search'] = search
+        if active is not None:
+            params['active'] = active
+        if fields:
+            params['fields'] = ','.join(fields)
+
+        return await self._make_request('GET', 'products', params=params)
+
+    async def get_product(self, product_id: int, fields: Optional[List[str]] = None) -> Dict:
+        """Tek bir ürünü getirir"""
+        params = {'id': product_id}
+        if fields:
+            params['fields'] = ','.join(fields)
+        return await self._make_request('GET', 'products', params=params)
+
+    async def get_products_by_ids(self, product_ids: Iterable[int], chunk_size: int = 100,
+                                  fields: Optional[List[str]] = None) -> List[Dict]:
+        """Birden fazla ürünü parça başına tek istekle getirir"""
+        return await self._get_by_ids(self.get_products, 'id_product', product_ids,
+                                      chunk_size, fields)
+
+    async def create_product(self, product_data: Dict) -> Dict:
+        """Yeni ürün oluşturur"""
+        return await self._make_request('POST', 'products', data=product_data)
+
+    async def update_product(self, product_id: int, product_data: Dict) -> Dict:
+        """Ürünü günceller"""
+        return await self._make_request('PUT', 'products', data=product_data,
+                                        params={'id': product_id})
+
+    async def delete_product(self, product_id: int) -> Dict:
+        """Ürünü siler"""
+        return await self._make_request('DELETE', 'products', params={'id': product_id})
+
+    # ============= SİPARİŞ İŞLEMLERİ =============
+
+    async def get_orders(self, page: int = 1, limit: int = 50,
+                         status: int = None, customer: int = None,
+                         fields: Optional[List[str]] = None, ids: str = None) -> Dict:
+        """Sipariş listesini getirir (fields: sadece bu alanları iste)"""
+        params = {'page': page, 'limit': limit}
+
+        if ids:
+            params['ids'] = ids
+        if status is not None:
+            params['status'] = status
+        if customer is not None:
+            params['customer'] = customer
+        if fields:
+            params['fields'] = ','.join(fields)
+
+        return await self._make_request('GET', 'orders', params=params)
+
+    async def get_order(self, order_id: int, fields: Optional[List[str]] = None) -> Dict:
+        """Tek bir siparişi getirir"""
+        params = {'id': order_id}
+        if fields:
+            params['fields'] = ','.join(fields)
+        return await self._make_request('GET', 'orders', params=params)
+
+    async def get_orders_by_ids(self, order_ids: Iterable[int], chunk_size: int = 100,
+                                fields: Optional[List[str]] = None) -> List[Dict]:
+        """Birden fazla siparişi parça başına tek istekle getirir"""
+        return await self._get_by_ids(self.get_orders, 'id_order', order_ids,
+                                      chunk_size, fields)
+
+    async def update_order_status(self, order_id: int, new_status: int) -> Dict:
+        """Sipariş durumunu günceller"""
+        return await self._make_request('PUT', 'orders',
+                                        data={'current_state': new_status},
+                                        params={'id': order_id})
+
+    async def delete_order(self, order_id: int) -> Dict:
+        """Siparişi siler"""
+        return await self._make_request('DELETE', 'orders', params={'id': order_id})
+
+    # ============= TEST =============
+
+    async def test_connection(self) -> bool:
+        """API bağlantısını test eder"""
+        try:
+            result = await self._make_request('GET', 'products', params={'limit': 1})
+            return result.get('success', False)
+        except Exception:
+            return False
@@ -0,0 +1,4 @@
+"""
+PrestaShop API Client benchmark'ları
+Proje kök dizininden `python -m benchmarks.<modül>` ile çalıştırılır
+"""
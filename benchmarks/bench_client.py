@@ -0,0 +1,244 @@
+"""
+İstemci Benchmark Paketi
+Sahte API sunucusuna karşı tekrarlanabilir senaryolar çalıştırır ve her biri
+için verim (istek/sn, kayıt/sn) ile p50/p95/p99 gecikmesini raporlar.
+Sonuçlar bir referans dosyasına kaydedilip sonraki çalıştırmalarla
+karşılaştırılabilir; gerileme varsa betik sıfırdan farklı kodla çıkar.
+
+Kullanım:
+    python -m benchmarks.bench_client --products 5000 --orders 2000
+    python -m benchmarks.bench_client --save baseline.json
+    python -m benchmarks.bench_client --compare baseline.json --tolerance 0.2
+    python -m benchmarks.bench_client --scenario catalog_scan --scenario detail_lookups
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from api_client import PrestaShopAPIClient
+from benchmarks.fake_api_server import FakeAPIServer, FakeShop
+from models import ProductBatch, product_row_values
+
+# app.py'deki tablo alanları ve sayfa boyutu (Tk yüklememek için kopyalandı)
+PRODUCT_LIST_FIELDS = ['id_product', 'name', 'price', 'stock_quantity', 'active']
+TABLE_PAGE_SIZE = 100
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Sıralı olmayan listeden doğrusal aradeğerleme ile yüzdelik (q: 0-1)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = q * (len(ordered) - 1)
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+# ============= SENARYOLAR =============
+# Her senaryo (api, shop, args) alır ve işlenen kayıt sayısını döndürür
+
+def catalog_scan(api: PrestaShopAPIClient, shop: FakeShop, args) -> int:
+    """Tüm katalog, paralel sayfa sayfa (offset)"""
+    return sum(1 for _ in api.iter_all_products(limit=args.page_size, workers=args.workers,
+                                                fields=PRODUCT_LIST_FIELDS))
+
+
+def catalog_scan_cursor(api: PrestaShopAPIClient, shop: FakeShop, args) -> int:
+    """Tüm katalog, sıralı cursor sayfalaması"""
+    return sum(1 for _ in api.iter_all_products(limit=args.page_size, cursor=True,
+                                                fields=PRODUCT_LIST_FIELDS))
+
+
+def detail_lookups(api: PrestaShopAPIClient, shop: FakeShop, args) -> int:
+    """Rastgele ürün detayları, `workers` thread ile"""
+    rnd = random.Random(args.seed)
+    ids = [rnd.randint(1, args.products) for _ in range(args.lookups)]
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        return sum(1 for _ in pool.map(api.get_product, ids))
+
+
+def conditional_polling(api: PrestaShopAPIClient, shop: FakeShop, args) -> int:
+    """İlk sayfaların tekrar tekrar yoklanması; ilk turdan sonra yanıtlar 304"""
+    pages = min(10, -(-args.products // args.page_size))
+    items = 0
+    for _ in range(5):
+        for page in range(1, pages + 1):
+            result = api.get_products(page=page, limit=args.page_size,
+                                      fields=PRODUCT_LIST_FIELDS)
+            items += len(result['data']['items'])
+    return items
+
+
+def table_population(api: PrestaShopAPIClient, shop: FakeShop, args) -> int:
+    """Ürün tablosunun doldurulması: VirtualTable gibi 100'lük sayfalar,
+    arayüz dispatcher'ı kadar worker, sütunlu forma çözme ve arayüzün satır
+    fonksiyonuyla satır değerlerine dönüştürme"""
+    def fetch(page):
+        result = api.get_products(page=page, limit=TABLE_PAGE_SIZE, fields=PRODUCT_LIST_FIELDS)
+        batch = ProductBatch.from_api(result['data']['items'])
+        return [product_row_values(product) for product in batch]
+
+    pages = -(-args.products // TABLE_PAGE_SIZE)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        return sum(len(rows) for rows in pool.map(fetch, range(1, pages + 1)))
+
+
+def bulk_update(api: PrestaShopAPIClient, shop: FakeShop, args) -> int:
+    """Tüm ürünlerin fiyat ve stoğunun toplu güncellenmesi"""
+    rnd = random.Random(args.seed)
+    updates = ((i, {'price': round(rnd.uniform(10, 500), 2), 'quantity': rnd.randint(0, 100)})
+               for i in range(1, args.products + 1))
+    results = api.update_products_bulk(updates, chunk_size=200, workers=2)
+    failed = [r for r in results if not r['success']]
+    if failed:
+        raise Exception(f"{len(failed)} ürün güncellenemedi: {failed[0].get('message')}")
+    return len(results)
+
+
+# Yazma senaryoları en sonda çalışır, okumalar aynı veriyi görür
+SCENARIOS: Dict[str, Callable] = {
+    'catalog_scan': catalog_scan,
+    'catalog_scan_cursor': catalog_scan_cursor,
+    'detail_lookups': detail_lookups,
+    'conditional_polling': conditional_polling,
+    'table_population': table_population,
+    'bulk_update': bulk_update,
+}
+
+
+# ============= ÇALIŞTIRMA =============
+
+def run_scenario(name: str, shop: FakeShop, server: FakeAPIServer, args) -> Dict:
+    """Senaryoyu `repeat` kez çalıştırır, gecikmeleri client hook'uyla toplar"""
+    latencies = []
+    errors = []
+    items = 0
+    elapsed = 0.0
+    queries = shop.query_count
+
+    for _ in range(args.repeat):
+        # Her tekrar yeni client: önbellek ve ETag'ler önceki turdan kalmasın
+        with PrestaShopAPIClient(server.url, server.api_key,
+                                 pool_maxsize=max(10, args.workers)) as api:
+            api.add_hook('after_receive', lambda ctx: latencies.append(ctx['elapsed']))
+            api.add_hook('on_error', lambda ctx: errors.append(ctx['error']))
+            start = time.perf_counter()
+            items += SCENARIOS[name](api, shop, args)
+            elapsed += time.perf_counter() - start
+
+    def ms(q):
+        value = percentile(latencies, q)
+        return None if value is None else value * 1000
+
+    return {
+        'requests': len(latencies),
+        'items': items,
+        'errors': len(errors),
+        'queries': shop.query_count - queries,
+        'seconds': elapsed,
+        'req_per_s': len(latencies) / elapsed if elapsed else 0.0,
+        'items_per_s': items / elapsed if elapsed else 0.0,
+        'p50_ms': ms(0.50),
+        'p95_ms': ms(0.95),
+        'p99_ms': ms(0.99),
+    }
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Referansa göre gerilemeleri bulur
+
+    Kayıt/sn referansın (1 - tolerance) katının altına düşerse veya p95
+    referansın (1 + tolerance) katını aşarsa gerileme sayılır.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result['items_per_s'] < base['items_per_s'] * (1 - tolerance):
+            regressions.append(f"{name}: kayıt/sn {base['items_per_s']:.0f} -> "
+                               f"{result['items_per_s']:.0f}")
+        if (base.get('p95_ms') and result['p95_ms'] is not None
+                and result['p95_ms'] > base['p95_ms'] * (1 + tolerance)):
+            regressions.append(f"{name}: p95 {base['p95_ms']:.2f} ms -> "
+                               f"{result['p95_ms']:.2f} ms")
+    return regressions
+
+
+def print_table(results: Dict, baseline: Optional[Dict] = None):
+    def fmt(value):
+        return '-' if value is None else f"{value:.2f}"
+
+    print(f"{'Senaryo':<22} {'İstek':>7} {'Kayıt':>7} {'Süre (s)':>9} {'İstek/sn':>9} "
+          f"{'Kayıt/sn':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'Hata':>5}")
+    for name, r in results.items():
+        line = (f"{name:<22} {r['requests']:>7} {r['items']:>7} {r['seconds']:>9.2f} "
+                f"{r['req_per_s']:>9.0f} {r['items_per_s']:>10.0f} {fmt(r['p50_ms']):>8} "
+                f"{fmt(r['p95_ms']):>8} {fmt(r['p99_ms']):>8} {r['errors']:>5}")
+        base = (baseline or {}).get(name)
+        if base and base['items_per_s']:
+            line += f"  ({(r['items_per_s'] / base['items_per_s'] - 1) * 100:+.0f}%)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='İstemci benchmark paketi')
+    parser.add_argument('--products', type=int, default=5000, help='Sentetik ürün sayısı')
+    parser.add_argument('--orders', type=int, default=2000, help='Sentetik sipariş sayısı')
+    parser.add_argument('--seed', type=int, default=42, help='Veri ve senaryo tohumu')
+    parser.add_argument('--query-latency', type=float, default=0,
+                        help='Sorgu başına yapay gecikme (saniye)')
+    parser.add_argument('--page-size', type=int, default=100, help='Liste sayfa boyutu')
+    parser.add_argument('--workers', type=int, default=4, help='Paralel istek sayısı')
+    parser.add_argument('--lookups', type=int, default=500, help='Rastgele detay isteği sayısı')
+    parser.add_argument('--repeat', type=int, default=3, help='Senaryo başına tekrar')
+    parser.add_argument('--scenario', action='append', choices=list(SCENARIOS),
+                        help='Sadece bu senaryo(lar)ı çalıştır')
+    parser.add_argument('--json', action='store_true', help='Sonuçları JSON olarak yazdır')
+    parser.add_argument('--save', metavar='DOSYA', help='Sonuçları referans olarak kaydet')
+    parser.add_argument('--compare', metavar='DOSYA', help='Referans sonuçlarla karşılaştır')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Gerileme sayılmayacak en büyük sapma oranı')
+    args = parser.parse_args()
+
+    names = [name for name in SCENARIOS if not args.scenario or name in args.scenario]
+    shop = FakeShop(products=args.products, orders=args.orders, seed=args.seed,
+                    query_latency=args.query_latency)
+
+    results = {}
+    with FakeAPIServer(shop) as server:
+        for name in names:
+            results[name] = run_scenario(name, shop, server, args)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results, baseline)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print('\nGerileme:', file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Liste Sorgu Benchmark'ı
+Liste uç noktalarında kayıt başına sorgu (N+1) ile sayfa başına gruplu
+sorguyu karşılaştırır: sayfa başına SQL sorgu sayısı ve gecikme
+
+Kullanım:
+    python -m benchmarks.bench_list_queries --pages 20 --query-latency 0.0005
+"""
+
+import argparse
+import statistics
+import time
+
+from api_client import PrestaShopAPIClient
+from benchmarks.fake_api_server import FakeAPIServer, FakeShop
+
+
+def run(strategy: str, resource: str, pages: int, limit: int,
+        query_latency: float) -> dict:
+    """Tek strateji için sayfaları çeker ve ölçer"""
+    shop = FakeShop(products=pages * limit, orders=pages * limit,
+                    list_strategy=strategy, query_latency=query_latency)
+
+    latencies = []
+    queries = []
+    with FakeAPIServer(shop) as server:
+        with PrestaShopAPIClient(server.url, server.api_key,
+                                 conditional_get=False) as api:
+            fetch = api.get_products if resource == 'products' else api.get_orders
+            for page in range(1, pages + 1):
+                before = shop.query_count
+                start = time.perf_counter()
+                fetch(page=page, limit=limit)
+                latencies.append((time.perf_counter() - start) * 1000)
+                queries.append(shop.query_count - before)
+
+    return {
+        'strategy': strategy,
+        'resource': resource,
+        'queries_per_page': statistics.mean(queries),
+        'p50_ms': statistics.median(latencies),
+        'mean_ms': statistics.mean(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Liste sorgu benchmark\'ı (N+1 vs gruplu)')
+    parser.add_argument('--pages', type=int, default=20, help='Çekilecek sayfa sayısı')
+    parser.add_argument('--limit', type=int, default=100, help='Sayfa başına kayıt')
+    parser.add_argument('--query-latency', type=float, default=0.0005,
+                        help='Sorgu başına yapay gecikme (saniye)')
+    args = parser.parse_args()
+
+    print(f"{'Resource':<10} {'Strateji':<12} {'Sorgu/sayfa':>12} {'p50 (ms)':>10} {'Ort. (ms)':>10}")
+    for resource in ('products', 'orders'):
+        for strategy in ('n_plus_one', 'grouped'):
+            result = run(strategy, resource, args.pages, args.limit, args.query_latency)
+            print(f"{result['resource']:<10} {result['strategy']:<12} "
+                  f"{result['queries_per_page']:>12.1f} {result['p50_ms']:>10.2f} "
+                  f"{result['mean_ms']:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,736 @@
+"""
+Sahte PrestaShop API Sunucusu
+Benchmark'lar için api.php ile aynı sözleşmeyi sunan yerel sunucu
+
+Gerçek PrestaShop gerektirmez: veriler bellekteki bir SQLite veritabanında
+sentetik olarak üretilir. `resource` / `id` / `page` / `limit` parametreleri
+ve `success` / `data.items` / `pagination` zarfı api.php ile aynıdır.
+Okuma (ETag / If-None-Match dahil), oluşturma, güncelleme, toplu güncelleme
+ve silme istekleri desteklenir. Çalıştırılan SQL sorguları sayılır, böylece
+sorgu sayısı ölçülebilir.
+"""
+
+import hashlib
+import json
+import random
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+class FakeShop:
+    """Sentetik ürün ve sipariş verisi tutan SQLite veritabanı"""
+
+    def __init__(self, products: int = 1000, orders: int = 1000,
+                 images_per_product: int = 3, lines_per_order: int = 3,
+                 seed: int = 42, list_strategy: str = 'grouped',
+                 query_latency: float = 0):
+        """
+        Veritabanını oluşturur ve doldurur
+
+        Args:
+            products: Üretilecek ürün sayısı
+            orders: Üretilecek sipariş sayısı
+            images_per_product: Ürün başına en fazla resim sayısı
+            lines_per_order: Sipariş başına en fazla ürün satırı
+            seed: Rastgele veri tohumu (tekrarlanabilir sonuçlar için)
+            list_strategy: Liste ek verilerinin yükleme şekli:
+                'grouped' (sayfa başına tek sorgu) veya 'n_plus_one'
+                (kayıt başına bir sorgu, eski davranış)
+            query_latency: Her sorguya eklenecek yapay gecikme (saniye),
+                uzak MySQL sunucusunu taklit etmek için
+        """
+        self.list_strategy = list_strategy
+        self.query_latency = query_latency
+        self.query_count = 0
+        self.lock = threading.Lock()
+
+        self.db = sqlite3.connect(':memory:', check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self._create_schema()
+        self._seed(products, orders, images_per_product, lines_per_order, seed)
+
+    def _create_schema(self):
+        """PrestaShop tablolarının sadeleştirilmiş halini oluşturur"""
+        self.db.executescript("""
+            CREATE TABLE product (
+                id_product INTEGER PRIMARY KEY,
+                name TEXT, description TEXT, description_short TEXT,
+                price TEXT, wholesale_price TEXT, reference TEXT, ean13 TEXT,
+                active TEXT, quantity TEXT, stock_quantity TEXT,
+                id_category_default TEXT, category_name TEXT,
+                date_add TEXT, date_upd TEXT
+            );
+            CREATE TABLE image (
+                id_image INTEGER PRIMARY KEY,
+                id_product INTEGER, position INTEGER, cover INTEGER
+            );
+            CREATE INDEX image_product ON image (id_product);
+            CREATE TABLE orders (
+                id_order INTEGER PRIMARY KEY,
+                reference TEXT, id_customer TEXT, current_state TEXT,
+                total_paid TEXT, total_paid_tax_incl TEXT, total_paid_tax_excl TEXT,
+                total_products TEXT, total_shipping TEXT, payment TEXT,
+                customer_name TEXT, customer_email TEXT,
+                status_name TEXT, status_color TEXT,
+                date_add TEXT, date_upd TEXT
+            );
+            CREATE TABLE order_detail (
+                id_order_detail INTEGER PRIMARY KEY,
+                id_order INTEGER, product_id TEXT, product_name TEXT,
+                product_quantity TEXT, product_price TEXT,
+                unit_price_tax_incl TEXT, unit_price_tax_excl TEXT,
+                total_price_tax_incl TEXT, total_price_tax_excl TEXT,
+                product_reference TEXT, product_ean13 TEXT
+            );
+            CREATE INDEX order_detail_order ON order_detail (id_order);
+        """)
+
+    def _seed(self, products: int, orders: int, images_per_product: int,
+              lines_per_order: int, seed: int):
+        """Tekrarlanabilir sentetik veri üretir"""
+        rnd = random.Random(seed)
+        start = datetime(2024, 1, 1)
+        statuses = self.STATUS_NAMES
+        words = ['Pamuklu', 'Tişört', 'Kazak', 'Gömlek', 'Çanta', 'Ayakkabı',
+                 'Şapka', 'Eldiven', 'Mavi', 'Kırmızı', 'Siyah', 'Büyük', 'Küçük']
+
+        product_rows = []
+        image_rows = []
+        for id_product in range(1, products + 1):
+            added = start + timedelta(minutes=rnd.randint(0, 500000))
+            updated = added + timedelta(minutes=rnd.randint(0, 50000))
+            name = ' '.join(rnd.sample(words, 3))
+            price = rnd.uniform(5, 2000)
+            stock = rnd.randint(0, 500)
+            product_rows.append((
+                id_product, name, f'{name} açıklaması. ' * 20, f'{name} kısa açıklama',
+                f'{price:.6f}', f'{price * 0.6:.6f}', f'REF-{id_product:06d}',
+                f'{rnd.randint(10 ** 12, 10 ** 13 - 1)}', str(int(rnd.random() < 0.9)),
+                str(stock), str(stock), '2', 'Ana Sayfa',
+                added.strftime('%Y-%m-%d %H:%M:%S'), updated.strftime('%Y-%m-%d %H:%M:%S')
+            ))
+            for position in range(1, rnd.randint(0, images_per_product) + 1):
+                image_rows.append((None, id_product, position, int(position == 1)))
+
+        order_rows = []
+        line_rows = []
+        for id_order in range(1, orders + 1):
+            added = start + timedelta(minutes=rnd.randint(0, 500000))
+            updated = added + timedelta(minutes=rnd.randint(0, 5000))
+            state = rnd.randint(1, len(statuses))
+            total = 0.0
+            for _ in range(rnd.randint(1, lines_per_order)):
+                product_id = rnd.randint(1, max(products, 1))
+                quantity = rnd.randint(1, 5)
+                unit = rnd.uniform(5, 500)
+                total += unit * quantity
+                line_rows.append((
+                    None, id_order, str(product_id), f'Ürün {product_id}', str(quantity),
+                    f'{unit:.6f}', f'{unit * 1.2:.6f}', f'{unit:.6f}',
+                    f'{unit * 1.2 * quantity:.6f}', f'{unit * quantity:.6f}',
+                    f'REF-{product_id:06d}', ''
+                ))
+            order_rows.append((
+                id_order, f'ORD{id_order:06d}', str(rnd.randint(1, 5000)), str(state),
+                f'{total * 1.2:.6f}', f'{total * 1.2:.6f}', f'{total:.6f}',
+                f'{total:.6f}', '0.000000', 'Kredi Kartı',
+                f'Müşteri {id_order % 5000}', f'musteri{id_order % 5000}@example.com',
+                statuses[state - 1], '#32CD32',
+                added.strftime('%Y-%m-%d %H:%M:%S'), updated.strftime('%Y-%m-%d %H:%M:%S')
+            ))
+
+        self.db.executemany(f"INSERT INTO product VALUES ({','.join('?' * 15)})", product_rows)
+        self.db.executemany("INSERT INTO image VALUES (?, ?, ?, ?)", image_rows)
+        self.db.executemany(f"INSERT INTO orders VALUES ({','.join('?' * 16)})", order_rows)
+        self.db.executemany(f"INSERT INTO order_detail VALUES ({','.join('?' * 12)})", line_rows)
+        self.db.commit()
+
+    def query(self, sql: str, args: Tuple = ()) -> List[Dict]:
+        """Sorguyu çalıştırır ve sayar"""
+        with self.lock:
+            self.query_count += 1
+            if self.query_latency:
+                time.sleep(self.query_latency)
+            return [dict(row) for row in self.db.execute(sql, args).fetchall()]
+
+    def execute(self, sql: str, args: Tuple = ()) -> int:
+        """Yazma sorgusunu çalıştırır ve sayar, etkilenen satır sayısını döndürür"""
+        with self.lock:
+            self.query_count += 1
+            if self.query_latency:
+                time.sleep(self.query_latency)
+            cursor = self.db.execute(sql, args)
+            self.db.commit()
+            return cursor.rowcount
+
+    # ============= ÜRÜNLER =============
+
+    def list_products(self, params: Dict) -> Dict:
+        """ProductManager::getAll karşılığı"""
+        page, limit, offset = self._window(params)
+        where, args = ['1=1'], []
+        if 'active' in params:
+            where.append('active = ?')
+            args.append(str(int(params['active'])))
+        if 'search' in params:
+            where.append('name LIKE ?')
+            args.append(f"%{params['search']}%")
+        if 'ids' in params:
+            ids = self._id_list(params['ids'])
+            where.append(f"id_product IN ({','.join('?' * len(ids))})")
+            args.extend(ids)
+        if 'since' in params:
+            where.append('date_upd >= ?')
+            args.append(params['since'])
+        cursor = 'after_id' in params
+        if cursor and int(params['after_id']) > 0:
+            where.append('id_product < ?')
+            args.append(int(params['after_id']))
+        where_sql = ' AND '.join(where)
+
+        if cursor:
+            products = self.query(
+                f'SELECT * FROM product WHERE {where_sql} ORDER BY id_product DESC LIMIT ?',
+                tuple(args) + (limit + 1,)
+            )
+        else:
+            total = self.query(f'SELECT COUNT(*) AS total FROM product WHERE {where_sql}', tuple(args))[0]['total']
+            products = self.query(
+                f'SELECT * FROM product WHERE {where_sql} ORDER BY id_product DESC LIMIT ? OFFSET ?',
+                tuple(args) + (limit, offset)
+            )
+
+        if 'images' in self._fields(params, 'images'):
+            if self.list_strategy == 'n_plus_one':
+                for product in products:
+                    product['images'] = self._images([product['id_product']])[product['id_product']]
+            else:
+                images = self._images([p['id_product'] for p in products])
+                for product in products:
+                    product['images'] = images[product['id_product']]
+
+        for product in products:
+            product['id_product'] = str(product['id_product'])
+            product['price_formatted'] = self._money(product['price'])
+
+        if cursor:
+            return self._cursor(products, limit, 'id_product', params)
+        return self._paginated(products, total, page, limit, params)
+
+    def get_product(self, id_product: int, params: Dict) -> Optional[Dict]:
+        """ProductManager::getOne karşılığı"""
+        rows = self.query('SELECT * FROM product WHERE id_product = ?', (id_product,))
+        if not rows:
+            return None
+        product = rows[0]
+        price = float(product['price'])
+        product.update({
+            'id_product': str(product['id_product']),
+            'tax_rate': 20,
+            'price_with_tax': f'{price * 1.2:.2f}',
+            'price_formatted': self._money(price * 1.2),
+            'categories': ['2'],
+            'images': self._images([id_product])[id_product],
+        })
+        return self._only_fields(product, params)
+
+    def _images(self, product_ids: List[int]) -> Dict[int, List[Dict]]:
+        """Ürün resimlerini tek sorguda getirir"""
+        images = {id_product: [] for id_product in product_ids}
+        if not product_ids:
+            return images
+        rows = self.query(
+            f"SELECT * FROM image WHERE id_product IN ({','.join('?' * len(product_ids))}) "
+            "ORDER BY id_product, position",
+            tuple(product_ids)
+        )
+        for row in rows:
+            images[row['id_product']].append({
+                'id_image': str(row['id_image']),
+                'position': str(row['position']),
+                'cover': str(row['cover']),
+                'url': f"http://localhost/img/p/{row['id_image']}-large_default.jpg"
+            })
+        return images
+
+    # Toplu güncellemede doğrudan yazılabilen alanlar (ProductManager::bulkUpdate ile aynı)
+    BULK_COLUMNS = {'price': lambda v: f'{float(v):.6f}',
+                    'wholesale_price': lambda v: f'{float(v):.6f}',
+                    'active': int, 'reference': str, 'ean13': str}
+
+    def create_product(self, data: Dict) -> Dict:
+        """ProductManager::create karşılığı"""
+        now = self._now()
+        quantity = str(int(data.get('quantity', 0)))
+        with self.lock:
+            self.query_count += 1
+            if self.query_latency:
+                time.sleep(self.query_latency)
+            cursor = self.db.execute(
+                f"INSERT INTO product VALUES ({','.join('?' * 15)})",
+                (None, data['name'], data.get('description', ''),
+                 data.get('description_short', ''), f"{float(data.get('price', 0)):.6f}",
+                 f"{float(data.get('wholesale_price', 0)):.6f}", data.get('reference', ''),
+                 data.get('ean13', ''), str(int(data.get('active', 1))), quantity, quantity,
+                 str(data.get('id_category_default', 2)), 'Ana Sayfa', now, now)
+            )
+            self.db.commit()
+        return {'id_product': cursor.lastrowid, 'message': 'Ürün başarıyla oluşturuldu'}
+
+    def update_product(self, id_product: int, data: Dict) -> bool:
+        """ProductManager::update karşılığı, ürün yoksa False"""
+        set_sql, args = [], []
+        for column in ('name', 'description', 'description_short'):
+            if column in data:
+                set_sql.append(f'{column} = ?')
+                args.append(data[column])
+        for column, cast in self.BULK_COLUMNS.items():
+            if column in data:
+                set_sql.append(f'{column} = ?')
+                args.append(str(cast(data[column])))
+        if 'quantity' in data:
+            set_sql.extend(['quantity = ?', 'stock_quantity = ?'])
+            args.extend([str(int(data['quantity']))] * 2)
+        set_sql.append('date_upd = ?')
+        args.append(self._now())
+        return self.execute(
+            f"UPDATE product SET {', '.join(set_sql)} WHERE id_product = ?",
+            tuple(args) + (id_product,)
+        ) > 0
+
+    def bulk_update_products(self, items: List[Dict]) -> Dict:
+        """ProductManager::bulkUpdate karşılığı (tek transaction, kayıt başına savepoint)"""
+        results = []
+        updated = 0
+        now = self._now()
+        with self.lock:
+            for item in items:
+                id_product = int(item.get('id_product', 0))
+                self.db.execute('SAVEPOINT bulk_item')
+                try:
+                    self.query_count += 1
+                    if not self.db.execute('SELECT 1 FROM product WHERE id_product = ?',
+                                           (id_product,)).fetchone():
+                        raise ValueError('Ürün bulunamadı')
+                    unknown = set(item) - set(self.BULK_COLUMNS) - {'id_product', 'quantity'}
+                    if unknown:
+                        raise ValueError('Desteklenmeyen alan: ' + ', '.join(sorted(unknown)))
+
+                    set_sql, args = ['date_upd = ?'], [now]
+                    for column, cast in self.BULK_COLUMNS.items():
+                        if column in item:
+                            set_sql.append(f'{column} = ?')
+                            args.append(str(cast(item[column])))
+                    if 'quantity' in item:
+                        set_sql.extend(['quantity = ?', 'stock_quantity = ?'])
+                        args.extend([str(int(item['quantity']))] * 2)
+
+                    self.query_count += 1
+                    if self.query_latency:
+                        time.sleep(self.query_latency)
+                    self.db.execute(f"UPDATE product SET {', '.join(set_sql)} WHERE id_product = ?",
+                                    tuple(args) + (id_product,))
+                    self.db.execute('RELEASE SAVEPOINT bulk_item')
+                    results.append({'id_product': id_product, 'success': True})
+                    updated += 1
+                except ValueError as e:
+                    self.db.execute('ROLLBACK TO SAVEPOINT bulk_item')
+                    self.db.execute('RELEASE SAVEPOINT bulk_item')
+                    results.append({'id_product': id_product, 'success': False, 'message': str(e)})
+            self.db.commit()
+
+        return {'updated': updated, 'failed': len(results) - updated, 'results': results}
+
+    def delete_product(self, id_product: int) -> bool:
+        """ProductManager::delete karşılığı, ürün yoksa False"""
+        deleted = self.execute('DELETE FROM product WHERE id_product = ?', (id_product,)) > 0
+        if deleted:
+            self.execute('DELETE FROM image WHERE id_product = ?', (id_product,))
+        return deleted
+
+    # ============= SİPARİŞLER =============
+
+    def list_orders(self, params: Dict) -> Dict:
+        """OrderManager::getAll karşılığı"""
+        page, limit, offset = self._window(params)
+        where, args = ['1=1'], []
+        if 'status' in params:
+            where.append('current_state = ?')
+            args.append(str(int(params['status'])))
+        if 'customer' in params:
+            where.append('id_customer = ?')
+            args.append(str(int(params['customer'])))
+        if 'ids' in params:
+            ids = self._id_list(params['ids'])
+            where.append(f"id_order IN ({','.join('?' * len(ids))})")
+            args.extend(ids)
+        if 'since' in params:
+            where.append('date_upd >= ?')
+            args.append(params['since'])
+        cursor = 'after_id' in params
+        if cursor and int(params['after_id']) > 0:
+            where.append('id_order < ?')
+            args.append(int(params['after_id']))
+        where_sql = ' AND '.join(where)
+
+        if cursor:
+            orders = self.query(
+                f'SELECT * FROM orders WHERE {where_sql} ORDER BY id_order DESC LIMIT ?',
+                tuple(args) + (limit + 1,)
+            )
+        else:
+            total = self.query(f'SELECT COUNT(*) AS total FROM orders WHERE {where_sql}', tuple(args))[0]['total']
+            orders = self.query(
+                f'SELECT * FROM orders WHERE {where_sql} ORDER BY id_order DESC LIMIT ? OFFSET ?',
+                tuple(args) + (limit, offset)
+            )
+
+        if 'product_count' in self._fields(params, 'product_count'):
+            if self.list_strategy == 'n_plus_one':
+                for order in orders:
+                    order['product_count'] = self.query(
+                        'SELECT COUNT(*) AS c FROM order_detail WHERE id_order = ?',
+                        (order['id_order'],)
+                    )[0]['c']
+            else:
+                counts = self._product_counts([o['id_order'] for o in orders])
+                for order in orders:
+                    order['product_count'] = counts[order['id_order']]
+
+        for order in orders:
+            order['id_order'] = str(order['id_order'])
+            order['total_paid_formatted'] = self._money(order['total_paid'])
+
+        if cursor:
+            return self._cursor(orders, limit, 'id_order', params)
+        return self._paginated(orders, total, page, limit, params)
+
+    def get_order(self, id_order: int, params: Dict) -> Optional[Dict]:
+        """OrderManager::getOne karşılığı"""
+        rows = self.query('SELECT * FROM orders WHERE id_order = ?', (id_order,))
+        if not rows:
+            return None
+        order = rows[0]
+        order['id_order'] = str(order['id_order'])
+        order['total_paid_formatted'] = self._money(order['total_paid'])
+        order['customer'] = {
+            'id_customer': order['id_customer'],
+            'firstname': order['customer_name'].split(' ')[0],
+            'lastname': order['customer_name'].split(' ')[-1],
+            'email': order['customer_email'],
+        }
+        order['delivery_address'] = {
+            'firstname': order['customer']['firstname'],
+            'lastname': order['customer']['lastname'],
+            'address1': 'Atatürk Cad. No: 1', 'address2': '',
+            'postcode': '34000', 'city': 'İstanbul',
+            'phone': '', 'phone_mobile': '',
+        }
+        order['products'] = self.query(
+            'SELECT * FROM order_detail WHERE id_order = ?', (id_order,)
+        )
+        return self._only_fields(order, params)
+
+    def _product_counts(self, order_ids: List[int]) -> Dict[int, int]:
+        """Siparişlerin ürün sayılarını tek sorguda getirir"""
+        counts = {id_order: 0 for id_order in order_ids}
+        if not order_ids:
+            return counts
+        rows = self.query(
+            f"SELECT id_order, COUNT(*) AS c FROM order_detail "
+            f"WHERE id_order IN ({','.join('?' * len(order_ids))}) GROUP BY id_order",
+            tuple(order_ids)
+        )
+        for row in rows:
+            counts[row['id_order']] = row['c']
+        return counts
+
+    STATUS_NAMES = ['Ödeme Bekleniyor', 'Ödeme Kabul Edildi', 'Hazırlanıyor',
+                    'Kargoya Verildi', 'Teslim Edildi', 'İptal Edildi', 'İade']
+
+    def update_order(self, id_order: int, data: Dict) -> bool:
+        """OrderManager::update karşılığı, sipariş yoksa False"""
+        set_sql, args = ['date_upd = ?'], [self._now()]
+        if 'current_state' in data:
+            state = int(data['current_state'])
+            set_sql.extend(['current_state = ?', 'status_name = ?'])
+            args.extend([str(state), self.STATUS_NAMES[(state - 1) % len(self.STATUS_NAMES)]])
+        if 'payment' in data:
+            set_sql.append('payment = ?')
+            args.append(data['payment'])
+        return self.execute(
+            f"UPDATE orders SET {', '.join(set_sql)} WHERE id_order = ?",
+            tuple(args) + (id_order,)
+        ) > 0
+
+    def _order_state(self, id_order: int) -> Optional[str]:
+        with self.lock:
+            row = self.db.execute('SELECT current_state FROM orders WHERE id_order = ?',
+                                  (id_order,)).fetchone()
+        return row[0] if row else None
+
+    def bulk_update_orders(self, items: List[Dict]) -> Dict:
+        """OrderManager::bulkUpdate karşılığı (kayıt başına ayrı durum değişikliği)"""
+        results = []
+        for item in items:
+            id_order = int(item.get('id_order', 0))
+            if 'current_state' not in item:
+                results.append({'id_order': id_order, 'success': False,
+                                'message': 'current_state gerekli'})
+            elif self._order_state(id_order) == str(int(item['current_state'])):
+                results.append({'id_order': id_order, 'success': True, 'unchanged': True})
+            elif not self.update_order(id_order, {'current_state': item['current_state']}):
+                results.append({'id_order': id_order, 'success': False,
+                                'message': 'Sipariş bulunamadı'})
+            else:
+                results.append({'id_order': id_order, 'success': True})
+        updated = sum(1 for result in results if result['success'])
+        return {'updated': updated, 'failed': len(results) - updated, 'results': results}
+
+    def delete_order(self, id_order: int) -> bool:
+        """OrderManager::delete karşılığı, sipariş yoksa False"""
+        deleted = self.execute('DELETE FROM orders WHERE id_order = ?', (id_order,)) > 0
+        if deleted:
+            self.execute('DELETE FROM order_detail WHERE id_order = ?', (id_order,))
+        return deleted
+
+    # ============= YARDIMCILAR =============
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    @staticmethod
+    def _window(params: Dict) -> Tuple[int, int, int]:
+        """Sayfa, limit ve offset (api.php ile aynı 100 sınırı)"""
+        page = int(params.get('page', 1))
+        limit = min(int(params.get('limit', 50)), 100)
+        return page, limit, (page - 1) * limit
+
+    @staticmethod
+    def _id_list(ids: str) -> List[int]:
+        return list(dict.fromkeys(int(i) for i in ids.split(',') if i.strip().isdigit())) or [0]
+
+    @staticmethod
+    def _fields(params: Dict, default: str) -> List[str]:
+        """İstenen alan listesi, verilmediyse varsayılan alan dahil sayılır"""
+        if 'fields' in params:
+            return params['fields'].split(',')
+        return [default]
+
+    @staticmethod
+    def _only_fields(row: Dict, params: Dict) -> Dict:
+        if 'fields' not in params:
+            return row
+        fields = params['fields'].split(',')
+        return {key: value for key, value in row.items() if key in fields}
+
+    @staticmethod
+    def _money(value) -> str:
+        return f"{float(value):,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.') + ' ₺'
+
+    def _cursor(self, items: List[Dict], limit: int, id_field: str,
+                params: Dict) -> Dict:
+        """Response::cursor karşılığı"""
+        has_more = len(items) > limit
+        items = items[:limit]
+        next_after_id = int(items[-1][id_field]) if has_more else None
+        return {
+            'pagination': {
+                'limit': limit,
+                'has_more': has_more,
+                'next_after_id': next_after_id,
+                'server_time': self._now()
+            },
+            'items': [self._only_fields(item, params) for item in items]
+        }
+
+    def _paginated(self, items: List[Dict], total: int, page: int, limit: int,
+                   params: Dict) -> Dict:
+        return {
+            'pagination': {
+                'total': total,
+                'page': page,
+                'limit': limit,
+                'pages': -(-total // limit) if limit else 0
+            },
+            'items': [self._only_fields(item, params) for item in items]
+        }
+
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    """api.php isteklerini FakeShop'a yönlendirir"""
+
+    protocol_version = 'HTTP/1.1'
+
+    # Başlık ve gövde ayrı yazıldığı için küçük yanıtlarda Nagle + gecikmeli
+    # ACK 40 ms bekletir; gerçek sunucuda bu gecikme yoktur
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, payload: Dict, code: int = 200, compact: bool = True):
+        body = json.dumps(payload, ensure_ascii=False,
+                          indent=None if compact else 4).encode('utf-8')
+
+        # Response::conditional karşılığı: GET yanıtları ETag taşır, istemcinin
+        # elindeki sürümle aynıysa gövdesiz 304 döner
+        etag = None
+        if self.command == 'GET' and code == 200:
+            etag = '"' + hashlib.md5(body).hexdigest() + '"'
+            tags = [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]
+            if etag in tags or '*' in tags:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'private, no-cache')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _success(self, data, message: str = 'İşlem başarılı', code: int = 200):
+        self._send({'success': True, 'message': message, 'data': data}, code,
+                   compact=bool(self.params.get('compact')))
+
+    def _error(self, message: str, code: int = 400):
+        self._send({'success': False, 'message': message, 'errors': None}, code)
+
+    def _parse(self) -> bool:
+        """Sorgu parametrelerini okur ve API anahtarını doğrular"""
+        query = parse_qs(urlparse(self.path).query)
+        self.params = {key: values[0] for key, values in query.items()}
+        self.resource = self.params.pop('resource', None)
+        self.record_id = int(self.params.pop('id')) if 'id' in self.params else None
+
+        if self.headers.get('X-API-Key') != self.server.api_key:
+            self._error('Geçersiz API anahtarı', 401)
+            return False
+        if self.resource not in ('products', 'orders'):
+            self._error(f'Geçersiz resource: {self.resource}', 404)
+            return False
+        return True
+
+    def _body(self) -> Dict:
+        length = int(self.headers.get('Content-Length', 0))
+        return json.loads(self.rfile.read(length) or b'{}')
+
+    def do_GET(self):
+        if not self._parse():
+            return
+        shop = self.server.shop
+        if self.resource == 'products':
+            if self.record_id:
+                product = shop.get_product(self.record_id, self.params)
+                if product is None:
+                    return self._error('Ürün bulunamadı', 404)
+                return self._success(product, 'Ürün başarıyla getirildi')
+            return self._success(shop.list_products(self.params), 'Ürünler başarıyla getirildi')
+
+        if self.record_id:
+            order = shop.get_order(self.record_id, self.params)
+            if order is None:
+                return self._error('Sipariş bulunamadı', 404)
+            return self._success(order, 'Sipariş başarıyla getirildi')
+        return self._success(shop.list_orders(self.params), 'Siparişler başarıyla getirildi')
+
+    def do_POST(self):
+        if not self._parse():
+            return
+        data = self._body()
+        if self.resource != 'products':
+            return self._error('Sipariş oluşturma API üzerinden desteklenmiyor', 405)
+        if not data.get('name'):
+            return self._error('Ürün adı zorunludur', 400)
+        self._success(self.server.shop.create_product(data), 'Ürün oluşturuldu', 201)
+
+    def do_PUT(self):
+        if not self._parse():
+            return
+        data = self._body()
+        shop = self.server.shop
+        if self.resource == 'products':
+            if self.record_id is None and 'items' in data:
+                return self._success(shop.bulk_update_products(data['items']),
+                                     'Toplu güncelleme tamamlandı')
+            if self.record_id is None:
+                return self._error('ID gerekli', 400)
+            if not shop.update_product(self.record_id, data):
+                return self._error('Ürün bulunamadı', 404)
+            return self._success({'id_product': self.record_id,
+                                  'message': 'Ürün başarıyla güncellendi'}, 'Ürün güncellendi')
+
+        if self.record_id is None and 'items' in data:
+            if len(data['items']) > 100:
+                return self._error('Tek istekte en fazla 100 sipariş güncellenebilir', 400)
+            return self._success(shop.bulk_update_orders(data['items']),
+                                 'Toplu güncelleme tamamlandı')
+        if self.record_id is None:
+            return self._error('ID gerekli', 400)
+        if not shop.update_order(self.record_id, data):
+            return self._error('Sipariş bulunamadı', 404)
+        self._success({'id_order': self.record_id,
+                       'message': 'Sipariş başarıyla güncellendi'}, 'Sipariş güncellendi')
+
+    def do_DELETE(self):
+        if not self._parse():
+            return
+        if self.record_id is None:
+            return self._error('ID gerekli', 400)
+        shop = self.server.shop
+        if self.resource == 'products':
+            if not shop.delete_product(self.record_id):
+                return self._error('Ürün bulunamadı', 404)
+            return self._success({'id_product': self.record_id,
+                                  'message': 'Ürün başarıyla silindi'}, 'Ürün silindi')
+        if not shop.delete_order(self.record_id):
+            return self._error('Sipariş bulunamadı', 404)
+        self._success({'id_order': self.record_id,
+                       'message': 'Sipariş başarıyla silindi'}, 'Sipariş silindi')
+
+
+class FakeAPIServer(ThreadingHTTPServer):
+    """Arka planda çalışan sahte api.php sunucusu"""
+
+    daemon_threads = True
+
+    def __init__(self, shop: FakeShop, api_key: str = 'bench-key',
+                 host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), FakeAPIHandler)
+        self.shop = shop
+        self.api_key = api_key
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}/api.php'
+
+    def start(self) -> 'FakeAPIServer':
+        """Sunucuyu arka plan thread'inde başlatır"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Sunucuyu durdurur"""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
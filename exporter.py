@@ -0,0 +1,308 @@
+"""
+Dışa Aktarma
+Ürün ve siparişleri (sipariş satırlarıyla) sayfa sayfa çekip CSV, NDJSON veya
+Parquet dosyasına parça parça yazar; veri kümesinin tamamı bellekte tutulmaz
+"""
+
+import csv
+import json
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from api_client import PrestaShopAPIClient
+from models import (Order, OrderBatch, OrderLine, OrderLineBatch, Product, ProductBatch,
+                    RecordBatch)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet opsiyoneldir
+    pa = pq = None
+
+FORMATS = {'.csv': 'csv', '.ndjson': 'ndjson', '.jsonl': 'ndjson', '.parquet': 'parquet'}
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Sipariş satırları için detay isteğinde sadece bu alanlar istenir
+_LINE_FIELDS = ['id_order', 'products']
+
+
+def detect_format(path: str, fmt: Optional[str] = None) -> str:
+    """Biçimi parametreden veya dosya uzantısından belirler"""
+    fmt = fmt or FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt not in ('csv', 'ndjson', 'parquet'):
+        raise ValueError(f"Desteklenmeyen dışa aktarma biçimi: {fmt or path}")
+    if fmt == 'parquet' and pa is None:
+        raise Exception("Parquet için pyarrow gerekli: pip install pyarrow")
+    return fmt
+
+
+def lines_path(path: str) -> str:
+    """Sipariş satırlarının yazılacağı dosya: orders.csv -> orders_lines.csv"""
+    stem, ext = os.path.splitext(path)
+    return f"{stem}_lines{ext}"
+
+
+# ============= YAZICILAR =============
+# Her yazıcı bir RecordBatch parçası alır; dosya önce .part adıyla yazılır,
+# başarıyla kapanınca asıl adına taşınır (yarım dosya kalmaz)
+
+class _Writer:
+    def __init__(self, path: str, batch_type: Type[RecordBatch]):
+        self.path = path
+        self.batch_type = batch_type
+        self.columns = list(batch_type.COLUMNS)
+        self.rows = 0
+        self._tmp = path + '.part'
+
+    def write(self, batch: RecordBatch):
+        self._write(batch)
+        self.rows += len(batch)
+
+    def _write(self, batch: RecordBatch):
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
+
+    def close(self, commit: bool = True):
+        self._close()
+        if commit:
+            os.replace(self._tmp, self.path)
+        elif os.path.exists(self._tmp):
+            os.remove(self._tmp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(commit=exc_type is None)
+
+
+def _text_column(batch: RecordBatch, name: str) -> List:
+    """Sütunu CSV/JSON'a yazılacak düz değerlere çevirir"""
+    kind = batch.COLUMNS[name]
+    column = batch.column(name)
+    if kind == 'date':
+        return [None if math.isnan(value) else
+                (_EPOCH + timedelta(seconds=value)).strftime('%Y-%m-%d %H:%M:%S')
+                for value in column]
+    if kind == 'd':
+        return [None if math.isnan(value) else value for value in column]
+    if kind == 'b':
+        return [bool(value) for value in column]
+    return column
+
+
+class CSVWriter(_Writer):
+    """UTF-8 (BOM'lu, Excel uyumlu) CSV"""
+
+    def __init__(self, path: str, batch_type: Type[RecordBatch]):
+        super().__init__(path, batch_type)
+        self._file = open(self._tmp, 'w', newline='', encoding='utf-8-sig')
+        self._csv = csv.writer(self._file)
+        self._csv.writerow(self.columns)
+
+    def _write(self, batch: RecordBatch):
+        columns = []
+        for name in self.columns:
+            values = _text_column(batch, name)
+            if batch.COLUMNS[name] == 'b':
+                values = [int(value) for value in values]
+            columns.append(values)
+        self._csv.writerows(zip(*columns))
+
+    def _close(self):
+        self._file.close()
+
+
+class NDJSONWriter(_Writer):
+    """Satır başına bir JSON nesnesi"""
+
+    def __init__(self, path: str, batch_type: Type[RecordBatch]):
+        super().__init__(path, batch_type)
+        self._file = open(self._tmp, 'w', encoding='utf-8')
+
+    def _write(self, batch: RecordBatch):
+        columns = [_text_column(batch, name) for name in self.columns]
+        dumps = json.JSONEncoder(ensure_ascii=False).encode
+        self._file.writelines(dumps(dict(zip(self.columns, row))) + '\n'
+                              for row in zip(*columns))
+
+    def _close(self):
+        self._file.close()
+
+
+class ParquetWriter(_Writer):
+    """Parquet; her parça bir row group olur (pyarrow gerekir)"""
+
+    def __init__(self, path: str, batch_type: Type[RecordBatch]):
+        super().__init__(path, batch_type)
+        types = {'q': pa.int64(), 'd': pa.float64(), 'b': pa.bool_(), 'str': pa.string(),
+                 'istr': pa.string(), 'date': pa.timestamp('s')}
+        self._types = {name: types[kind] for name, kind in batch_type.COLUMNS.items()}
+        self._schema = pa.schema([(name, self._types[name]) for name in self.columns])
+        self._writer = pq.ParquetWriter(self._tmp, self._schema)
+
+    def _write(self, batch: RecordBatch):
+        arrays = []
+        for name in self.columns:
+            kind = batch.COLUMNS[name]
+            column = batch.column(name)
+            if kind == 'date':
+                column = [None if math.isnan(value) else int(value) for value in column]
+            elif kind == 'd':
+                column = [None if math.isnan(value) else value for value in column]
+            elif kind == 'b':
+                column = [bool(value) for value in column]
+            arrays.append(pa.array(column, type=self._types[name]))
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def _close(self):
+        self._writer.close()
+
+
+WRITERS = {'csv': CSVWriter, 'ndjson': NDJSONWriter, 'parquet': ParquetWriter}
+
+
+# ============= DIŞA AKTARMA =============
+
+def _ordered_map(fn: Callable, items: Iterable, workers: int) -> Iterator[Tuple]:
+    """fn'i `workers` thread ile uygular, (girdi, sonuç) çiftlerini girdi sırasıyla verir
+
+    En fazla 2 * workers iş önden gönderilir; bellek kullanımı sınırlıdır.
+    """
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        try:
+            for item in islice(iterator, workers * 2):
+                pending.append((item, pool.submit(fn, item)))
+            while pending:
+                item, future = pending.popleft()
+                for nxt in islice(iterator, 1):
+                    pending.append((nxt, pool.submit(fn, nxt)))
+                yield item, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def _iter_items(iter_all: Callable, workers: int, **filters) -> Iterator[Dict]:
+    """Paralel sayfa çekme (workers > 1) veya sıralı akış halinde cursor taraması"""
+    if workers > 1:
+        return iter_all(limit=100, workers=workers, **filters)
+    return iter_all(cursor=True, stream=True, **filters)
+
+
+def _write_chunks(writers: List[_Writer], chunks: Iterable[List[RecordBatch]],
+                  progress: Optional[Callable[[int], None]]):
+    for batches in chunks:
+        for writer, batch in zip(writers, batches):
+            writer.write(batch)
+        if progress is not None:
+            progress(writers[0].rows)
+
+
+def export_products(api: PrestaShopAPIClient, path: str, fmt: Optional[str] = None,
+                    chunk_size: int = 1000, workers: int = 4, since: str = None,
+                    active: int = None,
+                    progress: Optional[Callable[[int], None]] = None) -> Dict:
+    """
+    Tüm ürünleri dosyaya aktarır
+
+    Args:
+        api: API client
+        path: Hedef dosya; biçim verilmezse uzantıdan belirlenir
+        fmt: csv, ndjson veya parquet
+        chunk_size: Diske tek seferde yazılan kayıt sayısı
+        workers: Paralel sayfa isteği (1 = sıralı, akış halinde cursor taraması)
+        since: Sadece bu tarihten sonra güncellenenler ('YYYY-MM-DD HH:MM:SS')
+        active: 1/0 ile sadece aktif/pasif ürünler
+        progress: Her parçadan sonra yazılan toplam kayıt sayısıyla çağrılır
+
+    Returns:
+        {'rows', 'seconds', 'rows_per_second', 'files'}
+    """
+    fmt = detect_format(path, fmt)
+    started = time.perf_counter()
+    records = (Product.from_api(item)
+               for item in _iter_items(api.iter_all_products, workers, since=since,
+                                       active=active))
+
+    def chunks():
+        while True:
+            batch = ProductBatch(islice(records, chunk_size))
+            if not len(batch):
+                return
+            yield [batch]
+
+    with WRITERS[fmt](path, ProductBatch) as writer:
+        _write_chunks([writer], chunks(), progress)
+
+    return _stats(writer.rows, started, [path])
+
+
+def export_orders(api: PrestaShopAPIClient, path: str, fmt: Optional[str] = None,
+                  lines: bool = True, chunk_size: int = 1000, workers: int = 4,
+                  since: str = None, status: int = None,
+                  progress: Optional[Callable[[int], None]] = None) -> Dict:
+    """
+    Tüm siparişleri, istenirse satırlarıyla dosyaya aktarır
+
+    Satırlar ayrı bir dosyaya (orders.csv -> orders_lines.csv) id_order
+    sütunuyla yazılır. Her siparişin satırları detay isteğiyle alınır; bu
+    istekler `workers` thread ile paralel ve sipariş sırasıyla yapılır.
+    Diğer parametreler export_products ile aynıdır.
+
+    Returns:
+        {'rows', 'lines', 'seconds', 'rows_per_second', 'files'}
+    """
+    fmt = detect_format(path, fmt)
+    started = time.perf_counter()
+    orders = (Order.from_api(item)
+              for item in _iter_items(api.iter_all_orders, workers, since=since,
+                                      status=status))
+
+    def fetch_lines(order: Order) -> List[OrderLine]:
+        detail = api.get_order(order.id_order, fields=_LINE_FIELDS)['data']
+        return [OrderLine.from_api(line, order.id_order)
+                for line in detail.get('products') or ()]
+
+    def chunks():
+        pairs = _ordered_map(fetch_lines, orders, max(1, workers)) if lines else \
+            ((order, ()) for order in orders)
+        while True:
+            order_batch, line_batch = OrderBatch(), OrderLineBatch()
+            for order, order_lines in islice(pairs, chunk_size):
+                order_batch.append(order)
+                line_batch.extend(order_lines)
+            if not len(order_batch):
+                return
+            yield [order_batch, line_batch]
+
+    files = [path]
+    writer_type = WRITERS[fmt]
+    with writer_type(path, OrderBatch) as writer:
+        if lines:
+            files.append(lines_path(path))
+            with writer_type(files[1], OrderLineBatch) as line_writer:
+                _write_chunks([writer, line_writer], chunks(), progress)
+        else:
+            _write_chunks([writer], chunks(), progress)
+
+    result = _stats(writer.rows, started, files)
+    result['lines'] = line_writer.rows if lines else 0
+    return result
+
+
+def _stats(rows: int, started: float, files: List[str]) -> Dict:
+    seconds = time.perf_counter() - started
+    return {'rows': rows, 'seconds': seconds,
+            'rows_per_second': rows / seconds if seconds else 0.0, 'files': files}
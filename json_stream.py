@@ -0,0 +1,232 @@
+"""
+Akış Halinde JSON Çözme
+Liste yanıtlarındaki `data.items` dizisini baytlar geldikçe kayıt kayıt çözer
+"""
+
+import codecs
+import json
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from api_errors import InvalidResponseError
+
+_WHITESPACE = json.decoder.WHITESPACE
+_decoder = json.JSONDecoder()
+_DELIMITERS = frozenset(' \t\n\r,:]}')
+
+# Tüketilmiş kısmı bu kadar büyüyünce tampon kırpılır
+_COMPACT_AT = 64 * 1024
+
+
+class StreamingItemParser:
+    """Besleme (push) tabanlı artımlı JSON ayrıştırıcı
+
+    Kök nesnede `path` boyunca ilerler, yoldaki son anahtarın dizisini eleman
+    eleman döndürür. Diğer değerler (success, message, pagination...) tek
+    parça çözülüp `document` içine yazılır; akıtılan dizinin yerinde boş liste
+    kalır. Bellekte sadece henüz tamamlanmamış eleman kadar metin tutulur.
+    """
+
+    def __init__(self, path: Tuple[str, ...] = ('data', 'items')):
+        self.path = path
+        self.document: Dict = {}
+        self.done = False
+        self._decode = codecs.getincrementaldecoder('utf-8')().decode
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self._stack: List[Dict] = []
+        self._state = 'start'
+        self._key = None
+
+    def feed(self, data: bytes) -> List:
+        """Gelen baytları ekler, tamamlanan elemanları döndürür"""
+        self._buf += self._decode(data)
+        return self._parse()
+
+    def close(self) -> List:
+        """Akış bitti: kalanları çözer, belge tamamlanmadıysa hata verir"""
+        self._buf += self._decode(b'', final=True)
+        self._eof = True
+        items = self._parse()
+        if not self.done:
+            raise InvalidResponseError("Geçersiz API yanıtı (eksik JSON)")
+        return items
+
+    def _parse(self) -> List:
+        items = []
+        buf = self._buf
+        while not self.done:
+            pos = _WHITESPACE.match(buf, self._pos).end()
+            self._pos = pos
+            if pos >= len(buf):
+                break
+            char = buf[pos]
+            state = self._state
+
+            if state == 'start':
+                if char != '{':
+                    raise InvalidResponseError("Geçersiz API yanıtı")
+                self._stack.append(self.document)
+                self._pos += 1
+                self._state = 'key'
+
+            elif state == 'key':
+                if char == ',':
+                    self._pos += 1
+                elif char == '}':
+                    self._pos += 1
+                    self._stack.pop()
+                    self.done = not self._stack
+                else:
+                    key = self._value(buf, pos)
+                    if key is None:
+                        break
+                    self._key = key
+                    self._state = 'colon'
+
+            elif state == 'colon':
+                if char != ':':
+                    raise InvalidResponseError("Geçersiz API yanıtı")
+                self._pos += 1
+                self._state = 'value'
+
+            elif state == 'value':
+                depth = len(self._stack)
+                parent = self._stack[-1]
+                on_path = depth <= len(self.path) and self._key == self.path[depth - 1]
+                if on_path and depth < len(self.path) and char == '{':
+                    # Yol üzerindeki nesneye in
+                    parent[self._key] = child = {}
+                    self._stack.append(child)
+                    self._pos += 1
+                    self._state = 'key'
+                elif on_path and depth == len(self.path) and char == '[':
+                    parent[self._key] = []
+                    self._pos += 1
+                    self._state = 'array'
+                else:
+                    value = self._value(buf, pos)
+                    if value is None and self._pos == pos:
+                        break
+                    parent[self._key] = value
+                    self._state = 'key'
+
+            else:  # array
+                if char == ',':
+                    self._pos += 1
+                elif char == ']':
+                    self._pos += 1
+                    self._state = 'key'
+                else:
+                    start = self._pos
+                    item = self._value(buf, pos)
+                    if item is None and self._pos == start:
+                        break
+                    items.append(item)
+                    if self._pos > _COMPACT_AT:
+                        buf = self._buf = buf[self._pos:]
+                        self._pos = 0
+
+        return items
+
+    def _value(self, buf: str, pos: int):
+        """
+        pos'taki tam JSON değerini çözer ve imleci ilerletir
+
+        Değer henüz tamamlanmadıysa None döner ve imleç yerinde kalır (null
+        değeri de None'dır; çağıran imlecin ilerleyip ilerlemediğine bakar).
+        """
+        try:
+            value, end = _decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if self._eof:
+                raise InvalidResponseError("Geçersiz API yanıtı")
+            return None
+        # Ardından ayraç gelmeyen sayı yarım gelmiş olabilir ("12" -> "12.5")
+        if not self._eof and (end >= len(buf) or buf[end] not in _DELIMITERS):
+            return None
+        self._pos = end
+        return value
+
+
+class ItemStream:
+    """Akış halinde çözülen liste yanıtı
+
+    Üzerinde dönüldükçe `data.items` elemanlarını tek tek verir; yanıt bitince
+    veya `close()` ile bağlantı bırakılır. `pagination` ilk erişimde gerekirse
+    sayfalama bloğuna kadar önden okur (API onu items'tan önce gönderir, bu
+    yüzden ek bellek gerekmez). Sadece bir kez dönülebilir.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], close: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            chunks: Yanıt gövdesi parçaları (sıkıştırması açılmış)
+            close: Akış bittiğinde veya kapatıldığında çağrılacak fonksiyon
+        """
+        self._chunks = iter(chunks)
+        self._close = close
+        self._parser = StreamingItemParser()
+        self._ready = deque()
+        self._iterating = False
+
+    @property
+    def document(self) -> Dict:
+        """items dışındaki yanıt alanları (şu ana kadar okunanlar)"""
+        return self._parser.document
+
+    @property
+    def pagination(self) -> Optional[Dict]:
+        """Sayfalama bloğu; gerekirse gövde o noktaya kadar okunur"""
+        while 'pagination' not in self._data() and self._pull():
+            pass
+        return self._data().get('pagination')
+
+    def _data(self) -> Dict:
+        data = self.document.get('data')
+        return data if isinstance(data, dict) else {}
+
+    def _pull(self) -> bool:
+        """Bir parça okuyup çözer, okunacak parça kalmadıysa False"""
+        if self._parser.done:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            try:
+                self._ready.extend(self._parser.close())
+            finally:
+                self.close()
+            return False
+        except BaseException:
+            self.close()
+            raise
+        self._ready.extend(self._parser.feed(chunk))
+        return True
+
+    def __iter__(self) -> Iterator[Dict]:
+        if self._iterating:
+            raise RuntimeError("ItemStream sadece bir kez dönülebilir")
+        self._iterating = True
+        try:
+            while True:
+                while self._ready:
+                    yield self._ready.popleft()
+                if not self._pull():
+                    break
+            yield from self._ready
+        finally:
+            self.close()
+
+    def close(self):
+        """Bağlantıyı bırakır (okunmamış gövde atılır)"""
+        if self._close is not None:
+            close, self._close = self._close, None
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
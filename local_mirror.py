@@ -0,0 +1,234 @@
+"""
+Yerel Ayna (Mirror)
+Ürün ve siparişlerin yerel SQLite kopyasını artımlı olarak senkronize eder
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
+
+from api_client import PrestaShopAPIClient
+
+
+class LocalMirror:
+    """Ürün ve siparişlerin yerel SQLite aynası
+
+    Her senkronizasyonda sadece son senkronizasyondan sonra değişen kayıtlar
+    (`since=<date_upd>`) çekilir. Sunucudan silinen kayıtlar satır silinmeden
+    `deleted_at` ile işaretlenir (tombstone). PrestaShop silme kaydı
+    tutmadığı için silmeler `reconcile=True` ile ID listesi karşılaştırılarak
+    veya `mark_deleted()` ile bulunur.
+    """
+
+    # resource: (ID alanı, client sayfa metodu, client iterator metodu)
+    RESOURCES = {
+        'products': ('id_product', 'get_products', 'iter_all_products'),
+        'orders': ('id_order', 'get_orders', 'iter_all_orders'),
+    }
+
+    BATCH_SIZE = 500
+
+    def __init__(self, api: PrestaShopAPIClient, path: str = 'mirror.db'):
+        """
+        Aynayı açar, tablolar yoksa oluşturur
+
+        Args:
+            api: Senkronizasyonda kullanılacak API client
+            path: SQLite dosya yolu (':memory:' = sadece bellekte)
+        """
+        self.api = api
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._create_schema()
+
+    def _create_schema(self):
+        """Tabloları oluşturur"""
+        with self._lock:
+            for resource in self.RESOURCES:
+                self.db.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {resource} (
+                        id INTEGER PRIMARY KEY,
+                        date_upd TEXT,
+                        deleted_at TEXT,
+                        data TEXT NOT NULL
+                    )
+                """)
+            self.db.execute("""
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    resource TEXT PRIMARY KEY,
+                    high_water TEXT,
+                    synced_at TEXT
+                )
+            """)
+            self.db.commit()
+
+    def close(self):
+        """Veritabanı bağlantısını kapatır"""
+        self.db.close()
+
+    # ============= SENKRONİZASYON =============
+
+    def sync(self, resources: Iterable[str] = ('products', 'orders'),
+             reconcile: bool = False) -> Dict[str, Dict[str, int]]:
+        """
+        Aynayı sunucuyla senkronize eder
+
+        Args:
+            resources: Senkronize edilecek resource'lar
+            reconcile: Sunucudaki ID listesini çekip artık olmayan kayıtları
+                silinmiş olarak işaretle (tüm ID'leri çeker, daha pahalıdır)
+
+        Returns:
+            Resource başına {'upserted': n, 'deleted': m}
+        """
+        stats = {}
+        for resource in resources:
+            stats[resource] = {
+                'upserted': self._sync_changes(resource),
+                'deleted': self._reconcile(resource) if reconcile else 0,
+            }
+        return stats
+
+    def _sync_changes(self, resource: str) -> int:
+        """High-water mark'tan sonra değişen kayıtları uygular"""
+        id_field, page_name, iterator_name = self.RESOURCES[resource]
+        high_water = self.high_water(resource)
+
+        # Yeni high-water mark, taramadan önce okunan sunucu saatidir. Tarama
+        # ID sırasıyla canlı tabloda ilerlediği için görülen en büyük date_upd
+        # kullanılamaz: taranmış bir kayıt sonradan değişirse, daha geç
+        # değişen düşük ID'li bir kayıt işareti onun üstüne taşır
+        new_high_water = self._server_time(page_name, id_field) or high_water
+
+        # since kapsayıcıdır (>=): aynı saniyede güncellenen kayıtlar kaçmaz,
+        # tekrar gelenler upsert ile zararsızca yeniden yazılır
+        items = getattr(self.api, iterator_name)(cursor=True, stream=True, since=high_water)
+
+        upserted = 0
+        while True:
+            batch = list(islice(items, self.BATCH_SIZE))
+            if not batch:
+                break
+
+            rows = []
+            for item in batch:
+                rows.append((int(item[id_field]), item.get('date_upd'),
+                             json.dumps(item, ensure_ascii=False)))
+
+            with self._lock:
+                self.db.executemany(f"""
+                    INSERT INTO {resource} (id, date_upd, deleted_at, data)
+                    VALUES (?, ?, NULL, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        date_upd = excluded.date_upd,
+                        deleted_at = NULL,
+                        data = excluded.data
+                """, rows)
+                self.db.commit()
+            upserted += len(rows)
+
+        # High-water mark sadece tüm değişiklikler yazıldıktan sonra ilerler
+        with self._lock:
+            self.db.execute("""
+                INSERT INTO sync_state (resource, high_water, synced_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(resource) DO UPDATE SET
+                    high_water = excluded.high_water,
+                    synced_at = excluded.synced_at
+            """, (resource, new_high_water, datetime.now().isoformat(timespec='seconds')))
+            self.db.commit()
+
+        return upserted
+
+    def _server_time(self, page_name: str, id_field: str) -> Optional[str]:
+        """Sunucu saati (cursor sayfalama bloğundaki server_time)
+
+        Sunucu göndermiyorsa (eski API) None döner; işaret ilerlemez ve
+        sonraki senkronizasyon aynı tarihten tekrar başlar.
+        """
+        page = getattr(self.api, page_name)(limit=1, after_id=0, fields=[id_field], stream=True)
+        with page:
+            return (page.pagination or {}).get('server_time')
+
+    def _reconcile(self, resource: str) -> int:
+        """Sunucuda artık olmayan kayıtları tombstone olarak işaretler"""
+        id_field, _, iterator_name = self.RESOURCES[resource]
+        # Ağ taraması kilit dışında yapılır; okumalar tarama boyunca beklemez
+        items = getattr(self.api, iterator_name)(cursor=True, stream=True, fields=[id_field])
+        live_ids = [(int(item[id_field]),) for item in items]
+
+        with self._lock:
+            self.db.execute("CREATE TEMP TABLE IF NOT EXISTS live_ids (id INTEGER PRIMARY KEY)")
+            self.db.execute("DELETE FROM live_ids")
+            self.db.executemany("INSERT OR IGNORE INTO live_ids (id) VALUES (?)", live_ids)
+
+            cursor = self.db.execute(f"""
+                UPDATE {resource} SET deleted_at = ?
+                WHERE deleted_at IS NULL AND id NOT IN (SELECT id FROM live_ids)
+            """, (datetime.now().isoformat(timespec='seconds'),))
+            self.db.execute("DELETE FROM live_ids")
+            self.db.commit()
+            return cursor.rowcount
+
+    def mark_deleted(self, resource: str, record_id: int):
+        """Bir kaydı silinmiş olarak işaretler (client üzerinden silinenler için)"""
+        with self._lock:
+            self.db.execute(
+                f"UPDATE {resource} SET deleted_at = ? WHERE id = ? AND deleted_at IS NULL",
+                (datetime.now().isoformat(timespec='seconds'), int(record_id))
+            )
+            self.db.commit()
+
+    def high_water(self, resource: str) -> Optional[str]:
+        """Son başarılı senkronizasyonun başladığı sunucu saati"""
+        with self._lock:
+            row = self.db.execute(
+                "SELECT high_water FROM sync_state WHERE resource = ?", (resource,)
+            ).fetchone()
+        return row['high_water'] if row else None
+
+    # ============= OKUMA =============
+
+    def _all(self, resource: str, include_deleted: bool) -> List[Dict]:
+        where = '' if include_deleted else 'WHERE deleted_at IS NULL'
+        with self._lock:
+            rows = self.db.execute(
+                f"SELECT data FROM {resource} {where} ORDER BY id DESC"
+            ).fetchall()
+        return [json.loads(row['data']) for row in rows]
+
+    def _one(self, resource: str, record_id: int) -> Optional[Dict]:
+        with self._lock:
+            row = self.db.execute(
+                f"SELECT data FROM {resource} WHERE id = ? AND deleted_at IS NULL",
+                (int(record_id),)
+            ).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def products(self, include_deleted: bool = False) -> List[Dict]:
+        """Aynadaki ürünleri döndürür (en yeni ID önce)"""
+        return self._all('products', include_deleted)
+
+    def get_product(self, product_id: int) -> Optional[Dict]:
+        """Aynadaki tek bir ürünü döndürür"""
+        return self._one('products', product_id)
+
+    def orders(self, include_deleted: bool = False) -> List[Dict]:
+        """Aynadaki siparişleri döndürür (en yeni ID önce)"""
+        return self._all('orders', include_deleted)
+
+    def get_order(self, order_id: int) -> Optional[Dict]:
+        """Aynadaki tek bir siparişi döndürür"""
+        return self._one('orders', order_id)
+
+    def tombstones(self, resource: str) -> List[Dict]:
+        """Silinmiş olarak işaretlenen kayıtların ID ve silinme zamanları"""
+        with self._lock:
+            rows = self.db.execute(
+                f"SELECT id, deleted_at FROM {resource} WHERE deleted_at IS NOT NULL"
+            ).fetchall()
+        return [dict(row) for row in rows]
@@ -0,0 +1,223 @@
+"""
+API Metrikleri
+İstek gecikmesi, veri boyutu, hata, tekrar ve önbellek sayaçlarını toplar
+"""
+
+import bisect
+import threading
+from collections import defaultdict
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+# Gecikme histogram sınırları (saniye)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# JSON çözme süresi histogram sınırları (saniye)
+DECODE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+
+PREFIX = 'prestashop_api_'
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Sabit sınırlı (bucket) histogram"""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # son eleman: +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        """Değeri ilgili aralığa ekler"""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Iterator[Tuple[float, int]]:
+        """(üst sınır, o sınıra kadarki toplam) çiftleri, Prometheus sırasıyla"""
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            yield bound, total
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Aralık içinde doğrusal varsayımla yüzdelik tahmini (histogram_quantile gibi)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        lower, seen = 0.0, 0
+        for bound, count in zip(self.buckets, self.counts):
+            if seen + count >= rank:
+                return lower + (bound - lower) * (rank - seen) / count
+            lower, seen = bound, seen + count
+        # +Inf aralığındaki değerler için en büyük sınır döndürülür
+        return self.buckets[-1]
+
+
+class MetricsRegistry:
+    """API client metrik kayıt defteri
+
+    Client hook'larına bağlanır (`attach`) ve şunları tutar:
+    resource başına istek/yanıt/hata sayaçları, gecikme ve JSON çözme
+    histogramları, gelen/giden bayt, tekrar denemeler ve önbellek isabetleri.
+    `to_prometheus()` Prometheus metin formatında, `to_dict()` sözlük olarak
+    dışa aktarır. Thread-safe'tir.
+    """
+
+    def __init__(self):
+        self._counters: Dict[Tuple[str, Labels], float] = defaultdict(int)
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._lock = threading.Lock()
+
+    # ============= TEMEL İŞLEMLER =============
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """Sayacı artırır"""
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            self._counters[key] += value
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = LATENCY_BUCKETS,
+                **labels):
+        """Histograma değer ekler"""
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def reset(self):
+        """Tüm metrikleri sıfırlar"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    # ============= CLIENT HOOK'LARI =============
+
+    def attach(self, client):
+        """Metrikleri client'ın hook'larına bağlar"""
+        client.add_hook('before_send', self.before_send)
+        client.add_hook('after_receive', self.after_receive)
+        client.add_hook('on_error', self.on_error)
+
+    def before_send(self, ctx: Dict):
+        resource = ctx['resource']
+        self.inc('requests_total', resource=resource, method=ctx['method'])
+        if ctx['attempt'] > 0:
+            self.inc('retries_total', resource=resource)
+
+    def after_receive(self, ctx: Dict):
+        resource = ctx['resource']
+        self.inc('responses_total', resource=resource, status=ctx['status'])
+        self.inc('bytes_in_total', ctx['bytes_in'], resource=resource)
+        self.inc('bytes_out_total', ctx['bytes_out'], resource=resource)
+        self.observe('request_duration_seconds', ctx['elapsed'], resource=resource)
+        if ctx.get('decode_time') is not None:
+            self.observe('json_decode_seconds', ctx['decode_time'], DECODE_BUCKETS,
+                         resource=resource)
+        if ctx['status'] == 304:
+            self.record_cache_hit(resource, 'etag')
+
+    def on_error(self, ctx: Dict):
+        self.inc('errors_total', resource=ctx['resource'], error=type(ctx['error']).__name__)
+
+    def record_cache_hit(self, resource: str, kind: str):
+        """Önbellek isabetini kaydeder (kind: memory, etag)"""
+        self.inc('cache_hits_total', resource=resource, kind=kind)
+
+    # ============= DIŞA AKTARMA =============
+
+    def to_dict(self) -> Dict:
+        """Tüm metrikleri sözlük olarak döndürür"""
+        with self._lock:
+            counters = defaultdict(list)
+            for (name, labels), value in sorted(self._counters.items()):
+                counters[name].append({'labels': dict(labels), 'value': value})
+
+            histograms = defaultdict(list)
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                histograms[name].append({
+                    'labels': dict(labels),
+                    'count': histogram.count,
+                    'sum': histogram.sum,
+                    'p50': histogram.quantile(0.5),
+                    'p95': histogram.quantile(0.95),
+                    'p99': histogram.quantile(0.99),
+                    'buckets': {_format_bound(bound): total
+                                for bound, total in histogram.cumulative()},
+                })
+
+        return {'counters': dict(counters), 'histograms': dict(histograms)}
+
+    def to_prometheus(self) -> str:
+        """Metrikleri Prometheus metin formatında döndürür"""
+        lines = []
+        with self._lock:
+            typed = set()
+            for (name, labels), value in sorted(self._counters.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {PREFIX}{name} counter")
+                    typed.add(name)
+                lines.append(f"{PREFIX}{name}{_format_labels(labels)} {_format_value(value)}")
+
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {PREFIX}{name} histogram")
+                    typed.add(name)
+                for bound, total in histogram.cumulative():
+                    bucket_labels = labels + (('le', _format_bound(bound)),)
+                    lines.append(f"{PREFIX}{name}_bucket{_format_labels(bucket_labels)} {total}")
+                lines.append(f"{PREFIX}{name}_sum{_format_labels(labels)} "
+                             f"{_format_value(histogram.sum)}")
+                lines.append(f"{PREFIX}{name}_count{_format_labels(labels)} {histogram.count}")
+
+        return '\n'.join(lines) + '\n'
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        Resource başına özet (arayüzdeki durum paneli için)
+
+        Returns:
+            {resource: {'requests', 'errors', 'error_rate', 'retries', 'cache_hits',
+                        'bytes_in', 'bytes_out', 'p50', 'p95'}}
+        """
+        result = defaultdict(lambda: {'requests': 0, 'errors': 0, 'retries': 0,
+                                      'cache_hits': 0, 'bytes_in': 0, 'bytes_out': 0,
+                                      'p50': None, 'p95': None})
+        fields = {'requests_total': 'requests', 'errors_total': 'errors',
+                  'retries_total': 'retries', 'cache_hits_total': 'cache_hits',
+                  'bytes_in_total': 'bytes_in', 'bytes_out_total': 'bytes_out'}
+
+        with self._lock:
+            for (name, labels), value in self._counters.items():
+                if name in fields:
+                    result[dict(labels)['resource']][fields[name]] += value
+            for (name, labels), histogram in self._histograms.items():
+                if name == 'request_duration_seconds':
+                    row = result[dict(labels)['resource']]
+                    row['p50'] = histogram.quantile(0.5)
+                    row['p95'] = histogram.quantile(0.95)
+
+        for row in result.values():
+            row['error_rate'] = row['errors'] / row['requests'] if row['requests'] else 0.0
+        return dict(result)
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    parts = []
+    for key, value in labels:
+        value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{key}="{value}"')
+    return '{' + ','.join(parts) + '}'
+
+
+def _format_bound(bound: float) -> str:
+    return '+Inf' if bound == float('inf') else repr(float(bound))
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
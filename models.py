@@ -0,0 +1,373 @@
+"""
+Kayıt Modelleri
+API'nin string tabanlı sözlüklerini bir kez çözülmüş, tipli ve kompakt
+kayıtlara çevirir; büyük listeler için sütunlu (array tabanlı) toplu form
+"""
+
+import math
+import sys
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+# ============= ALAN ÇÖZÜCÜLER =============
+
+def parse_int(value) -> int:
+    """'12', 12, None -> int (boş/geçersiz = 0)"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return 0
+
+
+def parse_float(value) -> float:
+    """'123.450000', None -> float (boş/geçersiz = 0.0)"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def parse_bool(value) -> bool:
+    """'1', 1, True, 'true' -> True"""
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes')
+    return bool(value)
+
+
+def parse_date(value) -> Optional[datetime]:
+    """'YYYY-MM-DD HH:MM:SS' -> datetime ('0000-00-00...' ve boş = None)"""
+    if isinstance(value, datetime):
+        return value
+    if not value or str(value).startswith('0000'):
+        return None
+    try:
+        return datetime.strptime(str(value)[:19], '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        try:
+            return datetime.strptime(str(value)[:10], '%Y-%m-%d')
+        except ValueError:
+            return None
+
+
+def _str(value) -> str:
+    return '' if value is None else str(value)
+
+
+# ============= KAYITLAR =============
+# dataclass + __slots__: kayıt başına sözlük yok, alanlar tipli
+
+@dataclass
+class Product:
+    """Ürün kaydı"""
+
+    __slots__ = ('id_product', 'name', 'reference', 'ean13', 'price', 'wholesale_price',
+                 'price_with_tax', 'stock_quantity', 'active', 'id_category_default',
+                 'category_name', 'description_short', 'description', 'date_add', 'date_upd')
+
+    id_product: int
+    name: str
+    reference: str
+    ean13: str
+    price: float
+    wholesale_price: float
+    price_with_tax: Optional[float]
+    stock_quantity: int
+    active: bool
+    id_category_default: int
+    category_name: str
+    description_short: str
+    description: str
+    date_add: Optional[datetime]
+    date_upd: Optional[datetime]
+
+    @classmethod
+    def from_api(cls, data: Dict) -> 'Product':
+        """API ürün sözlüğünden (liste veya detay) kayıt oluşturur
+
+        `fields` ile istenmemiş alanlar boş değer alır.
+        """
+        stock = data.get('stock_quantity')
+        return cls(
+            id_product=parse_int(data.get('id_product')),
+            name=_str(data.get('name')),
+            reference=_str(data.get('reference')),
+            ean13=_str(data.get('ean13')),
+            price=parse_float(data.get('price')),
+            wholesale_price=parse_float(data.get('wholesale_price')),
+            price_with_tax=(parse_float(data['price_with_tax'])
+                            if data.get('price_with_tax') is not None else None),
+            # Stok tablosunda satır yoksa ürünün kendi miktarı kullanılır
+            stock_quantity=parse_int(stock if stock is not None else data.get('quantity')),
+            active=parse_bool(data.get('active')),
+            id_category_default=parse_int(data.get('id_category_default')),
+            category_name=sys.intern(_str(data.get('category_name'))),
+            description_short=_str(data.get('description_short')),
+            description=_str(data.get('description')),
+            date_add=parse_date(data.get('date_add')),
+            date_upd=parse_date(data.get('date_upd')),
+        )
+
+
+@dataclass
+class OrderLine:
+    """Sipariş satırı"""
+
+    __slots__ = ('id_order_detail', 'id_order', 'product_id', 'product_name',
+                 'product_reference', 'product_ean13', 'product_quantity',
+                 'unit_price_tax_incl', 'unit_price_tax_excl',
+                 'total_price_tax_incl', 'total_price_tax_excl')
+
+    id_order_detail: int
+    id_order: int
+    product_id: int
+    product_name: str
+    product_reference: str
+    product_ean13: str
+    product_quantity: int
+    unit_price_tax_incl: float
+    unit_price_tax_excl: float
+    total_price_tax_incl: float
+    total_price_tax_excl: float
+
+    @classmethod
+    def from_api(cls, data: Dict, id_order: int = 0) -> 'OrderLine':
+        """API sipariş satırı sözlüğünden kayıt oluşturur"""
+        return cls(
+            id_order_detail=parse_int(data.get('id_order_detail')),
+            id_order=parse_int(data.get('id_order', id_order)),
+            product_id=parse_int(data.get('product_id')),
+            product_name=_str(data.get('product_name')),
+            product_reference=_str(data.get('product_reference')),
+            product_ean13=_str(data.get('product_ean13')),
+            product_quantity=parse_int(data.get('product_quantity')),
+            unit_price_tax_incl=parse_float(data.get('unit_price_tax_incl')),
+            unit_price_tax_excl=parse_float(data.get('unit_price_tax_excl')),
+            total_price_tax_incl=parse_float(data.get('total_price_tax_incl')),
+            total_price_tax_excl=parse_float(data.get('total_price_tax_excl')),
+        )
+
+
+@dataclass
+class Order:
+    """Sipariş kaydı (detay yanıtından oluşturulduysa satırlarıyla)"""
+
+    __slots__ = ('id_order', 'reference', 'id_customer', 'customer_name', 'customer_email',
+                 'current_state', 'status_name', 'payment', 'total_paid',
+                 'total_paid_tax_incl', 'total_paid_tax_excl', 'total_products',
+                 'total_shipping', 'date_add', 'date_upd', 'lines')
+
+    id_order: int
+    reference: str
+    id_customer: int
+    customer_name: str
+    customer_email: str
+    current_state: int
+    status_name: str
+    payment: str
+    total_paid: float
+    total_paid_tax_incl: float
+    total_paid_tax_excl: float
+    total_products: float
+    total_shipping: float
+    date_add: Optional[datetime]
+    date_upd: Optional[datetime]
+    lines: List[OrderLine]
+
+    @classmethod
+    def from_api(cls, data: Dict) -> 'Order':
+        """API sipariş sözlüğünden (liste veya detay) kayıt oluşturur"""
+        id_order = parse_int(data.get('id_order'))
+        # Detay yanıtında müşteri bilgisi iç içe gelir
+        customer = data.get('customer') or {}
+        customer_name = data.get('customer_name')
+        if customer_name is None and customer:
+            customer_name = f"{customer.get('firstname') or ''} {customer.get('lastname') or ''}"
+        return cls(
+            id_order=id_order,
+            reference=_str(data.get('reference')),
+            id_customer=parse_int(data.get('id_customer', customer.get('id_customer'))),
+            customer_name=_str(customer_name).strip(),
+            customer_email=_str(data.get('customer_email', customer.get('email'))),
+            current_state=parse_int(data.get('current_state')),
+            status_name=sys.intern(_str(data.get('status_name'))),
+            payment=sys.intern(_str(data.get('payment'))),
+            total_paid=parse_float(data.get('total_paid')),
+            total_paid_tax_incl=parse_float(data.get('total_paid_tax_incl')),
+            total_paid_tax_excl=parse_float(data.get('total_paid_tax_excl')),
+            total_products=parse_float(data.get('total_products')),
+            total_shipping=parse_float(data.get('total_shipping')),
+            date_add=parse_date(data.get('date_add')),
+            date_upd=parse_date(data.get('date_upd')),
+            lines=[OrderLine.from_api(line, id_order) for line in data.get('products') or ()],
+        )
+
+
+# ============= TABLO SATIRLARI =============
+# Arayüz tablolarının satır değerleri (Tk gerektirmez, benchmark da kullanır)
+
+def product_row_values(product: Product) -> Tuple:
+    """Ürün kaydını (Product) tablo satırına çevirir"""
+    return (
+        product.id_product,
+        product.name or 'İsimsiz',
+        f"{product.price:.2f} ₺",
+        product.stock_quantity,
+        "✓ Aktif" if product.active else "✗ Pasif"
+    )
+
+
+def order_row_values(order: Order) -> Tuple:
+    """Sipariş kaydını (Order) tablo satırına çevirir"""
+    return (
+        order.id_order,
+        order.reference or '-',
+        order.customer_name or 'Bilinmiyor',
+        f"{order.total_paid:.2f} ₺",
+        order.status_name or 'Bilinmiyor',
+        order.date_add.strftime('%Y-%m-%d') if order.date_add else ''  # Sadece tarih
+    )
+
+
+# ============= SÜTUNLU TOPLU FORM =============
+
+# Sütun tipleri: array typecode'u ('d' sütunlarında NaN = None), 'str' (liste)
+# veya 'date' (epoch saniyesi, NaN = yok)
+_DATE = 'date'
+_STR = 'str'
+_INTERNED = 'istr'  # az sayıda farklı değeri olan metin (kategori, durum adı)
+
+
+class RecordBatch:
+    """Kayıtların sütunlu (array tabanlı) tutulduğu toplu form
+
+    Sayısal sütunlar `array`, tarihler epoch saniyesi (`array('d')`), metinler
+    liste olarak saklanır; kayıt başına nesne başlığı olmadığı için büyük
+    anlık görüntüler (ör. 200 bin ürün) sözlüklere göre çok daha az bellek
+    tutar. Kayıtlar `batch[i]` ile tekrar nesneye çevrilebilir.
+    Alt sınıflar `record_type` ve `COLUMNS` tanımlar.
+    """
+
+    record_type = None
+    COLUMNS: Dict[str, str] = {}
+
+    def __init__(self, records: Iterable = ()):
+        self.columns = {}
+        for name, kind in self.COLUMNS.items():
+            if kind in (_STR, _INTERNED):
+                self.columns[name] = []
+            else:
+                self.columns[name] = array('d' if kind == _DATE else kind)
+        self.extend(records)
+
+    @classmethod
+    def from_api(cls, items: Iterable[Dict]) -> 'RecordBatch':
+        """API sözlüklerinden (akış halinde de olabilir) toplu form oluşturur"""
+        return cls(cls.record_type.from_api(item) for item in items)
+
+    def append(self, record):
+        """Kaydı sütunlara ekler"""
+        for name, kind in self.COLUMNS.items():
+            value = getattr(record, name)
+            if kind == _DATE:
+                value = (value - _EPOCH).total_seconds() if value is not None else math.nan
+            elif kind == 'd' and value is None:
+                value = math.nan
+            elif kind == _INTERNED:
+                value = sys.intern(value)
+            self.columns[name].append(value)
+
+    def extend(self, records: Iterable):
+        for record in records:
+            self.append(record)
+
+    def column(self, name: str):
+        """Sütunun array'i veya listesi (değiştirilmemelidir)"""
+        return self.columns[name]
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, index: int):
+        values = {}
+        for name, kind in self.COLUMNS.items():
+            value = self.columns[name][index]
+            if kind == _DATE:
+                value = None if math.isnan(value) else _EPOCH + timedelta(seconds=value)
+            elif kind == 'd' and math.isnan(value):
+                value = None
+            elif kind == 'b':
+                value = bool(value)
+            values[name] = value
+        return self._make(values)
+
+    def _make(self, values: Dict):
+        return self.record_type(**values)
+
+    def __iter__(self) -> Iterator:
+        for index in range(len(self)):
+            yield self[index]
+
+    def nbytes(self) -> int:
+        """Sütunların yaklaşık bellek kullanımı (bayt)"""
+        total = 0
+        for name, kind in self.COLUMNS.items():
+            column = self.columns[name]
+            total += sys.getsizeof(column)
+            if kind == _STR:
+                total += sum(sys.getsizeof(value) for value in column)
+            elif kind == _INTERNED:
+                total += sum(sys.getsizeof(value) for value in set(column))
+        return total
+
+
+class ProductBatch(RecordBatch):
+    """Ürünlerin sütunlu formu"""
+
+    record_type = Product
+    COLUMNS = {
+        'id_product': 'q', 'name': _STR, 'reference': _STR, 'ean13': _STR,
+        'price': 'd', 'wholesale_price': 'd', 'price_with_tax': 'd',
+        'stock_quantity': 'q', 'active': 'b', 'id_category_default': 'q',
+        'category_name': _INTERNED, 'description_short': _STR, 'description': _STR,
+        'date_add': _DATE, 'date_upd': _DATE,
+    }
+
+
+class OrderBatch(RecordBatch):
+    """Siparişlerin sütunlu formu
+
+    Satırlar tutulmaz; gerekiyorsa `OrderLineBatch.extend(order.lines)` ile
+    ayrı bir toplu formda, id_order sütunuyla bağlı olarak saklanır.
+    """
+
+    record_type = Order
+    COLUMNS = {
+        'id_order': 'q', 'reference': _STR, 'id_customer': 'q', 'customer_name': _STR,
+        'customer_email': _STR, 'current_state': 'q', 'status_name': _INTERNED,
+        'payment': _INTERNED, 'total_paid': 'd', 'total_paid_tax_incl': 'd',
+        'total_paid_tax_excl': 'd', 'total_products': 'd', 'total_shipping': 'd',
+        'date_add': _DATE, 'date_upd': _DATE,
+    }
+
+    def _make(self, values: Dict) -> Order:
+        return Order(lines=[], **values)
+
+
+class OrderLineBatch(RecordBatch):
+    """Sipariş satırlarının sütunlu formu (id_order sütunuyla siparişe bağlanır)"""
+
+    record_type = OrderLine
+    COLUMNS = {
+        'id_order_detail': 'q', 'id_order': 'q', 'product_id': 'q',
+        'product_name': _STR, 'product_reference': _STR, 'product_ean13': _STR,
+        'product_quantity': 'q', 'unit_price_tax_incl': 'd', 'unit_price_tax_excl': 'd',
+        'total_price_tax_incl': 'd', 'total_price_tax_excl': 'd',
+    }
@@ -0,0 +1,370 @@
+"""
+PrestaShop Komut Satırı Aracı (prestashop-cli)
+Arayüz gerektirmeyen toplu işler: CSV'den ürün içe aktarma, toplu sipariş
+durumu değişikliği, dışa aktarma ve yerel ayna senkronizasyonu. Cron gibi
+zamanlanmış işlerden çalıştırılabilir; hata olursa 1 koduyla çıkar.
+
+Kullanım:
+    python -m prestashop_cli import-products urunler.csv --batch-size 200 --workers 2
+    python -m prestashop_cli order-status --status 4 --ids 101,102,103
+    python -m prestashop_cli order-status --status 4 --from-status 3 --workers 8 --rate 20
+    python -m prestashop_cli export orders siparisler.parquet --since "2024-01-01 00:00:00"
+    python -m prestashop_cli sync --db mirror.db --reconcile
+"""
+
+import argparse
+import csv
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from api_client import PrestaShopAPIClient
+from exporter import export_orders, export_products
+from local_mirror import LocalMirror
+
+# Toplu güncelleme uç noktasının kabul ettiği alanlar
+BULK_FIELDS = {'price': float, 'wholesale_price': float, 'active': int,
+               'reference': str, 'ean13': str, 'quantity': int}
+
+# Sadece tekil güncelleme/oluşturma ile gönderilebilen alanlar
+DETAIL_FIELDS = {'name': str, 'description': str, 'description_short': str,
+                 'id_category_default': int}
+
+
+class Progress:
+    """stderr'e ilerleme ve verim yazar (saniyede en fazla iki kez)"""
+
+    def __init__(self, label: str, total: Optional[int] = None, quiet: bool = False):
+        self.label = label
+        self.total = total
+        self.quiet = quiet
+        self.done = 0
+        self.failed = 0
+        self.started = time.perf_counter()
+        self._printed = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, done: int = 1, failed: int = 0):
+        """İşlenen kayıt sayısını (başarısızlar dahil) ekler, thread-safe'tir"""
+        with self._lock:
+            self.done += done
+            self.failed += failed
+            now = time.perf_counter()
+            if now - self._printed >= 0.5:
+                self._printed = now
+                self._print('\r')
+
+    def finish(self) -> float:
+        """Son satırı yazar, geçen süreyi döndürür"""
+        self._print('\r', end='\n')
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.done / elapsed if elapsed else 0.0
+
+    def _print(self, prefix: str, end: str = ''):
+        if self.quiet:
+            return
+        count = f"{self.done}/{self.total}" if self.total is not None else str(self.done)
+        failed = f", {self.failed} hata" if self.failed else ''
+        print(f"{prefix}{self.label}: {count} ({self.rate:.0f}/sn{failed})",
+              end=end, file=sys.stderr, flush=True)
+
+
+def run_bounded(fn: Callable, items: Iterable, workers: int) -> Iterator[Tuple]:
+    """fn'i `workers` thread ile uygular, (girdi, sonuç veya hata) çiftlerini verir
+
+    Girdi tembel okunur; en fazla 2 * workers iş bekler. Hatalar fırlatılmaz,
+    sonuç yerine Exception nesnesi döner.
+    """
+    def safe(item):
+        try:
+            return fn(item)
+        except Exception as e:
+            return e
+
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque((item, pool.submit(safe, item))
+                        for item in islice(iterator, workers * 2))
+        while pending:
+            item, future = pending.popleft()
+            for nxt in islice(iterator, 1):
+                pending.append((nxt, pool.submit(safe, nxt)))
+            yield item, future.result()
+
+
+def report_failures(failures: List[str], limit: int = 20):
+    for line in failures[:limit]:
+        print(f"  ✗ {line}", file=sys.stderr)
+    if len(failures) > limit:
+        print(f"  ... ve {len(failures) - limit} hata daha", file=sys.stderr)
+
+
+# ============= KOMUTLAR =============
+
+def _convert(row: Dict[str, str], spec: Dict[str, Callable]) -> Dict:
+    """CSV satırındaki dolu alanları API tiplerine çevirir"""
+    values = {}
+    for field, cast in spec.items():
+        value = (row.get(field) or '').strip()
+        if value:
+            values[field] = cast(float(value)) if cast is int else cast(value)
+    return values
+
+
+def cmd_import_products(api: PrestaShopAPIClient, args) -> int:
+    """CSV'den ürün içe aktarır
+
+    id_product dolu satırlar günceller: fiyat/stok/durum/referans/EAN alanları
+    toplu güncelleme ile `batch-size`'lık parçalar halinde, ad ve açıklamalar
+    tekil güncelleme ile gönderilir. id_product boş satırlar yeni ürün oluşturur.
+    """
+    progress = Progress("İçe aktarma", quiet=args.quiet)
+    failures = []
+
+    def jobs(reader) -> Iterator[Tuple[str, object]]:
+        bulk = []
+        for line, row in enumerate(reader, start=2):
+            try:
+                product_id = int(row['id_product']) if (row.get('id_product') or '').strip() else None
+                bulk_fields = _convert(row, BULK_FIELDS)
+                detail_fields = _convert(row, DETAIL_FIELDS)
+            except ValueError as e:
+                failures.append(f"satır {line}: geçersiz değer ({e})")
+                progress.add(failed=1)
+                continue
+
+            if product_id is None:
+                yield 'create', (line, dict(detail_fields, **bulk_fields))
+                continue
+            if detail_fields:
+                yield 'update', (line, product_id, detail_fields)
+            if bulk_fields:
+                bulk.append((product_id, bulk_fields))
+                if len(bulk) >= args.batch_size:
+                    yield 'bulk', bulk
+                    bulk = []
+            elif not detail_fields:
+                progress.add()  # güncellenecek alan yok
+        if bulk:
+            yield 'bulk', bulk
+
+    def run(job):
+        kind, payload = job
+        if kind == 'bulk':
+            return api.update_products_bulk(payload, chunk_size=args.batch_size)
+        if kind == 'update':
+            return api.update_product(payload[1], payload[2])
+        line, data = payload
+        if not data.get('name') or 'price' not in data:
+            raise ValueError("yeni ürün için name ve price zorunlu")
+        return api.create_product(data)
+
+    with open(args.file, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f, delimiter=args.delimiter)
+        if 'id_product' not in (reader.fieldnames or []) and 'name' not in (reader.fieldnames or []):
+            print("CSV'de id_product veya name sütunu olmalı", file=sys.stderr)
+            return 2
+
+        for (kind, payload), result in run_bounded(run, jobs(reader), args.workers):
+            if kind == 'bulk':
+                if isinstance(result, Exception):
+                    results = [{'id_product': pid, 'success': False, 'message': str(result)}
+                               for pid, _ in payload]
+                else:
+                    results = result
+                bad = [r for r in results if not r['success']]
+                failures.extend(f"ürün {r['id_product']}: {r.get('message', 'hata')}" for r in bad)
+                progress.add(len(results), len(bad))
+            elif isinstance(result, Exception):
+                failures.append(f"satır {payload[0]}: {result}")
+                progress.add(failed=1)
+            else:
+                progress.add()
+
+    elapsed = progress.finish()
+    print(f"✓ {progress.done - progress.failed} ürün işlendi, {progress.failed} hata, "
+          f"{elapsed:.1f} sn")
+    report_failures(failures)
+    return 1 if failures else 0
+
+
+def _read_ids(args, api: PrestaShopAPIClient) -> Tuple[Iterable[int], Optional[int]]:
+    """Sipariş ID'lerini --ids, --file veya --from-status'tan okur"""
+    if args.ids:
+        ids = [int(i) for i in args.ids.split(',') if i.strip()]
+        return ids, len(ids)
+    if args.file:
+        with open(args.file, encoding='utf-8-sig') as f:
+            ids = [int(line.split(',')[0]) for line in f
+                   if line.strip() and line.split(',')[0].strip().isdigit()]
+        return ids, len(ids)
+    orders = api.iter_all_orders(cursor=True, stream=True, status=args.from_status,
+                                 fields=['id_order'])
+    return (int(order['id_order']) for order in orders), None
+
+
+def cmd_order_status(api: PrestaShopAPIClient, args) -> int:
+    """Siparişlerin durumunu toplu uç nokta ile `batch-size`'lık parçalar halinde değiştirir"""
+    ids, total = _read_ids(args, api)
+    progress = Progress("Sipariş durumu", total=total, quiet=args.quiet)
+    failures = []
+
+    if args.from_status is not None:
+        # Durumu değişen siparişler taranan listeden düşmesin diye önce ID'ler toplanır
+        ids = list(ids)
+        progress.total = len(ids)
+
+    unchanged = []
+
+    def done(results):
+        # Sonucu bilinmeyenler (zaman aşımı) tekrar gönderilmez, hata olarak listelenir
+        bad = [r for r in results if not r['success']]
+        failures.extend(f"sipariş {r['id_order']}: {r.get('message', 'hata')}" for r in bad)
+        unchanged.extend(r['id_order'] for r in results if r.get('unchanged'))
+        progress.add(len(results), len(bad))
+
+    api.update_orders_status_bulk(ids, args.status, chunk_size=args.batch_size,
+                                  workers=args.workers, progress=done)
+
+    elapsed = progress.finish()
+    updated = progress.done - progress.failed - len(unchanged)
+    print(f"✓ {updated} sipariş güncellendi, {len(unchanged)} zaten bu durumda, "
+          f"{progress.failed} hata, {elapsed:.1f} sn")
+    report_failures(failures)
+    return 1 if failures else 0
+
+
+def cmd_export(api: PrestaShopAPIClient, args) -> int:
+    """Ürünleri veya siparişleri dosyaya aktarır"""
+    progress = Progress("Dışa aktarma", quiet=args.quiet)
+
+    def update(rows):
+        progress.add(rows - progress.done)
+
+    if args.resource == 'products':
+        stats = export_products(api, args.path, fmt=args.format, chunk_size=args.batch_size,
+                                workers=args.workers, since=args.since, progress=update)
+    else:
+        stats = export_orders(api, args.path, fmt=args.format, lines=not args.no_lines,
+                              chunk_size=args.batch_size, workers=args.workers,
+                              since=args.since, progress=update)
+
+    progress.finish()
+    lines = f", {stats['lines']} satır" if stats.get('lines') else ''
+    print(f"✓ {stats['rows']} kayıt{lines}, {stats['seconds']:.1f} sn "
+          f"({stats['rows_per_second']:.0f} kayıt/sn): {', '.join(stats['files'])}")
+    return 0
+
+
+def cmd_sync(api: PrestaShopAPIClient, args) -> int:
+    """Yerel SQLite aynasını senkronize eder"""
+    started = time.perf_counter()
+    mirror = LocalMirror(api, args.db)
+    try:
+        stats = mirror.sync(args.resources, reconcile=args.reconcile)
+    finally:
+        mirror.close()
+
+    elapsed = time.perf_counter() - started
+    for resource, counts in stats.items():
+        print(f"✓ {resource}: {counts['upserted']} güncellendi, {counts['deleted']} silindi")
+    total = sum(counts['upserted'] for counts in stats.values())
+    print(f"  {elapsed:.1f} sn ({total / elapsed if elapsed else 0:.0f} kayıt/sn)")
+    return 0
+
+
+# ============= GİRİŞ NOKTASI =============
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='prestashop-cli',
+                                     description='PrestaShop API toplu işlemleri')
+    parser.add_argument('--env', default='config.env', help='Yapılandırma dosyası')
+    parser.add_argument('--url', help='API URL (varsayılan: API_URL)')
+    parser.add_argument('--key', help='API anahtarı (varsayılan: API_KEY)')
+
+    # Her alt komutta ortak hız ayarları
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--rate', type=float, default=0,
+                        help='Saniyede en fazla istek (0 = sınırsız)')
+    common.add_argument('--quiet', action='store_true', help='İlerleme satırını yazma')
+
+    # Eşzamanlılık ve parça boyutu (sync sıralı cursor taraması yaptığı için almaz)
+    bulk = argparse.ArgumentParser(add_help=False, parents=[common])
+    bulk.add_argument('--workers', type=int, default=4, help='Paralel istek sayısı')
+    bulk.add_argument('--batch-size', type=int, default=200,
+                      help='İstek veya yazma başına kayıt sayısı')
+
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    sub = commands.add_parser('import-products', parents=[bulk],
+                              help="CSV'den ürün oluştur/güncelle")
+    sub.add_argument('file', help='CSV dosyası (başlık satırı API alan adları)')
+    sub.add_argument('--delimiter', default=',', help='CSV ayracı')
+    sub.set_defaults(handler=cmd_import_products)
+
+    sub = commands.add_parser('order-status', parents=[bulk],
+                              help='Siparişlerin durumunu toplu değiştir')
+    sub.add_argument('--status', type=int, required=True, help='Yeni durum ID')
+    source = sub.add_mutually_exclusive_group(required=True)
+    source.add_argument('--ids', help='Virgülle ayrılmış sipariş ID listesi')
+    source.add_argument('--file', help='Satır başına bir sipariş ID (veya ilk sütunu ID olan CSV)')
+    source.add_argument('--from-status', type=int, help='Bu durumdaki tüm siparişler')
+    sub.set_defaults(handler=cmd_order_status, batch_size=10)
+
+    sub = commands.add_parser('export', parents=[bulk], help='Dosyaya dışa aktar')
+    sub.add_argument('resource', choices=['products', 'orders'])
+    sub.add_argument('path', help='Hedef dosya (.csv, .ndjson, .parquet)')
+    sub.add_argument('--format', choices=['csv', 'ndjson', 'parquet'],
+                     help='Biçim (varsayılan: uzantıdan)')
+    sub.add_argument('--since', help="Sadece bu tarihten sonra güncellenenler ('YYYY-MM-DD HH:MM:SS')")
+    sub.add_argument('--no-lines', action='store_true', help='Sipariş satırlarını aktarma')
+    sub.set_defaults(handler=cmd_export, batch_size=1000)
+
+    sub = commands.add_parser('sync', parents=[common], help='Yerel aynayı senkronize et')
+    sub.add_argument('--db', default='mirror.db', help='SQLite dosyası')
+    sub.add_argument('--resources', nargs='+', default=['products', 'orders'],
+                     choices=['products', 'orders'])
+    sub.add_argument('--reconcile', action='store_true',
+                     help='Sunucuda silinen kayıtları da işaretle')
+    sub.set_defaults(handler=cmd_sync, workers=1)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    load_dotenv(args.env)
+    api_url = args.url or os.getenv('API_URL')
+    api_key = args.key or os.getenv('API_KEY')
+    if not api_url or not api_key:
+        print("API_URL ve API_KEY ayarlanmalı (config.env veya --url/--key)", file=sys.stderr)
+        return 2
+
+    workers = max(1, args.workers)
+    args.workers = workers
+    with PrestaShopAPIClient(api_url, api_key, pool_maxsize=max(10, workers),
+                             max_concurrency=max(10, workers),
+                             rate_limit=args.rate) as api:
+        try:
+            return args.handler(api, args)
+        except KeyboardInterrupt:
+            print("\nİptal edildi", file=sys.stderr)
+            return 130
+        except Exception as e:
+            print(f"\n✗ {e}", file=sys.stderr)
+            return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
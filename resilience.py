@@ -0,0 +1,161 @@
+"""
+Tekrar Deneme ve Devre Kesici
+Geçici API hatalarında üstel bekleme ile tekrar dener, sunucu çöktüğünde hızlı hata verir
+"""
+
+import math
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional, Tuple
+
+from api_errors import APIError, CircuitOpenError, RateLimitError
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After başlığını saniyeye çevirir (saniye veya HTTP tarihi olabilir)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Üstel bekleme ve jitter ile tekrar deneme kuralları
+
+    Sadece idempotent metodlar tekrar denenir. DELETE varsayılan olarak
+    dışarıdadır: yanıtı kaybolan bir silme tekrarlanınca 404 döner. Sipariş
+    PUT'ları da idempotent değildir (her durum değişikliği geçmiş kaydı ve
+    müşteri e-postası oluşturur); zaman aşımında sunucu işi bitirmiş olabilir.
+    Bunlar sadece sunucunun isteği işlemeden reddettiği 429'da tekrar denenir.
+    Bekleme süresi "full jitter" ile [0, backoff_factor * 2^deneme] aralığından
+    rastgele seçilir; böylece aynı anda hata alan istemciler sunucuya aynı
+    anda geri dönmez. Sunucu Retry-After gönderdiyse ona uyulur.
+    """
+
+    def __init__(self, max_retries: int = 3, backoff_factor: float = 0.5,
+                 max_backoff: float = 10, max_retry_after: float = 60,
+                 methods: Iterable[str] = ('GET', 'PUT'),
+                 non_idempotent: Iterable[Tuple[str, str]] = (('PUT', 'orders'),)):
+        """
+        Args:
+            max_retries: İlk denemeden sonraki maksimum tekrar sayısı
+            backoff_factor: İlk bekleme üst sınırı (saniye), her denemede ikiye katlanır
+            max_backoff: Bekleme üst sınırı (saniye)
+            max_retry_after: Retry-After için kabul edilen en uzun bekleme (saniye)
+            methods: Tekrar denenebilecek HTTP metodları
+            non_idempotent: methods içinde olsa da sadece 429'da tekrar
+                denenecek (metod, kaynak) çiftleri
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.methods = frozenset(methods)
+        self.non_idempotent = frozenset(non_idempotent)
+
+    def delay(self, method: str, attempt: int, error: APIError,
+              resource: Optional[str] = None) -> Optional[float]:
+        """
+        Tekrar denemeden önce beklenecek süre
+
+        Args:
+            method: HTTP metodu
+            attempt: Şu ana kadar yapılan tekrar sayısı (0 = ilk deneme başarısız)
+            error: Son denemenin hatası
+            resource: İsteğin kaynağı (products, orders)
+
+        Returns:
+            Saniye cinsinden bekleme, tekrar denenmeyecekse None
+        """
+        if attempt >= self.max_retries or method not in self.methods or not error.retryable:
+            return None
+        if (method, resource) in self.non_idempotent and not isinstance(error, RateLimitError):
+            return None
+        if error.retry_after is not None:
+            if error.retry_after > self.max_retry_after:
+                return None
+            return error.retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Sunucu art arda hata verdiğinde istekleri bir süre göndermeyen devre kesici
+
+    Kapalı: istekler normal gider, üst üste `failure_threshold` hata (zaman
+    aşımı, bağlantı hatası, 5xx) devreyi açar. Açık: `reset_timeout` saniye
+    boyunca istekler gönderilmeden CircuitOpenError ile reddedilir. Süre
+    dolunca yarı açık: tek bir deneme isteğine izin verilir; başarılıysa devre
+    kapanır, değilse tekrar açılır. Thread-safe'tir.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        """
+        Args:
+            failure_threshold: Devreyi açan ardışık hata sayısı
+            reset_timeout: Açık kalma süresi (saniye)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """İstek gönderilebilir mi kontrol eder, gönderilemezse CircuitOpenError"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(
+                        f"API geçici olarak devre dışı, {math.ceil(remaining)} sn sonra tekrar denenecek",
+                        retry_after=remaining
+                    )
+                self.state = self.HALF_OPEN
+                self._probing = False
+
+            # Yarı açık: sadece bir deneme isteği
+            if self._probing:
+                raise CircuitOpenError("API deneme isteğinin sonucu bekleniyor")
+            self._probing = True
+
+    def record_success(self):
+        """Başarılı (veya sunucunun canlı olduğunu gösteren) yanıtı kaydeder"""
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def release_probe(self):
+        """Sonucu alınamayan (ör. iptal edilen) isteğin deneme hakkını bırakır
+
+        Sunucunun durumu hakkında bilgi vermediği için hata sayılmaz; yarı
+        açık devrede sıradaki istek yeni deneme olarak gidebilir.
+        """
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self):
+        """Sunucu kaynaklı hatayı kaydeder"""
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
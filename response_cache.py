@@ -0,0 +1,125 @@
+"""
+API Yanıt Önbelleği
+Okuma isteklerinin yanıtlarını TTL ve LRU sınırıyla bellekte tutar
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """TTL süreli, boyutu sınırlı (LRU) yanıt önbelleği
+
+    Kayıt sayısı `maxsize` ile, verilirse yanıt gövdelerinin toplam boyutu
+    da `maxbytes` ile sınırlanır. Anahtarlar (resource, parametreler) ikilisidir. Thread-safe'tir; aynı
+    önbellek birden fazla thread'den kullanılabilir. Döndürülen yanıtlar
+    paylaşılır, çağıran tarafından değiştirilmemelidir.
+
+    Her resource için bir geçersiz kılma sayacı (generation) tutulur. Bir
+    yazmadan önce başlamış okuma, yanıtı yazmanın `invalidate()` çağrısından
+    sonra gelirse eski veriyi TTL boyunca sunmasın diye `set()`'e isteğin
+    başındaki sayaç verilir; sayaç değişmişse kayıt eklenmez.
+    """
+
+    def __init__(self, ttl: float = 30, maxsize: int = 256, maxbytes: Optional[int] = None):
+        """
+        Önbelleği başlatır
+
+        Args:
+            ttl: Bir kaydın geçerli kalacağı süre (saniye)
+            maxsize: Tutulacak maksimum kayıt sayısı
+            maxbytes: Kayıtların set() ile bildirilen toplam boyut sınırı
+                (bayt, None = sınırsız)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._entries: "OrderedDict[Tuple, Tuple[float, Dict, int]]" = OrderedDict()
+        self._bytes = 0
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0  # clear() sayacı, tüm resource'ları etkiler
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(resource: str, params: Optional[Dict] = None) -> Tuple:
+        """Resource ve parametrelerden önbellek anahtarı üretir"""
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return (resource, items)
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """Süresi dolmamış kaydı döndürür, yoksa None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value, size = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self._bytes -= size
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def generation(self, resource: str) -> Tuple[int, int]:
+        """Resource'un geçerli geçersiz kılma sayacı (istek başlamadan alınır)"""
+        with self._lock:
+            return self._epoch, self._generations.get(resource, 0)
+
+    def set(self, key: Tuple, value: Dict, generation: Optional[Tuple[int, int]] = None,
+            size: int = 0):
+        """
+        Kaydı ekler, sınır aşılırsa en eski kullanılanları atar
+
+        Args:
+            generation: İstek başladığındaki generation(); bu arada resource
+                geçersiz kılındıysa yanıt eskidir ve eklenmez
+            size: Kaydın boyutu (yanıt gövdesi, bayt); maxbytes'tan büyükse
+                kayıt eklenmez
+        """
+        with self._lock:
+            current = (self._epoch, self._generations.get(key[0], 0))
+            if generation is not None and generation != current:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            if self.maxbytes is not None and size > self.maxbytes:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value, size)
+            self._bytes += size
+            while len(self._entries) > self.maxsize or (
+                    self.maxbytes is not None and self._bytes > self.maxbytes):
+                self._bytes -= self._entries.popitem(last=False)[1][2]
+
+    def invalidate(self, resource: str, record_id=None):
+        """
+        Bir resource'a ait kayıtları geçersiz kılar
+
+        Args:
+            resource: Resource adı (products, orders)
+            record_id: Verilirse sadece bu kaydın detayı ve listeler silinir,
+                verilmezse resource'un tüm kayıtları silinir
+        """
+        with self._lock:
+            self._generations[resource] = self._generations.get(resource, 0) + 1
+            for key in list(self._entries):
+                key_resource, items = key
+                if key_resource != resource:
+                    continue
+                params = dict(items)
+                if record_id is None or 'id' not in params or params['id'] == str(record_id):
+                    self._bytes -= self._entries.pop(key)[2]
+
+    def clear(self):
+        """Tüm önbelleği temizler"""
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
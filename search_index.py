@@ -0,0 +1,184 @@
+"""
+Yerel Ürün Arama İndeksi
+Ürün anlık görüntüsünden oluşturulan, önek aramalı ters indeks
+"""
+
+import bisect
+import re
+import threading
+from typing import Dict, Iterable, List, Set, Union
+
+from models import Product
+
+# Türkçe büyük/küçük harf dönüşümü: str.lower() 'I' -> 'i' yapar, Türkçede 'ı' olmalı
+_TURKISH_LOWER = str.maketrans({'I': 'ı', 'İ': 'i'})
+
+# Aramada aksanlar yok sayılır: "canta" -> "Çanta", "isik" -> "Işık" bulunur
+_FOLD_ACCENTS = str.maketrans('çğıöşüâîû', 'cgiosuaiu')
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Önek aralığının üst sınırı: öneki bu karakterle uzatılmış metinden küçük
+# olan kelimeler önekle başlar
+_MAX_CHAR = chr(0x10FFFF)
+
+
+def fold(text: str) -> str:
+    """Metni Türkçe kurallarıyla küçültür ve aksanlarını kaldırır"""
+    return text.translate(_TURKISH_LOWER).lower().translate(_FOLD_ACCENTS)
+
+
+def tokenize(text: str) -> List[str]:
+    """Metni katlanmış kelimelere ayırır"""
+    return _TOKEN_RE.findall(fold(text or ''))
+
+
+class ProductSearchIndex:
+    """Ürün adı, referans ve EAN13 üzerinde önek aramalı ters indeks
+
+    Her kelime için ürün ID kümesi tutulur; kelimeler sıralı listede
+    saklandığı için önek araması ikili aramayla yapılır. Ürün ID'leri de
+    sıralı tutulur; boş aramada en yeni ürünler tüm katalog sıralanmadan
+    alınır. Ürünler kompakt
+    `Product` kayıtları olarak saklanır; API sözlükleri eklenirken çevrilir.
+    Thread-safe'tir.
+    """
+
+    FIELDS = ('name', 'reference', 'ean13')
+
+    def __init__(self):
+        self._postings: Dict[str, Set[int]] = {}
+        self._terms: List[str] = []
+        self._ids: List[int] = []
+        self._products: Dict[int, Product] = {}
+        self._tokens: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.ready = False
+
+    def build(self, products: Iterable[Union[Product, Dict]]):
+        """İndeksi verilen ürünlerle sıfırdan oluşturur"""
+        postings: Dict[str, Set[int]] = {}
+        stored: Dict[int, Product] = {}
+        tokens: Dict[int, Set[str]] = {}
+
+        for product in products:
+            product = _record(product)
+            product_id = product.id_product
+            product_tokens = self._product_tokens(product)
+            stored[product_id] = product
+            tokens[product_id] = product_tokens
+            for token in product_tokens:
+                postings.setdefault(token, set()).add(product_id)
+
+        with self._lock:
+            self._postings = postings
+            self._terms = sorted(postings)
+            self._ids = sorted(stored)
+            self._products = stored
+            self._tokens = tokens
+            self.ready = True
+
+    def add(self, product: Union[Product, Dict]):
+        """Ürünü ekler veya günceller"""
+        product = _record(product)
+        product_id = product.id_product
+        with self._lock:
+            self._remove(product_id)
+            product_tokens = self._product_tokens(product)
+            bisect.insort(self._ids, product_id)
+            self._products[product_id] = product
+            self._tokens[product_id] = product_tokens
+            for token in product_tokens:
+                if token not in self._postings:
+                    self._postings[token] = set()
+                    bisect.insort(self._terms, token)
+                self._postings[token].add(product_id)
+
+    def remove(self, product_id: int):
+        """Ürünü indeksten çıkarır"""
+        with self._lock:
+            self._remove(int(product_id))
+
+    def _remove(self, product_id: int):
+        if self._products.pop(product_id, None) is not None:
+            del self._ids[bisect.bisect_left(self._ids, product_id)]
+        for token in self._tokens.pop(product_id, ()):
+            ids = self._postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(product_id)
+            if not ids:
+                del self._postings[token]
+                del self._terms[bisect.bisect_left(self._terms, token)]
+
+    def _product_tokens(self, product: Product) -> Set[str]:
+        tokens = set()
+        for field in self.FIELDS:
+            tokens.update(tokenize(getattr(product, field)))
+        return tokens
+
+    def _term_range(self, prefix: str) -> range:
+        """Öneki verilen kelimeyle başlayan kelimelerin _terms içindeki aralığı"""
+        start = bisect.bisect_left(self._terms, prefix)
+        return range(start, bisect.bisect_left(self._terms, prefix + _MAX_CHAR, start))
+
+    def _prefix_ids(self, terms: range, cap: int = None) -> Set[int]:
+        """Aralıktaki kelimelerin ürünleri; cap verilirse o sayıya ulaşınca durur"""
+        ids = set()
+        for i in terms:
+            ids.update(self._postings[self._terms[i]])
+            if cap is not None and len(ids) >= cap:
+                break
+        return ids
+
+    def _matches(self, product_id: int, prefix: str) -> bool:
+        return any(token.startswith(prefix) for token in self._tokens[product_id])
+
+    def search(self, query: str, limit: int = None) -> List[Product]:
+        """
+        Tüm kelimeleri (önek olarak) içeren ürünleri döndürür
+
+        limit verildiğinde boş arama en yeni `limit` ürünü döndürür. Tek
+        kelimelik aramada ise eşleşmeler `limit`'e ulaşınca toplama durur;
+        çok kısa öneklerde (binlerce kelimeyle eşleşen) dönen ürünler en
+        yeniler olmayabilir, ama tüm katalog toplanıp sıralanmaz.
+
+        Args:
+            query: Arama metni; her kelime bir önek olarak eşleşir
+            limit: Maksimum sonuç sayısı (None = tümü)
+
+        Returns:
+            Eşleşen ürünler, en yeni ID önce
+        """
+        query_tokens = tokenize(query)
+        with self._lock:
+            if not query_tokens:
+                ordered = self._ids[::-1] if limit is None else self._ids[:-limit - 1:-1]
+                return [self._products[product_id] for product_id in ordered]
+
+            # En az kelimeyle eşleşen önekten başla; diğer önekler, aralıkları
+            # aday sayısından büyükse adayların kelimelerine tek tek bakılarak
+            # elenir (binlerce kelimenin ID kümesi birleştirilmez)
+            ranges = sorted(((self._term_range(token), token) for token in set(query_tokens)),
+                            key=lambda pair: len(pair[0]))
+            cap = limit if len(ranges) == 1 else None
+            ids = self._prefix_ids(ranges[0][0], cap)
+            for terms, token in ranges[1:]:
+                if not ids:
+                    break
+                if len(terms) > len(ids):
+                    ids = {product_id for product_id in ids if self._matches(product_id, token)}
+                else:
+                    ids &= self._prefix_ids(terms)
+
+            ordered = sorted(ids, reverse=True)
+            if limit is not None:
+                ordered = ordered[:limit]
+            return [self._products[product_id] for product_id in ordered]
+
+    def __len__(self):
+        return len(self._products)
+
+
+def _record(product: Union[Product, Dict]) -> Product:
+    return product if isinstance(product, Product) else Product.from_api(product)
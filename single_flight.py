@@ -0,0 +1,104 @@
+"""
+İstek Birleştirme (Single-flight)
+Aynı anda uçuşta olan özdeş çağrıları tek çağrıda birleştirir
+"""
+
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    """Uçuştaki tek bir çağrı ve sonucu"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Thread'ler arası single-flight
+
+    Aynı anahtarla `do()` çağrıldığında çağrı zaten uçuştaysa fonksiyon tekrar
+    çalıştırılmaz; bekleyen herkes ilk çağrının sonucunu (veya hatasını) alır.
+    Çağrı bittiğinde anahtar bırakılır, sonuç saklanmaz (önbellek değildir).
+    Paylaşılan sonuç çağıranlar tarafından değiştirilmemelidir.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], object]):
+        """fn'i anahtar başına aynı anda en fazla bir kez çalıştırır"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    def forget(self, match: Callable[[Hashable], bool]):
+        """
+        Eşleşen uçuştaki çağrıları bırakır
+
+        Yazma işleminden sonra gelen okumalar, yazmadan önce başlamış bir
+        çağrıya katılıp eski veriyi almasın diye kullanılır.
+        """
+        with self._lock:
+            for key in [key for key in self._calls if match(key)]:
+                del self._calls[key]
+
+    def __len__(self):
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """asyncio için single-flight (tek event loop içinde kullanılır)"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable]):
+        """Coroutine fonksiyonunu anahtar başına aynı anda en fazla bir kez çalıştırır"""
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(lambda f: self._release(key, f))
+
+        # Bekleyenlerden biri iptal edilirse ortak istek iptal olmasın
+        return await asyncio.shield(future)
+
+    def _release(self, key: Hashable, future: asyncio.Future):
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Kimse beklemiyorsa "exception was never retrieved" uyarısını engelle
+            future.exception()
+
+    def forget(self, match: Callable[[Hashable], bool]):
+        """Eşleşen uçuştaki çağrıları bırakır"""
+        for key in [key for key in self._calls if match(key)]:
+            del self._calls[key]
+
+    def __len__(self):
+        return len(self._calls)
@@ -0,0 +1,84 @@
+"""
+Toplu güncelleme zaman aşımı davranışı
+Ürün parçaları normal şekilde tekrar denenir; sipariş parçaları tekrar
+gönderilmez ve sonuçları bilinmiyor olarak raporlanır.
+
+Kullanım:
+    python -m unittest tests.test_bulk_update
+"""
+
+import time
+import unittest
+
+from api_client import PrestaShopAPIClient
+from benchmarks.fake_api_server import FakeAPIServer, FakeShop
+
+
+class SlowShop(FakeShop):
+    """İlk `slow_calls` toplu güncellemeyi client zaman aşımından uzun tutar"""
+
+    DELAY = 0.5
+
+    def __init__(self, slow_calls: int, **kwargs):
+        super().__init__(products=20, orders=20, **kwargs)
+        self.slow_calls = slow_calls
+        self.bulk_calls = 0
+
+    def _slow(self):
+        self.bulk_calls += 1
+        if self.bulk_calls <= self.slow_calls:
+            time.sleep(self.DELAY)
+
+    def bulk_update_products(self, items):
+        self._slow()
+        return super().bulk_update_products(items)
+
+    def bulk_update_orders(self, items):
+        self._slow()
+        return super().bulk_update_orders(items)
+
+
+class QuietServer(FakeAPIServer):
+    """Zaman aşımına uğrayan client bağlantıyı kapatır; yazma hatası basılmaz"""
+
+    def handle_error(self, request, client_address):
+        pass
+
+
+class BulkUpdateTimeoutTest(unittest.TestCase):
+
+    def client(self, shop: SlowShop) -> PrestaShopAPIClient:
+        server = QuietServer(shop).start()
+        self.addCleanup(server.stop)
+        return PrestaShopAPIClient(server.url, server.api_key, read_timeout=0.2,
+                                   max_retries=2, backoff_factor=0.01,
+                                   breaker_threshold=0)
+
+    def test_product_chunk_is_retried_after_timeout(self):
+        shop = SlowShop(slow_calls=1)
+        results = self.client(shop).update_products_bulk(
+            [(i, {'price': 5}) for i in range(1, 11)], chunk_size=10)
+
+        self.assertEqual(shop.bulk_calls, 2)
+        self.assertTrue(all(r['success'] for r in results))
+
+    def test_product_chunk_timeout_is_a_plain_error(self):
+        shop = SlowShop(slow_calls=10)
+        results = self.client(shop).update_products_bulk(
+            [(i, {'price': 5}) for i in range(1, 11)], chunk_size=10)
+
+        self.assertEqual(shop.bulk_calls, 3)
+        self.assertEqual(len(results), 10)
+        self.assertFalse(any(r['success'] or r.get('unknown') for r in results))
+
+    def test_order_chunk_is_not_resent_after_timeout(self):
+        shop = SlowShop(slow_calls=1)
+        results = self.client(shop).update_orders_status_bulk(
+            range(1, 11), new_status=4, chunk_size=10)
+
+        self.assertEqual(shop.bulk_calls, 1)
+        self.assertTrue(all(r.get('unknown') and not r['success'] for r in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
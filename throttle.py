@@ -0,0 +1,163 @@
+"""
+İstek Hızı ve Eşzamanlılık Kontrolü
+Token bucket hız sınırlayıcı ve AIMD ile kendini ayarlayan eşzamanlılık sınırı
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Token bucket hız sınırlayıcı
+
+    Saniyede `rate` token eklenir, kovada en fazla `burst` token birikir. Her
+    istek bir token harcar; token yoksa bir sonraki token'a kadar beklenir.
+    `reserve()` token'ı hemen ayırıp beklenecek süreyi döndürdüğü için
+    thread'ler arasında (time.sleep) ve asyncio'da (asyncio.sleep) aynı
+    şekilde kullanılabilir. Thread-safe'tir.
+    """
+
+    def __init__(self, rate: float, burst: int = 10):
+        """
+        Args:
+            rate: Saniyede izin verilen istek sayısı
+            burst: Boşta birikebilecek maksimum istek hakkı
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Bir token ayırır, kullanılmadan önce beklenecek süreyi döndürür"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # Eksiye düşen kova sıradaki isteklerin bekleme kuyruğudur
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self):
+        """Token alınana kadar bekler"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD ile kendini ayarlayan eşzamanlılık sınırı
+
+    Aynı anda uçuşta olabilecek istek sayısını sınırlar. Yanıtlar sağlıklı
+    geldikçe sınır yavaşça artar (sınır kadar yanıtta +1, toplamsal artış);
+    429/5xx, zaman aşımı veya son `window` yanıtın p95 gecikmesinin referans
+    p95'in `latency_tolerance` katını aşması durumunda sınır `backoff_ratio`
+    ile çarpılarak düşürülür (çarpımsal azalış). Referans, görülen en düşük
+    pencere p95'idir; farklı boyutlu istekler karışık gelse de pencere p95'i
+    kararlı kalır. Böylece eşzamanlılık sunucunun kaldırabildiği en yüksek
+    seviyede dengelenir. Thread-safe'tir.
+    """
+
+    def __init__(self, initial_limit: int = 4, min_limit: int = 1, max_limit: int = 32,
+                 backoff_ratio: float = 0.5, latency_tolerance: float = 2.0,
+                 window: int = 50):
+        """
+        Args:
+            initial_limit: Başlangıç sınırı
+            min_limit: Sınırın inebileceği en düşük değer
+            max_limit: Sınırın çıkabileceği en yüksek değer
+            backoff_ratio: Aşırı yükte sınırın çarpılacağı oran
+            latency_tolerance: Pencere p95'i / referans p95 oranı bunu aşarsa sınır düşer
+            window: Bir p95 hesabındaki yanıt sayısı
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.window = window
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._inflight = 0
+        self._samples = []
+        self._baseline_p95: Optional[float] = None
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Şu anki eşzamanlılık sınırı"""
+        return int(self._limit)
+
+    @property
+    def inflight(self) -> int:
+        """Şu an uçuşta olan istek sayısı"""
+        return self._inflight
+
+    def acquire(self) -> float:
+        """
+        Sınırın altına inilene kadar bekler, bir yer ayırır
+
+        Returns:
+            Başlangıç zamanı; release()'e verilir
+        """
+        with self._cond:
+            while self._inflight >= int(self._limit):
+                self._cond.wait()
+            self._inflight += 1
+            return time.monotonic()
+
+    def release(self, started: float, overloaded: bool = False, measured: bool = True):
+        """
+        Ayrılan yeri bırakır ve sonucu sınır hesabına katar
+
+        Args:
+            started: acquire()'ın döndürdüğü başlangıç zamanı
+            overloaded: Sunucu aşırı yük belirtisi verdi (429, 5xx, zaman aşımı)
+            measured: Süre sınır hesabına katılsın mı (istemci kaynaklı hatalarda False)
+        """
+        with self._cond:
+            saturated = self._inflight >= int(self._limit)
+            self._inflight -= 1
+            if overloaded:
+                # Son düşürmeden önce gönderilmiş isteklerin hataları eski sınıra
+                # aittir; tek bir aşırı yük anı sınırı art arda düşürmesin
+                if started >= self._last_decrease:
+                    self._decrease()
+            elif measured:
+                self._observe(time.monotonic() - started, saturated)
+            self._cond.notify_all()
+
+    @property
+    def baseline_p95(self) -> Optional[float]:
+        """Referans p95 gecikmesi (saniye)"""
+        return self._baseline_p95
+
+    def _observe(self, latency: float, saturated: bool):
+        self._samples.append(latency)
+        if len(self._samples) >= self.window:
+            ordered = sorted(self._samples)
+            p95 = ordered[int(0.95 * (len(ordered) - 1))]
+            self._samples.clear()
+
+            if self._baseline_p95 is not None and p95 > self._baseline_p95 * self.latency_tolerance:
+                # Pencerenin tamamı son düşürmeden sonra ölçüldüğü için tekrar düşürülebilir
+                self._decrease()
+                return
+
+            # Referans yavaşça yukarı kayar; ağ koşulları değişirse eski değere takılı kalmaz
+            if self._baseline_p95 is None or p95 < self._baseline_p95:
+                self._baseline_p95 = p95
+            else:
+                self._baseline_p95 *= 1.01
+
+        # Toplamsal artış: sınır kadar başarılı yanıtta +1. Sınıra hiç
+        # ulaşılmıyorsa artırmanın anlamı yok, sınır boşuna şişmesin
+        if saturated:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+    def _decrease(self):
+        self._last_decrease = time.monotonic()
+        self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+        # Yeni sınırla gelen yanıtlar eski gecikmelerle karışmasın
+        self._samples.clear()
@@ -0,0 +1,171 @@
+"""
+Arayüz Görev Dağıtıcısı
+Arka plan işlerini sınırlı bir havuzda çalıştırıp sonuçlarını Tk ana thread'ine taşır
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Sequence
+
+
+class Task:
+    """Dağıtıcıya gönderilmiş tek bir iş"""
+
+    def __init__(self, key=None):
+        self.key = key
+        self.future: Optional[Future] = None
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """İşi iptal eder: başlamadıysa hiç çalışmaz, bittiyse sonucu atılır"""
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+
+class UIDispatcher:
+    """Tk için thread-safe görev dağıtıcısı
+
+    Uzun işler sınırlı bir ThreadPoolExecutor'da çalışır ve worker thread'ler
+    Tk'ye hiç dokunmaz. Sonuçlar ve `call()` ile gönderilen fonksiyonlar bir
+    kuyruğa yazılır, ana thread'de `after()` ile boşaltılır. Her karede en
+    fazla `frame_budget` saniye iş yapılır, kalanı sonraki kareye kalır.
+
+    Aynı `key` ile yeni bir iş gönderildiğinde eskisi iptal edilir; böylece
+    örneğin yeni bir arama, henüz bitmemiş eski yüklemenin sonucunu ezemez.
+    """
+
+    def __init__(self, widget, max_workers: int = 4, interval: int = 16,
+                 frame_budget: float = 0.008):
+        """
+        Dağıtıcıyı başlatır
+
+        Args:
+            widget: after() döngüsünün bağlanacağı widget (genelde root)
+            max_workers: Aynı anda çalışabilecek arka plan işi
+            interval: Kuyruğun boşaltılma aralığı (milisaniye)
+            frame_budget: Bir karede callback'lere ayrılan süre (saniye)
+        """
+        self.widget = widget
+        self.interval = interval
+        self.frame_budget = frame_budget
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='ui-worker')
+        self._queue = queue.Queue()
+        self._tasks: Dict[object, Task] = {}
+        self._lock = threading.Lock()
+        self.closed = False
+
+        self.widget.after(self.interval, self._drain)
+
+    def submit(self, fn: Callable, *args, on_success: Callable = None,
+               on_error: Callable = None, key=None, **kwargs) -> Task:
+        """
+        Fonksiyonu arka planda çalıştırır, sonucu ana thread'e iletir
+
+        Args:
+            fn: Worker thread'de çalışacak fonksiyon (Tk'ye dokunmamalı)
+            on_success: Sonuçla ana thread'de çağrılır
+            on_error: Hatayla ana thread'de çağrılır (yoksa hata yok sayılır)
+            key: Verilirse aynı anahtarlı önceki iş iptal edilir
+
+        Returns:
+            İptal edilebilir Task
+        """
+        task = Task(key)
+        if key is not None:
+            with self._lock:
+                previous = self._tasks.get(key)
+                self._tasks[key] = task
+            if previous is not None:
+                previous.cancel()
+
+        def run():
+            if task.cancelled:
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                self._queue.put((task, on_error, (e,)))
+            else:
+                self._queue.put((task, on_success, (result,)))
+
+        task.future = self._executor.submit(run)
+        return task
+
+    def call(self, fn: Callable, *args):
+        """Fonksiyonu ana thread'de çağırır (herhangi bir thread'den güvenli)"""
+        self._queue.put((None, fn, args))
+
+    def cancel(self, key):
+        """Anahtarı verilen işi iptal eder"""
+        with self._lock:
+            task = self._tasks.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    def insert_rows(self, tree, rows: Iterable, row_values: Callable[[object], Sequence],
+                    chunk_size: int = 200) -> Task:
+        """
+        Satırları Treeview'a kare başına chunk_size satır olarak ekler
+
+        Büyük listeler tek seferde eklenince arayüz donar; parçalar arasında
+        Tk olayları işlenir. Dönen Task iptal edilirse ekleme durur.
+        """
+        task = Task()
+        rows = iter(rows)
+
+        def step():
+            if task.cancelled or self.closed or not tree.winfo_exists():
+                return
+            for _ in range(chunk_size):
+                row = next(rows, None)
+                if row is None:
+                    return
+                tree.insert('', 'end', values=row_values(row))
+            self.widget.after(self.interval, step)
+
+        step()
+        return task
+
+    def shutdown(self):
+        """Bekleyen işleri iptal eder, havuzu kapatır"""
+        self.closed = True
+        with self._lock:
+            tasks = list(self._tasks.values())
+            self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _drain(self):
+        """Kuyruktaki sonuçları ana thread'de işler"""
+        if self.closed:
+            return
+        try:
+            deadline = time.perf_counter() + self.frame_budget
+            while time.perf_counter() < deadline:
+                try:
+                    task, callback, args = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if task is not None:
+                    if task.key is not None:
+                        with self._lock:
+                            if self._tasks.get(task.key) is task:
+                                del self._tasks[task.key]
+                    if task.cancelled:
+                        continue
+
+                if callback is not None:
+                    callback(*args)
+        finally:
+            # Callback hata verse de döngü devam etmeli (hata Tk'ye raporlanır)
+            self.widget.after(self.interval, self._drain)
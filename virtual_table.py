@@ -0,0 +1,460 @@
+"""
+Sanal Tablo
+Sadece görünen satırları Tk'de tutan, sayfaları kaydırdıkça yükleyen Treeview
+"""
+
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ui_dispatch import Task, UIDispatcher
+
+# fetch_page(sayfa, sayfa_boyutu) -> (kayıtlar, toplam kayıt sayısı)
+FetchPage = Callable[[int, int], Tuple[List[Dict], int]]
+
+
+class VirtualTable(tk.Frame):
+    """Büyük listeler için sanal (lazy) Treeview
+
+    Treeview'da sadece görünen satır sayısı kadar öğe bulunur; kaydırıldığında
+    öğeler silinip yeniden eklenmez, değerleri güncellenir. Veriler ya bellekteki
+    bir listeden (`set_rows`) ya da sayfa sayfa arka planda çağrılan bir
+    kaynaktan (`set_source`) gelir. Yüklenen sayfalar sınırlı bir LRU önbellekte
+    tutulur. Gösterilen sayfa yüklendikten sonra komşu sayfalar önden çekilir,
+    böylece `next_page()` / `prev_page()` ile sayfa geçişleri önbellekten
+    anında yapılır. Sayfalar UIDispatcher havuzunda yüklenir; kaynak
+    değiştiğinde bitmemiş yüklemeler iptal edilir.
+
+    `tree` özelliği normal bir ttk.Treeview'dır; sütun ayarları ve bağlamlar
+    doğrudan onun üzerinden yapılır. Seçim satır sırasıyla (öğeyle değil)
+    tutulur; `selectmode='extended'` ile Ctrl/Shift tıklaması ve Shift+ok
+    tuşlarıyla ekran dışına taşan çoklu seçim yapılabilir.
+    """
+
+    PLACEHOLDER = '…'
+
+    def __init__(self, parent, columns: Sequence[str],
+                 row_values: Callable[[Dict], Sequence],
+                 page_size: int = 100, max_cached_pages: int = 20,
+                 on_load: Callable[[int], None] = None,
+                 on_error: Callable[[Exception], None] = None,
+                 on_page: Callable[[int, int], None] = None,
+                 prefetch_pages: int = 1,
+                 height: int = 20, dispatcher: UIDispatcher = None,
+                 selectmode: str = 'browse', **kwargs):
+        """
+        Tabloyu oluşturur
+
+        Args:
+            parent: Üst widget
+            columns: Sütun adları
+            row_values: Kaydı Treeview satır değerlerine çeviren fonksiyon
+            page_size: Kaynaktan tek seferde istenecek kayıt sayısı
+            max_cached_pages: Bellekte tutulacak maksimum sayfa
+            on_load: Her sayfa yüklendiğinde toplam kayıt sayısıyla çağrılır
+            on_error: Sayfa yüklenemezse hatayla çağrılır
+            on_page: Gösterilen sayfa veya sayfa sayısı değişince
+                (sayfa, sayfa sayısı) ile çağrılır
+            prefetch_pages: Gösterilen sayfanın iki yanında önden yüklenecek
+                sayfa sayısı (0 = kapalı)
+            height: Başlangıçta görünen satır sayısı
+            dispatcher: Sayfa yüklemelerinin çalışacağı dağıtıcı (yoksa tabloya
+                özel bir tane oluşturulur)
+            selectmode: 'browse' (tek satır) veya 'extended' (çoklu seçim)
+        """
+        super().__init__(parent, **kwargs)
+        self.columns = tuple(columns)
+        self.row_values = row_values
+        self.page_size = page_size
+        self.max_cached_pages = max_cached_pages
+        self.on_load = on_load
+        self.on_error = on_error
+        self.on_page = on_page
+        self.prefetch_pages = prefetch_pages
+
+        self.scrollbar = ttk.Scrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side='right', fill='y')
+
+        self.tree = ttk.Treeview(self, columns=self.columns, show='tree headings',
+                                 height=height, selectmode=selectmode)
+        self.tree.pack(fill='both', expand=True)
+
+        self.total = 0
+        self.offset = 0
+        self._visible = height
+        self._pool: List[str] = []
+        self._selected_index: Optional[int] = None
+        self._anchor: Optional[int] = None
+        # sıra -> kayıt; sayfası henüz yüklenmemiş seçili satırlar için None
+        self._selection: Dict[int, Optional[Dict]] = {}
+
+        self._rows: Optional[List[Dict]] = None
+        self._source: Optional[FetchPage] = None
+        self._pages: "OrderedDict[int, List[Dict]]" = OrderedDict()
+        self._loading: Dict[int, Task] = {}
+        self._render_pending = False
+        self._page_info: Optional[Tuple[int, int]] = None
+
+        self._owns_dispatcher = dispatcher is None
+        self.dispatcher = dispatcher or UIDispatcher(self)
+        self.bind('<Destroy>', self._on_destroy)
+
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll(3))
+        self.tree.bind('<Up>', lambda e: self._move_selection(-1))
+        self.tree.bind('<Down>', lambda e: self._move_selection(1))
+        self.tree.bind('<Prior>', lambda e: self._move_selection(-self._visible))
+        self.tree.bind('<Next>', lambda e: self._move_selection(self._visible))
+        self.tree.bind('<Control-Prior>', lambda e: self.prev_page() or 'break')
+        self.tree.bind('<Control-Next>', lambda e: self.next_page() or 'break')
+        if selectmode == 'extended':
+            self.tree.bind('<Button-1>', lambda e: self._on_click(e, 'single'))
+            self.tree.bind('<Control-Button-1>', lambda e: self._on_click(e, 'toggle'))
+            self.tree.bind('<Shift-Button-1>', lambda e: self._on_click(e, 'range'))
+            self.tree.bind('<Shift-Up>', lambda e: self._move_selection(-1, extend=True))
+            self.tree.bind('<Shift-Down>', lambda e: self._move_selection(1, extend=True))
+
+        self._resize_pool()
+
+    # ============= VERİ KAYNAĞI =============
+
+    def set_rows(self, rows: List[Dict]):
+        """Tabloyu bellekteki bir listeyle doldurur"""
+        self._reset()
+        self._rows = rows
+        self.total = len(rows)
+        self.render()
+
+    def set_source(self, fetch_page: FetchPage, start_index: int = 0):
+        """
+        Tabloyu sayfalı bir kaynağa bağlar
+
+        fetch_page arka plan thread'inde çağrılır, Tk'ye dokunmamalıdır.
+        """
+        self._reset()
+        self._source = fetch_page
+        self.offset = start_index
+        self._load_page(start_index // self.page_size + 1)
+        self.render()
+
+    def reload(self):
+        """Mevcut kaynağı önbelleği boşaltarak yeniden yükler"""
+        if self._source is not None:
+            self.set_source(self._source, self.offset)
+
+    def _reset(self):
+        # Eski kaynaktan bekleyen yüklemeler iptal edilir, geç yanıtlar atılır
+        for task in self._loading.values():
+            task.cancel()
+        self._rows = None
+        self._source = None
+        self._pages.clear()
+        self._loading.clear()
+        self._selected_index = None
+        self._anchor = None
+        self._selection = {}
+        self.total = 0
+        self.offset = 0
+
+    def row(self, index: int) -> Optional[Dict]:
+        """Sıradaki kaydı döndürür, yüklenmemişse yüklemeyi başlatıp None"""
+        if self._rows is not None:
+            return self._rows[index] if 0 <= index < len(self._rows) else None
+
+        page = index // self.page_size + 1
+        items = self._pages.get(page)
+        if items is None:
+            self._load_page(page)
+            return None
+
+        self._pages.move_to_end(page)
+        position = index % self.page_size
+        return items[position] if position < len(items) else None
+
+    def selected_row(self) -> Optional[Dict]:
+        """Seçili satırın kaydını döndürür"""
+        if self._selected_index is None:
+            return None
+        return self.row(self._selected_index)
+
+    def selected_rows(self) -> List[Dict]:
+        """Seçili kayıtları sırayla döndürür (sayfası henüz gelmemişler hariç)"""
+        return [self._selection[index] for index in sorted(self._selection)
+                if self._selection[index] is not None]
+
+    @property
+    def selection_count(self) -> int:
+        """Seçili satır sayısı (yüklenmemişler dahil)"""
+        return len(self._selection)
+
+    def replace_rows(self, records: Iterable[Dict], key: Callable[[Dict], object]) -> int:
+        """
+        Önbellekteki kayıtları aynı anahtarlı yenileriyle değiştirir
+
+        Kaynak baştan yüklenmeden sadece değişen satırlar yeniden çizilir.
+        Değiştirilen kayıt sayısını döndürür.
+        """
+        fresh = {key(record): record for record in records}
+        replaced = 0
+        lists = [self._rows] if self._rows is not None else self._pages.values()
+        for items in lists:
+            for i, item in enumerate(items):
+                record = fresh.get(key(item))
+                if record is not None:
+                    items[i] = record
+                    replaced += 1
+        for index, item in self._selection.items():
+            if item is not None and key(item) in fresh:
+                self._selection[index] = fresh[key(item)]
+        self.render()
+        return replaced
+
+    def _load_page(self, page: int):
+        if self._source is None or page in self._pages or page in self._loading:
+            return
+        if page > 1 and self.total and (page - 1) * self.page_size >= self.total:
+            return
+
+        self._loading[page] = self.dispatcher.submit(
+            self._source, page, self.page_size,
+            on_success=lambda result: self._page_loaded(page, result),
+            on_error=lambda error: self._page_failed(page, error),
+        )
+
+    def _page_loaded(self, page: int, result: Tuple[List[Dict], int]):
+        """Arka planda yüklenen sayfayı ana thread'de önbelleğe alır"""
+        items, total = result
+        self._loading.pop(page, None)
+        self._pages[page] = items
+        while len(self._pages) > self.max_cached_pages:
+            self._pages.popitem(last=False)
+
+        # Sayfası beklenen seçili satırların kayıtları doldurulur
+        start = (page - 1) * self.page_size
+        for index, record in self._selection.items():
+            if record is None and start <= index < start + len(items):
+                self._selection[index] = items[index - start]
+        self.total = total
+        if self.on_load:
+            self.on_load(total)
+
+        # Aynı karede gelen sayfalar tek çizimde gösterilir
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._deferred_render)
+
+    def _page_failed(self, page: int, error: Exception):
+        self._loading.pop(page, None)
+        if self.on_error:
+            self.on_error(error)
+
+    def _deferred_render(self):
+        self._render_pending = False
+        self.render()
+
+    # ============= ÇİZİM =============
+
+    def render(self):
+        """Görünen satırları mevcut öğelere yazar"""
+        self.offset = max(0, min(self.offset, self.total - self._visible))
+
+        for i, iid in enumerate(self._pool):
+            index = self.offset + i
+            if index >= self.total:
+                self.tree.detach(iid)
+                continue
+
+            record = self.row(index)
+            if record is None:
+                values = [self.PLACEHOLDER] * len(self.columns)
+            else:
+                values = self.row_values(record)
+            self.tree.item(iid, values=values)
+            self.tree.move(iid, '', i)
+
+        # Görünen alanın bir ekran öncesi ve sonrası önden yüklenir
+        if self._source is not None and self.total:
+            first = max(0, self.offset - self._visible)
+            last = min(self.total - 1, self.offset + 2 * self._visible)
+            for page in range(first // self.page_size + 1, last // self.page_size + 2):
+                self._load_page(page)
+
+            # Komşu sayfalar sadece gösterilen sayfa geldikten sonra istenir;
+            # hızlı kaydırmada atlanan sayfalar için boşuna istek gitmez
+            current = self.offset // self.page_size + 1
+            if current in self._pages:
+                for page in range(max(1, current - self.prefetch_pages),
+                                  current + self.prefetch_pages + 1):
+                    self._load_page(page)
+
+        self._sync_selection()
+        self._update_scrollbar()
+
+        page_info = (self.page, self.page_count)
+        if page_info != self._page_info:
+            self._page_info = page_info
+            if self.on_page:
+                self.on_page(*page_info)
+
+    def _resize_pool(self):
+        """Treeview öğe sayısını görünen satır sayısına eşitler"""
+        while len(self._pool) < self._visible:
+            self._pool.append(self.tree.insert('', 'end', values=()))
+        while len(self._pool) > self._visible:
+            self.tree.delete(self._pool.pop())
+
+    def _sync_selection(self):
+        wanted = [iid for i, iid in enumerate(self._pool)
+                  if self.offset + i in self._selection and self.offset + i < self.total]
+        if set(self.tree.selection()) == set(wanted):
+            return
+        if wanted:
+            self.tree.selection_set(wanted)
+        else:
+            self.tree.selection_remove(*self.tree.selection())
+
+    def _update_scrollbar(self):
+        if self.total <= 0:
+            self.scrollbar.set(0, 1)
+            return
+        first = self.offset / self.total
+        last = min(1.0, (self.offset + self._visible) / self.total)
+        self.scrollbar.set(first, last)
+
+    # ============= SAYFALAMA =============
+
+    @property
+    def page(self) -> int:
+        """Görünümün başındaki satırın sayfası (en alttayken son sayfa)"""
+        if self.offset + self._visible >= self.total:
+            return self.page_count
+        return self.offset // self.page_size + 1
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-self.total // self.page_size))
+
+    def go_to_page(self, page: int):
+        """Verilen sayfanın ilk satırını görünümün başına getirir"""
+        page = max(1, min(page, self.page_count))
+        self.scroll_to((page - 1) * self.page_size)
+
+    def next_page(self):
+        self.go_to_page(self.page + 1)
+
+    def prev_page(self):
+        self.go_to_page(self.page - 1)
+
+    # ============= OLAYLAR =============
+
+    def scroll(self, rows: int):
+        """Görünümü verilen satır sayısı kadar kaydırır"""
+        self.offset += rows
+        self.render()
+        return 'break'
+
+    def scroll_to(self, index: int):
+        """Verilen sıradaki kaydı görünümün başına getirir"""
+        self.offset = index
+        self.render()
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == 'moveto':
+            self.offset = int(float(value) * self.total)
+        elif action == 'scroll':
+            step = self._visible if unit == 'pages' else 1
+            self.offset += int(value) * step
+        self.render()
+
+    def _on_mousewheel(self, event):
+        # Windows'ta delta 120'nin katıdır, macOS'ta küçük değerler gelir
+        step = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self.scroll(-3 * step)
+
+    def _on_destroy(self, event):
+        if event.widget is not self:
+            return
+        for task in self._loading.values():
+            task.cancel()
+        self._loading.clear()
+        if self._owns_dispatcher:
+            self.dispatcher.shutdown()
+
+    def _on_resize(self, event):
+        rowheight = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        visible = max(1, (event.height - 25) // rowheight)
+        if visible != self._visible:
+            self._visible = visible
+            self._resize_pool()
+            self.render()
+
+    def _on_select(self, event):
+        # Kendi çizimimizden gelen olay seçimi değiştirmez; seçim dışarıdan
+        # (ör. sağ tıkta selection_set) değiştiyse ekran dışındakiler bırakılır
+        selection = set(self.tree.selection())
+        visible = {self.offset + i: iid for i, iid in enumerate(self._pool)
+                   if self.offset + i < self.total}
+        chosen = {index for index, iid in visible.items() if iid in selection}
+        if chosen == {index for index in visible if index in self._selection}:
+            return
+        self._selection = {index: self.row(index) for index in chosen}
+        if chosen:
+            self._selected_index = self._anchor = min(chosen)
+
+    def _on_click(self, event, mode: str):
+        """Çoklu seçim tıklamaları: tek, Ctrl ile ekle/çıkar, Shift ile aralık"""
+        iid = self.tree.identify_row(event.y)
+        if iid not in self._pool:
+            return None  # başlık vb. Treeview'a bırakılır
+        index = self.offset + self._pool.index(iid)
+        if index >= self.total:
+            return 'break'
+
+        if mode == 'toggle':
+            if self._selection.pop(index, False) is False:
+                self._selection[index] = self.row(index)
+            self._anchor = index
+        elif mode == 'range' and self._anchor is not None:
+            self._select_range(self._anchor, index)
+        else:
+            self._selection = {index: self.row(index)}
+            self._anchor = index
+
+        self._selected_index = index
+        self.tree.focus_set()
+        self.tree.focus(iid)
+        self._sync_selection()
+        return 'break'
+
+    def _select_range(self, start: int, end: int):
+        """İki sıra arasını seçer; yüklenmemiş sayfalar arka planda istenir"""
+        if start > end:
+            start, end = end, start
+        self._selection = {index: self.row(index) for index in range(start, end + 1)}
+
+    def _move_selection(self, delta: int, extend: bool = False):
+        """Klavyeyle seçimi taşır (extend ile aralığı genişletir), gerekirse kaydırır"""
+        if not self.total:
+            return 'break'
+        if self._selected_index is None:
+            index = self.offset
+        else:
+            index = max(0, min(self.total - 1, self._selected_index + delta))
+
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + self._visible:
+            self.offset = index - self._visible + 1
+
+        if extend and self._anchor is not None:
+            self._select_range(self._anchor, index)
+        else:
+            self._selection = {index: self.row(index)}
+            self._anchor = index
+        self._selected_index = index
+        self.render()
+        return 'break'